@@ -1,5 +1,6 @@
 import abc
 import os
+import time
 
 # multiprocessing.RLock is a function returning this type
 from multiprocessing.synchronize import RLock
@@ -9,6 +10,7 @@ from typing import Dict, Tuple, Hashable, Optional, ContextManager, List, Union
 import agate
 
 import dbt.exceptions
+from dbt.clients.agate_helper import ColumnarResult
 from dbt.contracts.connection import (
     Connection,
     Identifier,
@@ -25,6 +27,9 @@ from dbt.events.functions import fire_event
 from dbt.events.types import (
     NewConnection,
     ConnectionReused,
+    ConnectionPoolHit,
+    ConnectionPoolMiss,
+    ConnectionPoolStats,
     ConnectionLeftOpen,
     ConnectionLeftOpen2,
     ConnectionClosed,
@@ -35,6 +40,58 @@ from dbt.events.types import (
 from dbt import flags
 
 
+class ConnectionPool:
+    """The open connections a connection manager released, kept for the next
+    connection it opens, on any thread. A thread gets back the connection it
+    released last if that is still in the pool, and otherwise the one released
+    most recently. Connections idle for longer than max_idle seconds are
+    handed back to be closed instead.
+
+    Nothing about ConnectionPool is thread-safe, the connection manager holds
+    its lock around every call.
+    """
+
+    def __init__(self, max_size: int, max_idle: float) -> None:
+        self.max_size = max_size
+        self.max_idle = max_idle
+        # (thread identifier, connection, released at), least recently released first
+        self.idle: List[Tuple[Hashable, Connection, float]] = []
+        self.hits = 0
+        self.misses = 0
+        self.discarded = 0
+
+    def expire(self) -> List[Connection]:
+        """Remove and return the connections that were idle for too long."""
+        cutoff = time.monotonic() - self.max_idle
+        expired = [conn for _, conn, released_at in self.idle if released_at < cutoff]
+        if expired:
+            self.idle = [entry for entry in self.idle if entry[2] >= cutoff]
+            self.discarded += len(expired)
+        return expired
+
+    def put(self, key: Hashable, connection: Connection) -> bool:
+        """Add a connection released by the given thread, if there is room."""
+        if len(self.idle) >= self.max_size:
+            return False
+        self.idle.append((key, connection, time.monotonic()))
+        return True
+
+    def take(self, key: Hashable) -> Optional[Connection]:
+        if not self.idle:
+            return None
+        index = len(self.idle) - 1
+        for i in range(index, -1, -1):
+            if self.idle[i][0] == key:
+                index = i
+                break
+        return self.idle.pop(index)[1]
+
+    def drain(self) -> List[Connection]:
+        connections = [conn for _, conn, _ in self.idle]
+        self.idle.clear()
+        return connections
+
+
 class BaseConnectionManager(metaclass=abc.ABCMeta):
     """Methods to implement:
         - exception_handler
@@ -45,6 +102,10 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
         - clear_transaction
         - execute
 
+    Methods to override to pool connections (see `--connection-pool-size`):
+        - _reset_handle
+        - _is_handle_usable
+
     You must also set the 'TYPE' class attribute with a class-unique constant
     string.
     """
@@ -56,6 +117,11 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
         self.thread_connections: Dict[Hashable, Connection] = {}
         self.lock: RLock = flags.MP_CONTEXT.RLock()
         self.query_header: Optional[MacroQueryStringSetter] = None
+        self.pool: Optional[ConnectionPool] = None
+        if flags.CONNECTION_POOL_SIZE:
+            self.pool = ConnectionPool(
+                max_size=flags.CONNECTION_POOL_SIZE, max_idle=flags.CONNECTION_POOL_MAX_IDLE
+            )
 
     def set_query_header(self, manifest: Manifest) -> None:
         self.query_header = MacroQueryStringSetter(self.profile, manifest)
@@ -153,6 +219,8 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
 
         if conn.state == "open":
             fire_event(ConnectionReused(conn_name=conn_name))
+        elif self.pool is not None:
+            conn.handle = LazyHandle(self._open_from_pool)
         else:
             conn.handle = LazyHandle(self.open)
 
@@ -178,6 +246,76 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
         """
         raise dbt.exceptions.NotImplementedException("`open` is not implemented for this adapter!")
 
+    def _open_from_pool(self, connection: Connection) -> Connection:
+        """Give the connection the handle of a pooled connection that passes
+        the health check, or open it if there is none.
+        """
+        pool = self.pool
+        assert pool is not None
+        key = self.get_thread_identifier()
+        while True:
+            with self.lock:
+                expired = pool.expire()
+                pooled = pool.take(key)
+            for stale in expired:
+                self._close_pooled(stale)
+            if pooled is None:
+                break
+            if self._is_handle_usable(pooled):
+                with self.lock:
+                    pool.hits += 1
+                fire_event(ConnectionPoolHit(conn_name=connection.name))
+                connection.handle = pooled.handle
+                connection.state = ConnectionState.OPEN
+                return connection
+            with self.lock:
+                pool.discarded += 1
+            self._close_pooled(pooled)
+
+        with self.lock:
+            pool.misses += 1
+        fire_event(ConnectionPoolMiss(conn_name=connection.name))
+        return self.open(connection)
+
+    def _release_to_pool(self, conn: Connection) -> bool:
+        """Roll back and reset the connection, and move its handle to the pool.
+        Return False if it should be closed instead.
+        """
+        pool = self.pool
+        assert pool is not None
+        if conn.state != ConnectionState.OPEN:
+            return False
+        if conn.transaction_open:
+            self._rollback(conn)
+        try:
+            self._reset_handle(conn)
+        except Exception:
+            return False
+
+        pooled = Connection(
+            type=conn.type,
+            name=conn.name,
+            state=ConnectionState.OPEN,
+            handle=conn.handle,
+            credentials=conn.credentials,
+        )
+        with self.lock:
+            expired = pool.expire()
+            added = pool.put(self.get_thread_identifier(), pooled)
+        for stale in expired:
+            self._close_pooled(stale)
+        if added:
+            conn.handle = None
+            conn.state = ConnectionState.CLOSED
+        return added
+
+    def _close_pooled(self, connection: Connection) -> None:
+        try:
+            self.close(connection)
+        except Exception:
+            # it was not in use, and there is nothing left to clean up
+            pass
+
     def release(self) -> None:
         with self.lock:
             conn = self.get_if_exists()
@@ -185,7 +323,9 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
                 return
 
         try:
-            # always close the connection. close() calls _rollback() if there
+            if self.pool is not None and self._release_to_pool(conn):
+                return
+            # otherwise close the connection. close() calls _rollback() if there
             # is an open transaction
             self.close(conn)
         except Exception:
@@ -205,6 +345,17 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
             # garbage collect these connections
             self.thread_connections.clear()
 
+            if self.pool is not None:
+                for pooled in self.pool.drain():
+                    self._close_pooled(pooled)
+                fire_event(
+                    ConnectionPoolStats(
+                        hits=self.pool.hits,
+                        misses=self.pool.misses,
+                        discarded=self.pool.discarded,
+                    )
+                )
+
     @abc.abstractmethod
     def begin(self) -> None:
         """Begin a transaction. (passable)"""
@@ -227,6 +378,24 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
         except Exception:
             fire_event(RollbackFailed(conn_name=connection.name))
 
+    @classmethod
+    def _reset_handle(cls, connection: Connection) -> None:
+        """Reset the session state of a connection before it goes back to the
+        pool, after any open transaction was rolled back: its settings,
+        temporary objects, locks and so on. Raise to close the connection
+        instead. Connections of adapters that don't implement this are never
+        pooled, as whatever the session was left with would carry over to the
+        next node.
+        """
+        raise dbt.exceptions.NotImplementedException(
+            "`_reset_handle` is not implemented for this adapter!"
+        )
+
+    @classmethod
+    def _is_handle_usable(cls, connection: Connection) -> bool:
+        """Check the health of a pooled connection before it is reused."""
+        return not getattr(connection.handle, "closed", False)
+
     @classmethod
     def _close_handle(cls, connection: Connection) -> None:
         """Perform the actual close operation."""
@@ -280,16 +449,19 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
 
     @abc.abstractmethod
     def execute(
-        self, sql: str, auto_begin: bool = False, fetch: bool = False
-    ) -> Tuple[Union[str, AdapterResponse], agate.Table]:
+        self, sql: str, auto_begin: bool = False, fetch: bool = False, stream: bool = False
+    ) -> Tuple[Union[str, AdapterResponse], Union[agate.Table, ColumnarResult]]:
         """Execute the given SQL.
 
         :param str sql: The sql to execute.
         :param bool auto_begin: If set, and dbt is not currently inside a
             transaction, automatically begin one.
         :param bool fetch: If set, fetch results.
+        :param bool stream: If set with fetch, fetch the results in chunks into
+            a ColumnarResult. Implementations that don't support this may
+            leave the argument out, it is only passed when set.
         :return: A tuple of the status and the results (empty if fetch=False).
-        :rtype: Tuple[Union[str, AdapterResponse], agate.Table]
+        :rtype: Tuple[Union[str, AdapterResponse], Union[agate.Table, ColumnarResult]]
         """
         raise dbt.exceptions.NotImplementedException(
             "`execute` is not implemented for this adapter!"
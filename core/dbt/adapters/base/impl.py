@@ -1,4 +1,10 @@
 import abc
+import functools
+import hashlib
+import inspect
+import json
+import os
+import time
 from concurrent.futures import as_completed, Future
 from contextlib import contextmanager
 from datetime import datetime
@@ -35,15 +41,29 @@ from dbt.adapters.protocol import (
     AdapterConfig,
     ConnectionManagerProtocol,
 )
-from dbt.clients.agate_helper import empty_table, merge_tables, table_from_rows
+from dbt import flags
+from dbt.clients.agate_helper import (
+    ColumnarResult,
+    TEXT_TYPE,
+    empty_table,
+    merge_tables,
+    table_from_rows,
+)
+from dbt.clients.system import load_file_contents, remove_file, write_json
 from dbt.clients.jinja import MacroGenerator
 from dbt.contracts.graph.compiled import CompileResultNode, CompiledSeedNode
 from dbt.contracts.graph.manifest import Manifest, MacroManifest
 from dbt.contracts.graph.parsed import ParsedSeedNode
 from dbt.exceptions import warn_or_error
 from dbt.events.functions import fire_event
-from dbt.events.types import CacheMiss, ListRelations
-from dbt.utils import filter_null_values, executor
+from dbt.events.types import (
+    CacheMiss,
+    ListRelations,
+    SavedRelationsCacheInvalid,
+    SavedRelationsCacheUsed,
+)
+from dbt.utils import filter_null_values, executor, lowercase
+from dbt.version import __version__ as dbt_version
 
 from dbt.adapters.base.connections import Connection, AdapterResponse
 from dbt.adapters.base.meta import AdapterMeta, available
@@ -62,6 +82,7 @@ SeedModel = Union[ParsedSeedNode, CompiledSeedNode]
 
 GET_CATALOG_MACRO_NAME = "get_catalog"
 FRESHNESS_MACRO_NAME = "collect_freshness"
+RELATIONS_CACHE_FILE_NAME = "relations_cache.json"
 
 
 def _expect_row_value(key: str, row: agate.Row):
@@ -114,6 +135,12 @@ def _utc(dt: Optional[datetime], source: BaseRelation, field_name: str) -> datet
         return dt.replace(tzinfo=pytz.UTC)
 
 
+@functools.lru_cache(maxsize=None)
+def _accepts_stream(connection_manager: Type[Any]) -> bool:
+    # connection managers that override execute without `stream` don't stream
+    return "stream" in inspect.signature(connection_manager.execute).parameters
+
+
 def _relation_name(rel: Optional[BaseRelation]) -> str:
     if rel is None:
         return "null relation"
@@ -168,7 +195,9 @@ class BaseAdapter(metaclass=AdapterMeta):
 
     def __init__(self, config):
         self.config = config
-        self.cache = RelationsCache()
+        self.cache = RelationsCache(max_schemas=flags.RELATIONS_CACHE_MAX_SCHEMAS or None)
+        # when each schema filled from the manifest was listed, for saving
+        self._schemas_listed_at: Dict[Tuple[Optional[str], Optional[str]], float] = {}
         self.connections = self.ConnectionManager(config)
         self._macro_manifest_lazy: Optional[MacroManifest] = None
 
@@ -220,8 +249,8 @@ class BaseAdapter(metaclass=AdapterMeta):
 
     @available.parse(lambda *a, **k: ("", empty_table()))
     def execute(
-        self, sql: str, auto_begin: bool = False, fetch: bool = False
-    ) -> Tuple[Union[str, AdapterResponse], agate.Table]:
+        self, sql: str, auto_begin: bool = False, fetch: bool = False, stream: bool = False
+    ) -> Tuple[Union[str, AdapterResponse], Union[agate.Table, ColumnarResult]]:
         """Execute the given SQL. This is a thin wrapper around
         ConnectionManager.execute.
 
@@ -229,9 +258,16 @@ class BaseAdapter(metaclass=AdapterMeta):
         :param bool auto_begin: If set, and dbt is not currently inside a
             transaction, automatically begin one.
         :param bool fetch: If set, fetch results.
+        :param bool stream: If set with fetch, fetch the results in chunks
+            into a ColumnarResult instead of an agate table. It is ignored if
+            the connection manager's execute doesn't take it.
         :return: A tuple of the status and the results (empty if fetch=False).
-        :rtype: Tuple[Union[str, AdapterResponse], agate.Table]
+        :rtype: Tuple[Union[str, AdapterResponse], Union[agate.Table, ColumnarResult]]
         """
+        if stream and _accepts_stream(type(self.connections)):
+            return self.connections.execute(
+                sql=sql, auto_begin=auto_begin, fetch=fetch, stream=True
+            )
         return self.connections.execute(sql=sql, auto_begin=auto_begin, fetch=fetch)
 
     @available.parse(lambda *a, **k: ("", empty_table()))
@@ -342,9 +378,15 @@ class BaseAdapter(metaclass=AdapterMeta):
         iterable of the schemas populated, as strings.
         """
         cache_schemas = self._get_cache_schemas(manifest)
+        listed_at = time.time()
+        saved = self._load_saved_relations(cache_schemas)
         with executor(self.config) as tpe:
             futures: List[Future[List[BaseRelation]]] = []
             for cache_schema in cache_schemas:
+                schema_key = (lowercase(cache_schema.database), lowercase(cache_schema.schema))
+                if schema_key in saved:
+                    continue
+                self._schemas_listed_at[schema_key] = listed_at
                 fut = tpe.submit_connected(
                     self,
                     f"list_{cache_schema.database}_{cache_schema.schema}",
@@ -359,6 +401,11 @@ class BaseAdapter(metaclass=AdapterMeta):
                 for relation in future.result():
                     self.cache.add(relation)
 
+        for schema_key, (saved_listed_at, relations) in saved.items():
+            self._schemas_listed_at[schema_key] = saved_listed_at
+            for relation in relations:
+                self.cache.add(relation)
+
         # it's possible that there were no relations in some schemas. We want
         # to insert the schemas we query into the cache's `.schemas` attribute
         # so we can check it later
@@ -374,7 +421,92 @@ class BaseAdapter(metaclass=AdapterMeta):
         with self.cache.lock:
             if clear:
                 self.cache.clear()
+                self._schemas_listed_at.clear()
             self._relations_cache_for_schemas(manifest)
+            # only changes made from here on count as dbt changing a schema
+            self.cache.changed_schemas.clear()
+
+    def _relations_cache_path(self) -> str:
+        return os.path.join(self.config.target_path, RELATIONS_CACHE_FILE_NAME)
+
+    def _schema_fingerprint(self, database: Optional[str], schema: Optional[str]) -> str:
+        """Identify a schema in the warehouse this adapter connects to, so that
+        saved relations are only reused against the same target.
+        """
+        target = dict(self.config.credentials.connection_info())
+        data = json.dumps([self.type(), target, database, schema], sort_keys=True, default=str)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def _load_saved_relations(
+        self, cache_schemas: Set[BaseRelation]
+    ) -> Dict[Tuple[Optional[str], Optional[str]], Tuple[float, List[BaseRelation]]]:
+        """Read the relations that save_relations_cache saved for any of the
+        given schemas, if they were listed less than flags.RELATIONS_CACHE_TTL
+        seconds ago. Returns when each schema was listed, and its relations.
+
+        The file is removed once read, so that an invocation that stops before
+        saving can't leave behind schemas it has changed.
+        """
+        ttl = flags.RELATIONS_CACHE_TTL
+        path = self._relations_cache_path()
+        if not ttl or not os.path.exists(path):
+            return {}
+
+        wanted = {
+            (lowercase(relation.database), lowercase(relation.schema))
+            for relation in cache_schemas
+        }
+        now = time.time()
+        saved = {}
+        try:
+            data = json.loads(load_file_contents(path, strip=False))
+            remove_file(path)
+            if data["dbt_version"] != dbt_version:
+                return {}
+            for entry in data["schemas"]:
+                database, schema = entry["database"], entry["schema"]
+                if (
+                    (database, schema) in wanted
+                    and now - entry["listed_at"] < ttl
+                    and entry["fingerprint"] == self._schema_fingerprint(database, schema)
+                ):
+                    relations = [self.Relation.from_dict(r) for r in entry["relations"]]
+                    saved[(database, schema)] = (entry["listed_at"], relations)
+        except Exception as exc:
+            fire_event(SavedRelationsCacheInvalid(path=path, exc=str(exc)))
+            return {}
+        fire_event(SavedRelationsCacheUsed(reused=len(saved), listed=len(wanted) - len(saved)))
+        return saved
+
+    def save_relations_cache(self) -> None:
+        """Save the cached relations of the schemas that were filled from the
+        manifest, for the next invocation to reuse. Schemas that dbt changed
+        relations in, or that are past flags.RELATIONS_CACHE_TTL, are left out
+        and get listed again.
+        """
+        ttl = flags.RELATIONS_CACHE_TTL
+        if not ttl or not self._schemas_listed_at:
+            return
+        now = time.time()
+        schemas = []
+        for (database, schema), listed_at in self._schemas_listed_at.items():
+            if (
+                (database, schema) in self.cache.changed_schemas
+                or (database, schema) not in self.cache.schemas
+                or now - listed_at >= ttl
+            ):
+                continue
+            relations = self.cache.get_relations(database, schema)
+            schemas.append(
+                {
+                    "database": database,
+                    "schema": schema,
+                    "fingerprint": self._schema_fingerprint(database, schema),
+                    "listed_at": listed_at,
+                    "relations": [relation.to_dict(omit_none=True) for relation in relations],
+                }
+            )
+        write_json(self._relations_cache_path(), {"dbt_version": dbt_version, "schemas": schemas})
 
     @available
     def cache_added(self, relation: Optional[BaseRelation]) -> str:
@@ -622,16 +754,23 @@ class BaseAdapter(metaclass=AdapterMeta):
         self.expand_column_types(from_relation, to_relation)
 
     def list_relations(self, database: Optional[str], schema: str) -> List[BaseRelation]:
-        if self._schema_is_cached(database, schema):
-            return self.cache.get_relations(database, schema)
-
-        schema_relation = self.Relation.create(
-            database=database, schema=schema, identifier="", quote_policy=self.config.quoting
-        ).without_identifier()
-
-        # we can't build the relations cache because we don't have a
-        # manifest so we can't run any operations.
-        relations = self.list_relations_without_caching(schema_relation)
+        # hold the schema's lock so it can't be evicted, or changed, between
+        # checking the cache and reading or restoring it
+        with self.cache.schema_lock(database, schema):
+            if self._schema_is_cached(database, schema):
+                return self.cache.get_relations(database, schema)
+
+            schema_relation = self.Relation.create(
+                database=database, schema=schema, identifier="", quote_policy=self.config.quoting
+            ).without_identifier()
+
+            # we can't build the relations cache because we don't have a
+            # manifest so we can't run any operations. A schema that was
+            # evicted from the cache was built from the manifest, though, so
+            # cache it again.
+            relations = self.list_relations_without_caching(schema_relation)
+            if self.cache.is_evicted(database, schema):
+                self.cache.restore_schema(database, schema, relations)
         fire_event(
             ListRelations(
                 database=database, schema=schema, relations=[_make_key(x) for x in relations]
@@ -926,11 +1065,17 @@ class BaseAdapter(metaclass=AdapterMeta):
         return result
 
     @classmethod
-    def _catalog_filter_table(cls, table: agate.Table, manifest: Manifest) -> agate.Table:
+    def _catalog_filter_table(
+        cls, table: Union[agate.Table, ColumnarResult], manifest: Manifest
+    ) -> Union[agate.Table, ColumnarResult]:
         """Filter the table as appropriate for catalog entries. Subclasses can
         override this to change filtering rules on a per-adapter basis.
         """
         # force database + schema to be strings
+        if isinstance(table, ColumnarResult):
+            text_columns = ["table_database", "table_schema", "table_name"]
+            table = table.with_types({name: TEXT_TYPE for name in text_columns})
+            return table.where(_catalog_filter_schemas(manifest))
         table = table_from_rows(
             table.rows,
             table.column_names,
@@ -943,7 +1088,7 @@ class BaseAdapter(metaclass=AdapterMeta):
         information_schema: InformationSchema,
         schemas: Set[str],
         manifest: Manifest,
-    ) -> agate.Table:
+    ) -> Union[agate.Table, ColumnarResult]:
 
         kwargs = {"information_schema": information_schema, "schemas": schemas}
         table = self.execute_macro(
@@ -957,25 +1102,45 @@ class BaseAdapter(metaclass=AdapterMeta):
         results = self._catalog_filter_table(table, manifest)
         return results
 
-    def get_catalog(self, manifest: Manifest) -> Tuple[agate.Table, List[Exception]]:
+    def _submit_catalogs(self, tpe, manifest: Manifest) -> List[Future]:
         schema_map = self._get_catalog_schemas(manifest)
-
+        futures: List[Future[Union[agate.Table, ColumnarResult]]] = []
+        for info, schemas in schema_map.items():
+            if len(schemas) == 0:
+                continue
+            name = ".".join([str(info.database), "information_schema"])
+
+            fut = tpe.submit_connected(self, name, self._get_one_catalog, info, schemas, manifest)
+            futures.append(fut)
+        return futures
+
+    def get_catalog(
+        self, manifest: Manifest
+    ) -> Tuple[Union[agate.Table, ColumnarResult], List[Exception]]:
         with executor(self.config) as tpe:
-            futures: List[Future[agate.Table]] = []
-            for info, schemas in schema_map.items():
-                if len(schemas) == 0:
-                    continue
-                name = ".".join([str(info.database), "information_schema"])
-
-                fut = tpe.submit_connected(
-                    self, name, self._get_one_catalog, info, schemas, manifest
-                )
-                futures.append(fut)
-
+            futures = self._submit_catalogs(tpe, manifest)
             catalogs, exceptions = catch_as_completed(futures)
 
         return catalogs, exceptions
 
+    def iter_catalogs(
+        self, manifest: Manifest, exceptions: List[Exception]
+    ) -> Iterator[Union[agate.Table, ColumnarResult]]:
+        """Yield the catalog of each information schema as soon as it is
+        fetched, rather than merging them all like get_catalog. Errors are
+        added to exceptions. Adapters that override get_catalog yield its one
+        merged catalog.
+        """
+        if type(self).get_catalog is not BaseAdapter.get_catalog:
+            catalog, errors = self.get_catalog(manifest)
+            exceptions.extend(errors)
+            yield catalog
+            return
+
+        with executor(self.config) as tpe:
+            futures = self._submit_catalogs(tpe, manifest)
+            yield from iter_as_completed(futures, exceptions)
+
     def cancel_open_connections(self):
         """Cancel all open connections."""
         return self.connections.cancel_open()
@@ -996,6 +1161,8 @@ class BaseAdapter(metaclass=AdapterMeta):
 
         # run the macro
         table = self.execute_macro(FRESHNESS_MACRO_NAME, kwargs=kwargs, manifest=manifest)
+        if isinstance(table, ColumnarResult):
+            table = table.typed_rows()
         # now we have a 1-row table of the maximum `loaded_at_field` value and
         # the current time according to the db.
         if len(table) != 1 or len(table[0]) != 2:
@@ -1141,24 +1308,36 @@ join diff_count using (id)
 """.strip()
 
 
-def catch_as_completed(
-    futures,  # typing: List[Future[agate.Table]]
-) -> Tuple[agate.Table, List[Exception]]:
-
-    # catalogs: agate.Table = agate.Table(rows=[])
-    tables: List[agate.Table] = []
-    exceptions: List[Exception] = []
-
+def iter_as_completed(
+    futures,  # typing: List[Future[Union[agate.Table, ColumnarResult]]]
+    exceptions: List[Exception],
+) -> Iterator[Union[agate.Table, ColumnarResult]]:
     for future in as_completed(futures):
         exc = future.exception()
         # we want to re-raise on ctrl+c and BaseException
         if exc is None:
-            catalog = future.result()
-            tables.append(catalog)
+            yield future.result()
         elif isinstance(exc, KeyboardInterrupt) or not isinstance(exc, Exception):
             raise exc
         else:
             warn_or_error(f"Encountered an error while generating catalog: {str(exc)}")
             # exc is not None, derives from Exception, and isn't ctrl+c
             exceptions.append(exc)
-    return merge_tables(tables), exceptions
+
+
+def catch_as_completed(
+    futures,  # typing: List[Future[Union[agate.Table, ColumnarResult]]]
+) -> Tuple[Union[agate.Table, ColumnarResult], List[Exception]]:
+
+    # catalogs: agate.Table = agate.Table(rows=[])
+    exceptions: List[Exception] = []
+    tables: List[Union[agate.Table, ColumnarResult]] = list(iter_as_completed(futures, exceptions))
+
+    columnar = [table for table in tables if isinstance(table, ColumnarResult)]
+    if columnar and len(columnar) == len(tables):
+        if len({table.column_names for table in columnar}) == 1:
+            return ColumnarResult.merge(columnar), exceptions
+    agate_tables = [
+        table.to_agate() if isinstance(table, ColumnarResult) else table for table in tables
+    ]
+    return merge_tables(agate_tables), exceptions
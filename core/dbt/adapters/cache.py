@@ -1,10 +1,12 @@
 import threading
+from collections import OrderedDict
+from contextlib import ExitStack, contextmanager
 from copy import deepcopy
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from dbt.adapters.reference_keys import _make_key, _ReferenceKey
 import dbt.exceptions
-from dbt.events.functions import fire_event
+from dbt.events.functions import event_enabled, fire_event
 from dbt.events.types import (
     AddLink,
     AddRelation,
@@ -15,6 +17,7 @@ from dbt.events.types import (
     DumpAfterRenameSchema,
     DumpBeforeAddGraph,
     DumpBeforeRenameSchema,
+    EvictSchema,
     RenameSchema,
     TemporaryRelation,
     UncachedRelation,
@@ -39,11 +42,14 @@ class _CachedRelation:
     :attr str identifier: The identifier of this relation.
     :attr Dict[_ReferenceKey, _CachedRelation] referenced_by: The relations
         that refer to this relation.
+    :attr Dict[_ReferenceKey, _CachedRelation] references: The relations this
+        relation refers to, the inverse of referenced_by.
     :attr BaseRelation inner: The underlying dbt relation.
     """
 
     def __init__(self, inner):
         self.referenced_by = {}
+        self.references = {}
         self.inner = inner
 
     def __str__(self) -> str:
@@ -72,6 +78,8 @@ class _CachedRelation:
         new = self.__class__(self.inner.incorporate())
         new.__dict__.update(self.__dict__)
         new.referenced_by = deepcopy(self.referenced_by, memo)
+        new.references = deepcopy(self.references, memo)
+        return new
 
     def is_referenced_by(self, key):
         return key in self.referenced_by
@@ -90,6 +98,13 @@ class _CachedRelation:
         :param _CachedRelation referrer: The node that refers to this node.
         """
         self.referenced_by[referrer.key()] = referrer
+        referrer.references[self.key()] = self
+
+    def is_linked(self) -> bool:
+        """Return whether this relation refers to, or is referred to by, any
+        other relation.
+        """
+        return bool(self.referenced_by or self.references)
 
     def collect_consequences(self):
         """Recursively collect a set of _ReferenceKeys that would
@@ -163,20 +178,128 @@ class _CachedRelation:
         return [dot_separated(r) for r in self.referenced_by]
 
 
+_SchemaKey = Tuple[Optional[str], Optional[str]]
+
+
+def _schema_key(database: Optional[str], schema: Optional[str]) -> _SchemaKey:
+    return (lowercase(database), lowercase(schema))
+
+
+def _schema_of(key: _ReferenceKey) -> _SchemaKey:
+    # reference keys are already lowercased
+    return (key.database, key.schema)
+
+
+def _lock_order(key: _SchemaKey):
+    # schema locks are always taken in this order, and None sorts first
+    return tuple((part is not None, part or "") for part in key)
+
+
 class RelationsCache:
     """A cache of the relations known to dbt. Keeps track of relationships
     declared between tables and handles renames/drops as a real database would.
 
-    :attr Dict[_ReferenceKey, _CachedRelation] relations: The known relations.
-    :attr threading.RLock lock: The lock around relations, held during updates.
-        The adapters also hold this lock while filling the cache.
+    Relations are stored by schema, and each schema has its own lock, so
+    threads working in different schemas don't wait on each other. Drops and
+    renames of relations with links to other relations can cascade across
+    schemas, so they hold every schema lock instead.
+
+    If max_schemas is set, the least recently used schemas are evicted once
+    more than that many are cached. An evicted schema is no longer "in" the
+    cache, so the adapter lists it again the next time it is needed and hands
+    the result to restore_schema. Schemas with linked relations are never
+    evicted, because listing them again would not bring the links back.
+
+    :attr Dict[_ReferenceKey, _CachedRelation] relations: A copy of all the
+        known relations.
+    :attr threading.RLock lock: Held, along with every schema lock, while the
+        cache is cleared or changed across schemas. The adapters also hold
+        this lock while filling the cache.
     :attr Set[str] schemas: The set of known/cached schemas, all lowercased.
+    :attr Optional[int] max_schemas: The maximum number of schemas to cache,
+        or None for no limit.
+    :attr Set[str] changed_schemas: The schemas that relations have been
+        added to, dropped from or renamed in. Adapters reset this once they
+        have filled the cache.
     """
 
-    def __init__(self) -> None:
-        self.relations: Dict[_ReferenceKey, _CachedRelation] = {}
+    def __init__(self, max_schemas: Optional[int] = None) -> None:
         self.lock = threading.RLock()
-        self.schemas: Set[Tuple[Optional[str], Optional[str]]] = set()
+        self.schemas: Set[_SchemaKey] = set()
+        self.max_schemas = max_schemas
+        # Locks are taken in this order: self.lock, schema locks (sorted by
+        # _lock_order), then self._index_lock, which is only held briefly.
+        self._schema_locks: Dict[_SchemaKey, threading.RLock] = {}
+        self._index_lock = threading.Lock()
+        # each schema's relations are only read or changed holding its lock
+        self._relations: Dict[_SchemaKey, Dict[_ReferenceKey, _CachedRelation]] = {}
+        # the cached schemas, least recently used first
+        self._schema_usage: "OrderedDict[_SchemaKey, None]" = OrderedDict()
+        self._evicted: Set[_SchemaKey] = set()
+        self._linked_schemas: Set[_SchemaKey] = set()
+        self.changed_schemas: Set[_SchemaKey] = set()
+
+    @property
+    def relations(self) -> Dict[_ReferenceKey, _CachedRelation]:
+        with self._index_lock:
+            schema_keys = list(self._relations)
+        relations: Dict[_ReferenceKey, _CachedRelation] = {}
+        for schema_key in schema_keys:
+            with self._schema_lock(schema_key):
+                relations.update(self._relations.get(schema_key, {}))
+        return relations
+
+    def _schema_lock(self, schema_key: _SchemaKey) -> threading.RLock:
+        lock = self._schema_locks.get(schema_key)
+        if lock is None:
+            with self._index_lock:
+                lock = self._schema_locks.setdefault(schema_key, threading.RLock())
+        return lock
+
+    def schema_lock(self, database: Optional[str], schema: Optional[str]) -> threading.RLock:
+        """Get the lock for a schema. Adapters hold it while checking and
+        filling the cache for that schema, so that it can't be evicted or
+        changed in between.
+        """
+        return self._schema_lock(_schema_key(database, schema))
+
+    @contextmanager
+    def _lock_schemas(self, *schema_keys: _SchemaKey) -> Iterator[None]:
+        """Hold the locks of the given schemas."""
+        with ExitStack() as stack:
+            for schema_key in sorted(set(schema_keys), key=_lock_order):
+                stack.enter_context(self._schema_lock(schema_key))
+            yield
+
+    @contextmanager
+    def _lock_all(self) -> Iterator[None]:
+        """Hold self.lock and the lock of every schema."""
+        with self.lock:
+            with self._index_lock:
+                schema_keys = list(self._schema_locks)
+            with self._lock_schemas(*schema_keys):
+                yield
+
+    def _get(self, key: _ReferenceKey) -> Optional[_CachedRelation]:
+        """Get a relation by key. Callers should hold its schema's lock."""
+        return self._relations.get(_schema_of(key), {}).get(key)
+
+    def _use_schema(self, schema_key: _SchemaKey) -> None:
+        """Mark a schema as cached and most recently used. Callers should hold
+        self._index_lock.
+        """
+        self.schemas.add(schema_key)
+        self._schema_usage[schema_key] = None
+        self._schema_usage.move_to_end(schema_key)
+
+    def _add_schemas(self, schema_keys: Iterable[_SchemaKey]) -> None:
+        with self._index_lock:
+            for schema_key in schema_keys:
+                # an evicted schema is only cached again by restore_schema,
+                # once it has been listed again
+                if schema_key not in self._evicted:
+                    self._use_schema(schema_key)
+        self._evict()
 
     def add_schema(
         self,
@@ -188,7 +311,7 @@ class RelationsCache:
         :param database: The database name to add.
         :param schema: The schema name to add.
         """
-        self.schemas.add((lowercase(database), lowercase(schema)))
+        self._add_schemas([_schema_key(database, schema)])
 
     def drop_schema(
         self,
@@ -199,25 +322,29 @@ class RelationsCache:
 
         Then remove all its contents (and their dependents, etc) as well.
         """
-        key = (lowercase(database), lowercase(schema))
-        if key not in self.schemas:
+        key = _schema_key(database, schema)
+        if key not in self.schemas and key not in self._evicted:
             return
 
-        # avoid iterating over self.relations while removing things by
+        # avoid iterating over the schema's relations while removing things by
         # collecting the list first.
 
-        with self.lock:
+        self.changed_schemas.add(key)
+        with self._lock_all():
             to_remove = self._list_relations_in_schema(database, schema)
             self._remove_all(to_remove)
             # handle a drop_schema race by using discard() over remove()
-            self.schemas.discard(key)
+            with self._index_lock:
+                self.schemas.discard(key)
+                self._schema_usage.pop(key, None)
+                self._evicted.discard(key)
 
     def update_schemas(self, schemas: Iterable[Tuple[Optional[str], str]]):
         """Add multiple schemas to the set of known schemas (case-insensitive)
 
         :param schemas: An iterable of the schema names to add.
         """
-        self.schemas.update((lowercase(d), s.lower()) for (d, s) in schemas)
+        self._add_schemas((lowercase(d), s.lower()) for (d, s) in schemas)
 
     def __contains__(self, schema_id: Tuple[Optional[str], str]):
         """A schema is 'in' the relations cache if it is in the set of cached
@@ -228,31 +355,111 @@ class RelationsCache:
         db, schema = schema_id
         return (lowercase(db), schema.lower()) in self.schemas
 
+    def is_evicted(self, database: Optional[str], schema: Optional[str]) -> bool:
+        """Return whether the schema was evicted, and has not been restored."""
+        return _schema_key(database, schema) in self._evicted
+
+    def restore_schema(
+        self, database: Optional[str], schema: Optional[str], relations: Iterable[Any]
+    ) -> None:
+        """Cache an evicted schema again, given all of its relations as listed
+        from the database.
+
+        :param database: The database name of the schema.
+        :param schema: The schema name.
+        :param Iterable[BaseRelation] relations: The relations in the schema.
+        """
+        key = _schema_key(database, schema)
+        with self._lock_schemas(key):
+            with self._index_lock:
+                self._evicted.discard(key)
+                self._use_schema(key)
+            log_added = event_enabled(AddRelation)
+            for relation in relations:
+                cached = _CachedRelation(relation)
+                if log_added:
+                    fire_event(AddRelation(relation=_make_key(cached)))
+                self._setdefault(cached)
+        self._evict()
+
+    def _evict(self) -> None:
+        """Evict the least recently used schemas until at most max_schemas are
+        cached. The most recently used schema, schemas whose lock another
+        thread holds and schemas with linked relations are skipped.
+        """
+        if not self.max_schemas or len(self.schemas) <= self.max_schemas:
+            return
+        with self._index_lock:
+            excess = len(self.schemas) - self.max_schemas
+            if excess <= 0:
+                return
+            candidates = [
+                schema_key
+                for schema_key in list(self._schema_usage)[:-1]
+                if schema_key not in self._linked_schemas
+            ]
+        for schema_key in candidates:
+            if excess <= 0:
+                break
+            lock = self._schema_lock(schema_key)
+            # never wait here: the caller might hold other schema locks
+            if not lock.acquire(blocking=False):
+                continue
+            try:
+                with self._index_lock:
+                    if schema_key not in self.schemas or schema_key in self._linked_schemas:
+                        continue
+                    self._relations.pop(schema_key, None)
+                    self.schemas.discard(schema_key)
+                    self._schema_usage.pop(schema_key, None)
+                    self._evicted.add(schema_key)
+                fire_event(EvictSchema(database=schema_key[0], schema=schema_key[1]))
+                excess -= 1
+            finally:
+                lock.release()
+
     def dump_graph(self):
         """Dump a key-only representation of the schema to a dictionary. Every
         known relation is a key with a value of a list of keys it is referenced
         by.
         """
-        # we have to hold the lock for the entire dump, if other threads modify
-        # self.relations or any cache entry's referenced_by during iteration
-        # it's a runtime error!
-        with self.lock:
-            return {dot_separated(k): v.dump_graph_entry() for k, v in self.relations.items()}
+        # we have to hold each schema's lock while dumping it, if other threads
+        # modify its relations or any cache entry's referenced_by during
+        # iteration it's a runtime error!
+        with self._index_lock:
+            schema_keys = list(self._relations)
+        graph = {}
+        for schema_key in schema_keys:
+            with self._schema_lock(schema_key):
+                relations = self._relations.get(schema_key, {})
+                graph.update(
+                    {dot_separated(k): v.dump_graph_entry() for k, v in relations.items()}
+                )
+        return graph
 
     def _setdefault(self, relation: _CachedRelation):
         """Add a relation to the cache, or return it if it already exists.
+        Callers should hold the lock of the relation's schema.
 
         :param _CachedRelation relation: The relation to set or get.
         :return _CachedRelation: The relation stored under the given relation's
             key
         """
-        self.add_schema(relation.database, relation.schema)
         key = relation.key()
-        return self.relations.setdefault(key, relation)
+        schema_key = _schema_of(key)
+        with self._index_lock:
+            # Relations added to an evicted schema are kept, so that they're
+            # still there if the schema is restored, but the schema is not
+            # marked as cached again.
+            if schema_key not in self._evicted:
+                self._use_schema(schema_key)
+            relations = self._relations.setdefault(schema_key, {})
+        return relations.setdefault(key, relation)
 
     def _add_link(self, referenced_key, dependent_key):
         """Add a link between two relations to the database. Both the old and
-        new entries must alraedy exist in the database.
+        new entries must alraedy exist in the database. Callers should hold the
+        locks of both relations' schemas.
 
         :param _ReferenceKey referenced_key: The key identifying the referenced
             model (the one that if dropped will drop the dependent model).
@@ -260,7 +467,7 @@ class RelationsCache:
             model.
         :raises InternalError: If either entry does not exist.
         """
-        referenced = self.relations.get(referenced_key)
+        referenced = self._get(referenced_key)
         if referenced is None:
             return
         if referenced is None:
@@ -268,7 +475,7 @@ class RelationsCache:
                 "in add_link, referenced link key {} not in cache!".format(referenced_key)
             )
 
-        dependent = self.relations.get(dependent_key)
+        dependent = self._get(dependent_key)
         if dependent is None:
             dbt.exceptions.raise_cache_inconsistent(
                 "in add_link, dependent link key {} not in cache!".format(dependent_key)
@@ -276,6 +483,9 @@ class RelationsCache:
 
         assert dependent is not None  # we just raised!
 
+        with self._index_lock:
+            self._linked_schemas.add(_schema_of(referenced_key))
+            self._linked_schemas.add(_schema_of(dependent_key))
         referenced.add_reference(dependent)
 
     # TODO: Is this dead code?  I can't seem to find it grepping the codebase.
@@ -301,16 +511,16 @@ class RelationsCache:
             # a link - we will never drop the referenced relation during a run.
             fire_event(UncachedRelation(dep_key=dep_key, ref_key=ref_key))
             return
-        if ref_key not in self.relations:
+        if self._get(ref_key) is None:
             # Insert a dummy "external" relation.
             referenced = referenced.replace(type=referenced.External)
             self.add(referenced)
-        if dep_key not in self.relations:
+        if self._get(dep_key) is None:
             # Insert a dummy "external" relation.
             dependent = dependent.replace(type=referenced.External)
             self.add(dependent)
         fire_event(AddLink(dep_key=dep_key, ref_key=ref_key))
-        with self.lock:
+        with self._lock_schemas(_schema_of(ref_key), _schema_of(dep_key)):
             self._add_link(ref_key, dep_key)
 
     def add(self, relation):
@@ -320,12 +530,19 @@ class RelationsCache:
         :param BaseRelation relation: The underlying relation.
         """
         cached = _CachedRelation(relation)
-        fire_event(AddRelation(relation=_make_key(cached)))
-        fire_event(DumpBeforeAddGraph(dump=Lazy.defer(lambda: self.dump_graph())))
-
-        with self.lock:
+        key = _make_key(cached)
+        # these are all debug cache events, logged or skipped together
+        log_events = event_enabled(AddRelation)
+        if log_events:
+            fire_event(AddRelation(relation=key))
+            fire_event(DumpBeforeAddGraph(dump=Lazy.defer(lambda: self.dump_graph())))
+
+        self.changed_schemas.add(_schema_of(key))
+        with self._schema_lock(_schema_of(key)):
             self._setdefault(cached)
-        fire_event(DumpAfterAddGraph(dump=Lazy.defer(lambda: self.dump_graph())))
+        if log_events:
+            fire_event(DumpAfterAddGraph(dump=Lazy.defer(lambda: self.dump_graph())))
+        self._evict()
 
     def _remove_refs(self, keys):
         """Removes all references to all entries in keys. This does not
@@ -333,24 +550,28 @@ class RelationsCache:
 
         :param Iterable[_ReferenceKey] keys: The keys to remove.
         """
-        # remove direct refs
         for key in keys:
-            del self.relations[key]
-        # then remove all entries from each child
-        for cached in self.relations.values():
-            cached.release_references(keys)
+            # remove direct refs
+            cached = self._relations[_schema_of(key)].pop(key)
+            # then remove the entry from each relation it referred to
+            for referenced in cached.references.values():
+                referenced.release_references((key,))
 
     def _drop_cascade_relation(self, dropped_key):
         """Drop the given relation and cascade it appropriately to all
-        dependent relations.
+        dependent relations. Callers should hold the locks of every schema
+        the drop can reach.
 
         :param _CachedRelation dropped: An existing _CachedRelation to drop.
         """
-        if dropped_key not in self.relations:
+        dropped = self._get(dropped_key)
+        if dropped is None:
             fire_event(DropMissingRelation(relation=dropped_key))
             return
-        consequences = self.relations[dropped_key].collect_consequences()
-        fire_event(DropCascade(dropped=dropped_key, consequences=consequences))
+        consequences = dropped.collect_consequences()
+        if event_enabled(DropCascade):
+            fire_event(DropCascade(dropped=dropped_key, consequences=consequences))
+        self.changed_schemas.update(_schema_of(key) for key in consequences)
         self._remove_refs(consequences)
 
     def drop(self, relation):
@@ -366,7 +587,14 @@ class RelationsCache:
         """
         dropped_key = _make_key(relation)
         fire_event(DropRelation(dropped=dropped_key))
-        with self.lock:
+        self.changed_schemas.add(_schema_of(dropped_key))
+        with self._lock_schemas(_schema_of(dropped_key)):
+            dropped = self._get(dropped_key)
+            if dropped is None or not dropped.is_linked():
+                self._drop_cascade_relation(dropped_key)
+                return
+        # the drop can cascade to, and release references in, other schemas
+        with self._lock_all():
             self._drop_cascade_relation(dropped_key)
 
     def _rename_relation(self, old_key, new_relation):
@@ -380,22 +608,26 @@ class RelationsCache:
         # previously referenced by old_name to be referenced by new_name.
         # basically, the name changes but some underlying ID moves. Kind of
         # like an object reference!
-        relation = self.relations.pop(old_key)
+        relation = self._relations[_schema_of(old_key)].pop(old_key)
         new_key = new_relation.key()
 
         # relaton has to rename its innards, so it needs the _CachedRelation.
         relation.rename(new_relation)
-        # update all the relations that refer to it
-        for cached in self.relations.values():
-            if cached.is_referenced_by(old_key):
+        # update all the relations that know it by its old key: the ones it
+        # refers to
+        log_updates = event_enabled(UpdateReference)
+        for cached in relation.references.values():
+            if log_updates:
                 fire_event(
                     UpdateReference(old_key=old_key, new_key=new_key, cached_key=cached.key())
                 )
-                cached.rename_key(old_key, new_key)
+            cached.rename_key(old_key, new_key)
+        # and the ones that refer to it
+        for cached in relation.referenced_by.values():
+            cached.references[new_key] = cached.references.pop(old_key)
 
-        self.relations[new_key] = relation
-        # also fixup the schemas!
-        self.add_schema(new_key.database, new_key.schema)
+        # this also fixes up the schemas!
+        self._setdefault(relation)
 
         return True
 
@@ -412,18 +644,24 @@ class RelationsCache:
         :return bool: If the old relation exists for renaming.
         :raises InternalError: If the new key is already present.
         """
-        if new_key in self.relations:
+        if self._get(new_key) is not None:
             dbt.exceptions.raise_cache_inconsistent(
                 "in rename, new key {} already in cache: {}".format(
-                    new_key, list(self.relations.keys())
+                    new_key, list(self._relations[_schema_of(new_key)].keys())
                 )
             )
 
-        if old_key not in self.relations:
+        if self._get(old_key) is None:
             fire_event(TemporaryRelation(key=old_key))
             return False
         return True
 
+    def _rename(self, old_key, new):
+        if self._check_rename_constraints(old_key, _make_key(new)):
+            self._rename_relation(old_key, _CachedRelation(new))
+        else:
+            self._setdefault(_CachedRelation(new))
+
     def rename(self, old, new):
         """Rename the old schema/identifier to the new schema/identifier and
         update references.
@@ -438,17 +676,25 @@ class RelationsCache:
         """
         old_key = _make_key(old)
         new_key = _make_key(new)
-        fire_event(RenameSchema(old_key=old_key, new_key=new_key))
-
-        fire_event(DumpBeforeRenameSchema(dump=Lazy.defer(lambda: self.dump_graph())))
-
-        with self.lock:
-            if self._check_rename_constraints(old_key, new_key):
-                self._rename_relation(old_key, _CachedRelation(new))
-            else:
-                self._setdefault(_CachedRelation(new))
-
-        fire_event(DumpAfterRenameSchema(dump=Lazy.defer(lambda: self.dump_graph())))
+        log_events = event_enabled(RenameSchema)
+        if log_events:
+            fire_event(RenameSchema(old_key=old_key, new_key=new_key))
+            fire_event(DumpBeforeRenameSchema(dump=Lazy.defer(lambda: self.dump_graph())))
+
+        self.changed_schemas.update((_schema_of(old_key), _schema_of(new_key)))
+        with self._lock_schemas(_schema_of(old_key), _schema_of(new_key)):
+            relation = self._get(old_key)
+            linked = relation is not None and relation.is_linked()
+            if not linked:
+                self._rename(old_key, new)
+        if linked:
+            # references to the relation can live in any schema
+            with self._lock_all():
+                self._rename(old_key, new)
+
+        if log_events:
+            fire_event(DumpAfterRenameSchema(dump=Lazy.defer(lambda: self.dump_graph())))
+        self._evict()
 
     def get_relations(self, database: Optional[str], schema: Optional[str]) -> List[Any]:
         """Case-insensitively yield all relations matching the given schema.
@@ -457,14 +703,12 @@ class RelationsCache:
         :return List[BaseRelation]: The list of relations with the given
             schema
         """
-        database = lowercase(database)
-        schema = lowercase(schema)
-        with self.lock:
-            results = [
-                r.inner
-                for r in self.relations.values()
-                if (lowercase(r.schema) == schema and lowercase(r.database) == database)
-            ]
+        key = _schema_key(database, schema)
+        with self._lock_schemas(key):
+            with self._index_lock:
+                if key in self._schema_usage:
+                    self._schema_usage.move_to_end(key)
+            results = [r.inner for r in self._relations.get(key, {}).values()]
 
         if None in results:
             dbt.exceptions.raise_cache_inconsistent(
@@ -474,28 +718,29 @@ class RelationsCache:
 
     def clear(self):
         """Clear the cache"""
-        with self.lock:
-            self.relations.clear()
-            self.schemas.clear()
+        with self._lock_all():
+            with self._index_lock:
+                self._relations.clear()
+                self.schemas.clear()
+                self._schema_usage.clear()
+                self._evicted.clear()
+                self._linked_schemas.clear()
+                self.changed_schemas.clear()
 
     def _list_relations_in_schema(
         self, database: Optional[str], schema: Optional[str]
     ) -> List[_CachedRelation]:
         """Get the relations in a schema. Callers should hold the lock."""
-        key = (lowercase(database), lowercase(schema))
-
-        to_remove: List[_CachedRelation] = []
-        for cachekey, relation in self.relations.items():
-            if (cachekey.database, cachekey.schema) == key:
-                to_remove.append(relation)
-        return to_remove
+        key = _schema_key(database, schema)
+        return list(self._relations.get(key, {}).values())
 
     def _remove_all(self, to_remove: List[_CachedRelation]):
         """Remove all the listed relations. Ignore relations that have been
-        cascaded out.
+        cascaded out. Callers should hold every schema lock.
         """
         for relation in to_remove:
             # it may have been cascaded out already
             drop_key = _make_key(relation)
-            if drop_key in self.relations:
-                self.drop(drop_key)
+            if self._get(drop_key) is not None:
+                fire_event(DropRelation(dropped=drop_key))
+                self._drop_cascade_relation(drop_key)
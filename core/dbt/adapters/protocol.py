@@ -17,6 +17,7 @@ from typing_extensions import Protocol
 
 import agate
 
+from dbt.clients.agate_helper import ColumnarResult
 from dbt.contracts.connection import Connection, AdapterRequiredConfig, AdapterResponse
 from dbt.contracts.graph.compiled import CompiledNode, ManifestNode, NonSourceCompiledNode
 from dbt.contracts.graph.parsed import ParsedNode, ParsedSourceDefinition
@@ -154,8 +155,8 @@ class AdapterProtocol(  # type: ignore[misc]
         ...
 
     def execute(
-        self, sql: str, auto_begin: bool = False, fetch: bool = False
-    ) -> Tuple[Union[str, AdapterResponse], agate.Table]:
+        self, sql: str, auto_begin: bool = False, fetch: bool = False, stream: bool = False
+    ) -> Tuple[Union[str, AdapterResponse], Union[agate.Table, ColumnarResult]]:
         ...
 
     def get_compiler(self) -> Compiler_T:
@@ -5,6 +5,7 @@ from typing import List, Optional, Tuple, Any, Iterable, Dict, Union
 import agate
 
 import dbt.clients.agate_helper
+from dbt.clients.agate_helper import ColumnarResult
 import dbt.exceptions
 from dbt.adapters.base import BaseConnectionManager
 from dbt.contracts.connection import Connection, ConnectionState, AdapterResponse
@@ -22,6 +23,9 @@ class SQLConnectionManager(BaseConnectionManager):
         - open
     """
 
+    # the rows fetched at a time for `execute(..., stream=True)`
+    FETCH_CHUNK_SIZE: int = 10000
+
     @abc.abstractmethod
     def cancel(self, connection: Connection):
         """Cancel the given connection."""
@@ -103,25 +107,53 @@ class SQLConnectionManager(BaseConnectionManager):
                 unique_col_names[column_names[idx]] = 1  # type: ignore[index]
         return [dict(zip(column_names, row)) for row in rows]
 
+    @classmethod
+    def get_column_type(cls, type_code: Any) -> Optional[agate.data_types.DataType]:
+        """Get the agate type for values with the given type code from
+        cursor.description, or None to infer it from the values. Adapters can
+        override this, with the types from dbt.clients.agate_helper.
+        """
+        return None
+
     @classmethod
     def get_result_from_cursor(cls, cursor: Any) -> agate.Table:
         data: List[Any] = []
         column_names: List[str] = []
+        column_types: List[Optional[agate.data_types.DataType]] = []
 
         if cursor.description is not None:
             column_names = [col[0] for col in cursor.description]
+            column_types = [cls.get_column_type(col[1]) for col in cursor.description]
             rows = cursor.fetchall()
             data = cls.process_results(column_names, rows)
 
-        return dbt.clients.agate_helper.table_from_data_flat(data, column_names)
+        return dbt.clients.agate_helper.table_from_data_flat(data, column_names, column_types)
+
+    @classmethod
+    def get_columnar_result_from_cursor(cls, cursor: Any) -> ColumnarResult:
+        column_names: List[str] = []
+
+        if cursor.description is not None:
+            column_names = [col[0] for col in cursor.description]
+            column_types = [cls.get_column_type(col[1]) for col in cursor.description]
+            # renames repeated column names in place, as for get_result_from_cursor
+            cls.process_results(column_names, [])
+            return ColumnarResult.from_cursor(
+                cursor, column_names, cls.FETCH_CHUNK_SIZE, column_types
+            )
+
+        return ColumnarResult(column_names)
 
     def execute(
-        self, sql: str, auto_begin: bool = False, fetch: bool = False
-    ) -> Tuple[Union[AdapterResponse, str], agate.Table]:
+        self, sql: str, auto_begin: bool = False, fetch: bool = False, stream: bool = False
+    ) -> Tuple[Union[AdapterResponse, str], Union[agate.Table, ColumnarResult]]:
         sql = self._add_query_comment(sql)
         _, cursor = self.add_query(sql, auto_begin)
         response = self.get_response(cursor)
-        if fetch:
+        table: Union[agate.Table, ColumnarResult]
+        if fetch and stream:
+            table = self.get_columnar_result_from_cursor(cursor)
+        elif fetch:
             table = self.get_result_from_cursor(cursor)
         else:
             table = dbt.clients.agate_helper.empty_table()
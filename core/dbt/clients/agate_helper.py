@@ -5,7 +5,7 @@ import datetime
 import isodate
 import json
 import dbt.utils
-from typing import Iterable, List, Dict, Union, Optional, Any
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 from dbt.exceptions import RuntimeException
 
@@ -94,33 +94,248 @@ def table_from_data(data, column_names: Iterable[str]) -> agate.Table:
         return table.select(column_names)
 
 
-def table_from_data_flat(data, column_names: Iterable[str]) -> agate.Table:
+def table_from_data_flat(
+    data,
+    column_names: Iterable[str],
+    column_types: Optional[Iterable[Optional[agate.data_types.DataType]]] = None,
+) -> agate.Table:
     """
     Convert a list of dictionaries into an Agate table. This method does not
     coerce string values into more specific types (eg. '005' will not be
     coerced to '5'). Additionally, this method does not coerce values to
     None (eg. '' or 'null' will retain their string literal representations).
+    Columns with a type in column_types are cast to it instead of inferring it.
     """
 
-    rows = []
-    text_only_columns = set()
-    for _row in data:
-        row = []
-        for col_name in column_names:
-            value = _row[col_name]
+    result = ColumnarResult(column_names, column_types)
+    result.extend([[_row[col_name] for col_name in result.column_names] for _row in data])
+    return result.to_agate()
+
+
+# The agate types that connection managers give columns from the type codes
+# in cursor.description. Each is the type the type tester infers from the
+# python values of those columns, so a known type only skips the inference.
+NUMBER_TYPE = Number(null_values=("null", ""))
+DATE_TYPE = agate.data_types.Date(null_values=("null", ""), date_format="%Y-%m-%d")
+DATETIME_TYPE = agate.data_types.DateTime(
+    null_values=("null", ""), datetime_format="%Y-%m-%d %H:%M:%S"
+)
+BOOLEAN_TYPE = agate.data_types.Boolean(
+    true_values=("true",), false_values=("false",), null_values=("null", "")
+)
+# like text_only_columns, this keeps '' and 'null' as strings
+TEXT_TYPE = agate.data_types.Text(null_values=())
+
+
+def _cast_column(
+    values: List[Any], column_type: Optional[agate.data_types.DataType]
+) -> Tuple[agate.data_types.DataType, List[Any]]:
+    if column_type is None:
+        # infer the type as table_from_data_flat always has
+        text_only = False
+        prepared = []
+        for value in values:
             if isinstance(value, (dict, list, tuple)):
                 # Represent container types as json strings
                 value = json.dumps(value, cls=dbt.utils.JSONEncoder)
-                text_only_columns.add(col_name)
+                text_only = True
             elif isinstance(value, str):
-                text_only_columns.add(col_name)
-            row.append(value)
+                text_only = True
+            prepared.append(value)
+        tester = build_type_tester(["value"] if text_only else (), string_null_values=())
+        (column_type,) = tester.run([(value,) for value in prepared], ["value"])
+        values = prepared
+    cast = column_type.cast
+    if isinstance(column_type, agate.data_types.Text) and not column_type.null_values:
+        # with no null values, casting to text leaves None and strings as they are
+        return column_type, [
+            value if value is None or type(value) is str else cast(value) for value in values
+        ]
+    return column_type, [cast(value) for value in values]
+
+
+class ColumnarRows(Sequence[Tuple[Any, ...]]):
+    """The rows of a ColumnarResult as tuples, built as they are read."""
+
+    def __init__(self, columns: List[List[Any]], length: int) -> None:
+        self._columns = columns
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("row index out of range")
+        return tuple(column[index] for column in self._columns)
+
+    def __iter__(self) -> Iterator[Tuple[Any, ...]]:
+        if not self._columns:
+            return iter(())
+        return zip(*self._columns)
+
+
+class ColumnarResult:
+    """The result of a query as one list of values per column, as the driver
+    returned them. Column types come from cursor.description where the
+    connection manager knows them, and are inferred from the values of the
+    other columns. Nothing is cast until typed_rows() or to_agate() asks for
+    it, and then once per column, rather than type tested cell by cell.
+
+    For macro code written for agate tables, attributes of agate tables that
+    this doesn't have (columns, where, print_table, ...) are read from
+    to_agate().
+    """
+
+    def __init__(
+        self,
+        column_names: Iterable[str],
+        column_types: Optional[Iterable[Optional[agate.data_types.DataType]]] = None,
+    ) -> None:
+        self.column_names: Tuple[str, ...] = tuple(column_names)
+        if column_types is None:
+            column_types = [None] * len(self.column_names)
+        self._declared_types: Tuple[Optional[agate.data_types.DataType], ...] = tuple(column_types)
+        self._columns: List[List[Any]] = [[] for _ in self.column_names]
+        self._length = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        self._column_types: Optional[Tuple[agate.data_types.DataType, ...]] = None
+        self._typed_columns: List[List[Any]] = []
+        self._table: Optional[agate.Table] = None
+
+    @classmethod
+    def from_cursor(
+        cls,
+        cursor: Any,
+        column_names: Iterable[str],
+        chunk_size: int,
+        column_types: Optional[Iterable[Optional[agate.data_types.DataType]]] = None,
+    ) -> "ColumnarResult":
+        result = cls(column_names, column_types)
+        while True:
+            chunk = cursor.fetchmany(chunk_size)
+            if not chunk:
+                break
+            result.extend(chunk)
+        return result
+
+    @classmethod
+    def merge(cls, results: Sequence["ColumnarResult"]) -> "ColumnarResult":
+        """Concatenate results with the same column names. A column keeps its
+        type if every result has the same one, otherwise it is inferred.
+        """
+        column_names = results[0].column_names
+        for result in results:
+            if result.column_names != column_names:
+                raise RuntimeException(
+                    f"Can not merge results with columns {result.column_names} "
+                    f"and {column_names}"
+                )
+        column_types = []
+        for index in range(len(column_names)):
+            declared = {result._declared_types[index] for result in results}
+            column_types.append(declared.pop() if len(declared) == 1 else None)
+        merged = cls(column_names, column_types)
+        for result in results:
+            for column, values in zip(merged._columns, result._columns):
+                column.extend(values)
+            merged._length += result._length
+        return merged
+
+    def extend(self, rows: Sequence[Sequence[Any]]) -> None:
+        if not rows:
+            return
+        for column, values in zip(self._columns, zip(*rows)):
+            column.extend(values)
+        self._length += len(rows)
+        self._reset()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[Tuple[Any, ...]]:
+        return iter(self.rows)
 
-        rows.append(row)
+    def __getitem__(self, index):
+        return self.rows[index]
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.to_agate(), name)
+
+    @property
+    def rows(self) -> ColumnarRows:
+        return ColumnarRows(self._columns, self._length)
+
+    def column(self, name: str) -> List[Any]:
+        try:
+            return self._columns[self.column_names.index(name)]
+        except ValueError:
+            raise KeyError(name) from None
+
+    def _cast(self) -> None:
+        if self._column_types is not None:
+            return
+        column_types = []
+        self._typed_columns = []
+        for values, declared in zip(self._columns, self._declared_types):
+            column_type, typed = _cast_column(values, declared)
+            column_types.append(column_type)
+            self._typed_columns.append(typed)
+        self._column_types = tuple(column_types)
+
+    @property
+    def column_types(self) -> Tuple[agate.data_types.DataType, ...]:
+        self._cast()
+        return self._column_types  # type: ignore
+
+    def typed_rows(self) -> ColumnarRows:
+        """The rows with each value cast to its column's agate type."""
+        self._cast()
+        return ColumnarRows(self._typed_columns, self._length)
+
+    def with_types(self, column_types: Dict[str, agate.data_types.DataType]) -> "ColumnarResult":
+        """Return a result with the same values and the given column types."""
+        result = ColumnarResult(
+            self.column_names,
+            [column_types.get(n, t) for n, t in zip(self.column_names, self._declared_types)],
+        )
+        result._columns = self._columns
+        result._length = self._length
+        return result
+
+    def where(self, test: Callable[[agate.Row], bool]) -> "ColumnarResult":
+        """Return a result with the rows for which test is true. Like agate's
+        where, the test gets the row's values cast to the column types.
+        """
+        keep = [
+            index
+            for index, row in enumerate(self.typed_rows())
+            if test(agate.Row(row, self.column_names))
+        ]
+        result = ColumnarResult(self.column_names, self._declared_types)
+        result._columns = [[values[i] for i in keep] for values in self._columns]
+        result._length = len(keep)
+        # keep the column types, as agate's where does
+        result._column_types = self._column_types
+        result._typed_columns = [[values[i] for i in keep] for values in self._typed_columns]
+        return result
 
-    return table_from_rows(
-        rows=rows, column_names=column_names, text_only_columns=text_only_columns
-    )
+    def to_agate(self) -> agate.Table:
+        if self._table is None:
+            column_names = list(self.column_names)
+            rows = [agate.Row(values, column_names) for values in self.typed_rows()]
+            # the values are cast already, so skip agate's own casting, as
+            # agate does for the tables it derives from another
+            self._table = agate.Table(rows, column_names, self.column_types, _is_fork=True)
+        return self._table
 
 
 def empty_table():
@@ -132,6 +347,9 @@ def empty_table():
 def as_matrix(table):
     "Return an agate table as a matrix of data sans columns"
 
+    if isinstance(table, ColumnarResult):
+        # the rows are built as they are read, rather than copied up front
+        return table.rows
     return [r.values() for r in table.rows.values()]
 
 
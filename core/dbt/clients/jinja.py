@@ -1,20 +1,38 @@
 import codecs
+import hashlib
 import linecache
 import os
 import re
 import tempfile
 import threading
+import time
 from ast import literal_eval
 from contextlib import contextmanager
 from itertools import chain, islice
-from typing import List, Union, Set, Optional, Dict, Any, Iterator, Type, NoReturn, Tuple, Callable
+from typing import (
+    List,
+    Union,
+    Set,
+    Optional,
+    Dict,
+    Any,
+    Iterator,
+    Mapping,
+    Type,
+    NoReturn,
+    Tuple,
+    Callable,
+)
 
 import jinja2
+import jinja2.bccache
 import jinja2.ext
 import jinja2.nativetypes  # type: ignore
 import jinja2.nodes
 import jinja2.parser
+import jinja2.runtime
 import jinja2.sandbox
+import jinja2.utils
 
 from dbt.utils import (
     get_dbt_macro_name,
@@ -37,6 +55,7 @@ from dbt.exceptions import (
     UndefinedMacroException,
 )
 from dbt import flags
+from dbt.version import __version__ as dbt_version
 
 
 def _linecache_inject(source, write):
@@ -79,7 +98,45 @@ class MacroFuzzParser(jinja2.parser.Parser):
         return node
 
 
+class LazyContext(Dict[str, Any]):
+    """A context dictionary that looks up the names it doesn't hold in
+    `fallback`, so that values like the macros of a ManifestContext can be
+    created the first time they are used instead of up front for every context.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.fallback: Mapping[str, Any] = {}
+
+    def __missing__(self, key: str) -> Any:
+        return self.fallback[key]
+
+    def __contains__(self, key: object) -> bool:
+        return super().__contains__(key) or key in self.fallback
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+class MacroFuzzContext(jinja2.runtime.Context):
+    def resolve_or_missing(self, key):
+        rv = super().resolve_or_missing(key)
+        if rv is jinja2.utils.missing:
+            # jinja renders with a plain copy of the context dictionary, which
+            # only has the names a LazyContext holds. Look the others up in
+            # the original, which dbt contexts make available as `context`.
+            original = self.parent.get("context")
+            if isinstance(original, LazyContext):
+                rv = original.get(key, jinja2.utils.missing)
+        return rv
+
+
 class MacroFuzzEnvironment(jinja2.sandbox.SandboxedEnvironment):
+    context_class = MacroFuzzContext
+
     def _parse(self, source, name, filename):
         return MacroFuzzParser(self, source, name, filename).parse()
 
@@ -207,6 +264,137 @@ class TemplateCache:
 template_cache = TemplateCache()
 
 
+class TemplateBytecodeCache(jinja2.bccache.BytecodeCache):
+    """Keeps the python code that jinja compiles templates into on disk, so
+    that later invocations can skip lexing, parsing and compiling templates
+    they have seen before. Each entry is keyed by a hash of the template
+    source and of the environment options it was compiled with.
+
+    Nothing is cached until `directory` is set. Using an entry updates its
+    modification time, so that prune() can remove the ones that haven't been
+    used recently, by any process.
+    """
+
+    # Templates are rendered with capture_macros while parsing, and without it
+    # when compiling and running. Only a full parse can tell which entries of
+    # the first kind are still used, the others are removed when they are old.
+    PARSE_KIND = "parse"
+    RENDER_KIND = "render"
+    RENDER_ENTRY_MAX_AGE = 7 * 24 * 60 * 60
+
+    def __init__(self) -> None:
+        self.directory: Optional[str] = None
+
+    def get_template_bucket(
+        self, env: jinja2.Environment, source: str, capture_macros: bool, native: bool
+    ) -> jinja2.bccache.Bucket:
+        checksum = self.get_source_checksum(source)
+        kind = self.PARSE_KIND if capture_macros else self.RENDER_KIND
+        digest = hashlib.sha1(
+            f"{dbt_version}:{capture_macros}:{native}:{checksum}".encode("utf-8")
+        ).hexdigest()
+        key = f"{kind}-{digest}"
+        bucket = jinja2.bccache.Bucket(env, key, checksum)
+        self.load_bytecode(bucket)
+        return bucket
+
+    def _get_cache_filename(self, bucket: jinja2.bccache.Bucket) -> str:
+        assert self.directory is not None
+        return os.path.join(self.directory, f"{bucket.key}.cache")
+
+    def load_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        filename = self._get_cache_filename(bucket)
+        try:
+            fp = open(filename, "rb")
+        except OSError:
+            return
+        with fp:
+            try:
+                bucket.load_bytecode(fp)
+            except Exception:
+                # unreadable entries are recompiled and overwritten
+                bucket.reset()
+                return
+        if bucket.code is not None:
+            try:
+                os.utime(filename)
+            except OSError:
+                pass
+
+    def dump_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        # write to a temporary file and move it into place, so that other
+        # threads and processes never read a partially written entry
+        try:
+            os.makedirs(self.directory, exist_ok=True)  # type: ignore
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError:
+            # the cache is an optimization, failing to write to it is fine
+            return
+        try:
+            with os.fdopen(fd, "wb") as fp:
+                bucket.write_bytecode(fp)
+            os.replace(tmp_path, self._get_cache_filename(bucket))
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def from_string(
+        self,
+        env: jinja2.Environment,
+        source: str,
+        globals: Dict[str, Any],
+        capture_macros: bool,
+        native: bool,
+    ) -> jinja2.Template:
+        """Like env.from_string, but only compiles the source if it isn't in
+        the cache yet.
+        """
+        bucket = self.get_template_bucket(env, source, capture_macros, native)
+        if bucket.code is None:
+            bucket.code = env.compile(source)
+            self.dump_bytecode(bucket)
+        template_class = env.template_class  # type: ignore
+        return template_class.from_code(env, bucket.code, env.make_globals(globals), None)
+
+    def clear(self) -> None:
+        if self.directory is None or not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            if name.endswith(".cache"):
+                os.remove(os.path.join(self.directory, name))
+
+    def prune(self, since: float) -> None:
+        """Called after a full parse that started at `since`, a time.time()
+        timestamp. Remove the parse entries that haven't been used or written
+        since then, the other entries that haven't been for
+        RENDER_ENTRY_MAX_AGE seconds, and temporary files that writes left
+        behind.
+        """
+        if self.directory is None or not os.path.isdir(self.directory):
+            return
+        # some filesystems only keep modification times to the second or two
+        parse_cutoff = since - 2
+        render_cutoff = time.time() - self.RENDER_ENTRY_MAX_AGE
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".tmp") or entry.name.startswith(f"{self.PARSE_KIND}-"):
+                cutoff = parse_cutoff
+            elif entry.name.endswith(".cache"):
+                cutoff = render_cutoff
+            else:
+                continue
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+            except OSError:
+                # another process may have removed or replaced it
+                pass
+
+
+template_bytecode_cache = TemplateBytecodeCache()
+
+
 class BaseMacroGenerator:
     def __init__(self, context: Optional[Dict[str, Any]] = None) -> None:
         self.context: Optional[Dict[str, Any]] = context
@@ -405,11 +593,34 @@ def _is_dunder_name(name):
     return name.startswith("__") and name.endswith("__")
 
 
+class _UndefinedNode(threading.local):
+    def __init__(self):
+        super().__init__()
+        self.node = None
+
+
+# the node that undefined values created while rendering report errors for
+_undefined_node = _UndefinedNode()
+
+
+@contextmanager
+def undefined_node(node) -> Iterator[None]:
+    """Make undefined values created in this thread, by environments from
+    get_environment(capture_macros=True), refer to the given node.
+    """
+    previous = _undefined_node.node
+    _undefined_node.node = node
+    try:
+        yield
+    finally:
+        _undefined_node.node = previous
+
+
 def create_undefined(node=None):
     class Undefined(jinja2.Undefined):
         def __init__(self, hint=None, obj=None, name=None, exc=None):
             super().__init__(hint=hint, name=name)
-            self.node = node
+            self.node = node if node is not None else _undefined_node.node
             self.name = name
             self.hint = hint
             # jinja uses these for safety, so we have to override them.
@@ -430,13 +641,15 @@ def create_undefined(node=None):
 
             self.name = name
 
-            return self.__class__(hint=self.hint, name=self.name)
+            undefined = self.__class__(hint=self.hint, name=self.name)
+            undefined.node = self.node
+            return undefined
 
         def __call__(self, *args, **kwargs):
             return self
 
         def __reduce__(self):
-            raise_compiler_error(f"{self.name} is undefined", node=node)
+            raise_compiler_error(f"{self.name} is undefined", node=self.node)
 
     return Undefined
 
@@ -457,24 +670,19 @@ TEXT_FILTERS: Dict[str, Callable[[Any], Any]] = {
 }
 
 
-def get_environment(
-    node=None,
-    capture_macros: bool = False,
-    native: bool = False,
-) -> jinja2.Environment:
+def _build_environment(capture_macros: bool, native: bool) -> jinja2.Environment:
     args: Dict[str, List[Union[str, Type[jinja2.ext.Extension]]]] = {
         "extensions": ["jinja2.ext.do"]
     }
 
     if capture_macros:
-        args["undefined"] = create_undefined(node)
+        args["undefined"] = create_undefined()
 
     args["extensions"].append(MaterializationExtension)
     args["extensions"].append(DocumentationExtension)
     args["extensions"].append(TestExtension)
 
     env_cls: Type[jinja2.Environment]
-    text_filter: Type
     if native:
         env_cls = NativeSandboxEnvironment
         filters = NATIVE_FILTERS
@@ -488,6 +696,28 @@ def get_environment(
     return env
 
 
+# Environments are shared by every template with the same options, as
+# building one for each template is a measurable part of rendering it. They
+# must not be modified after they are built.
+_environments: Dict[Tuple[bool, bool], jinja2.Environment] = {}
+
+
+def get_environment(
+    node=None,
+    capture_macros: bool = False,
+    native: bool = False,
+) -> jinja2.Environment:
+    """Return the shared environment for these options. With capture_macros,
+    undefined values refer to the node of the enclosing `undefined_node`
+    block, which render_template sets, rather than to `node`.
+    """
+    key = (capture_macros, native)
+    env = _environments.get(key)
+    if env is None:
+        env = _environments.setdefault(key, _build_environment(capture_macros, native))
+    return env
+
+
 @contextmanager
 def catch_jinja(node=None) -> Iterator[None]:
     try:
@@ -518,11 +748,17 @@ def get_template(
         env = get_environment(node, capture_macros, native=native)
 
         template_source = str(string)
+        # with macro debugging on, the source has to be compiled every time to
+        # get it into the linecache
+        if template_bytecode_cache.directory is not None and not flags.MACRO_DEBUGGING:
+            return template_bytecode_cache.from_string(
+                env, template_source, ctx, capture_macros, native
+            )
         return env.from_string(template_source, globals=ctx)
 
 
 def render_template(template, ctx: Dict[str, Any], node=None) -> str:
-    with catch_jinja(node):
+    with catch_jinja(node), undefined_node(node):
         return template.render(ctx)
 
 
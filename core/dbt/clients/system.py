@@ -11,7 +11,7 @@ import sys
 import tarfile
 import requests
 import stat
-from typing import Type, NoReturn, List, Optional, Dict, Any, Tuple, Callable, Union
+from typing import Type, NoReturn, List, Optional, Dict, Any, Tuple, Callable, Union, Iterable
 
 from dbt.events.functions import fire_event
 from dbt.events.types import (
@@ -61,23 +61,29 @@ def find_matching(
         walk_results = os.walk(absolute_path_to_search)
 
         for current_path, subdirectories, local_files in walk_results:
+            relative_dir = os.path.relpath(current_path, absolute_path_to_search)
             for local_file in local_files:
+                if not reobj.match(local_file):
+                    continue
                 absolute_path = os.path.join(current_path, local_file)
-                relative_path = os.path.relpath(absolute_path, absolute_path_to_search)
+                relative_path = os.path.normpath(os.path.join(relative_dir, local_file))
                 modification_time = 0.0
+                file_size = None
                 try:
-                    modification_time = os.path.getmtime(absolute_path)
+                    stat_result = os.stat(absolute_path)
+                    modification_time = stat_result.st_mtime
+                    file_size = stat_result.st_size
                 except OSError:
                     fire_event(SystemErrorRetrievingModTime(path=absolute_path))
-                if reobj.match(local_file):
-                    matching.append(
-                        {
-                            "searched_path": relative_path_to_search,
-                            "absolute_path": absolute_path,
-                            "relative_path": relative_path,
-                            "modification_time": modification_time,
-                        }
-                    )
+                matching.append(
+                    {
+                        "searched_path": relative_path_to_search,
+                        "absolute_path": absolute_path,
+                        "relative_path": relative_path,
+                        "modification_time": modification_time,
+                        "file_size": file_size,
+                    }
+                )
 
     return matching
 
@@ -141,11 +147,18 @@ def supports_symlinks() -> bool:
 
 
 def write_file(path: str, contents: str = "") -> bool:
+    return write_file_chunks(path, [str(contents)])
+
+
+def write_file_chunks(path: str, chunks: Iterable[str]) -> bool:
+    """Write the strings to the file as they are produced, so the contents of
+    large files needn't be joined in memory first.
+    """
     path = convert_path(path)
     try:
         make_directory(os.path.dirname(path))
         with open(path, "w", encoding="utf-8") as f:
-            f.write(str(contents))
+            f.writelines(chunks)
     except Exception as exc:
         # note that you can't just catch FileNotFound, because sometimes
         # windows apparently raises something else.
@@ -1,6 +1,7 @@
 import os
+import re
 from collections import defaultdict
-from typing import List, Dict, Any, Tuple, cast, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Tuple, cast, Optional
 
 import networkx as nx  # type: ignore
 import pickle
@@ -36,6 +37,81 @@ import dbt.tracking
 graph_file_name = "graph.gpickle"
 
 
+# The tokens that matter for finding where to inject CTEs. Anything that
+# sqlparse could read differently, like a statement separator, a backslash
+# escape, dollar quoting, a placeholder or a '#' comment, is matched as `unsure`.
+_CTE_SCAN_PATTERN = re.compile(
+    r"""
+    (?P<comment>--[^\r\n]*|/\*.*?\*/)
+    |(?P<quoted>'(?:''|[^'\\])*'|"(?:""|[^"\\])*"|`(?:``|[^`])*`)
+    |(?P<bracketed>\[[^][()'"`\\/\#$;-]*\])
+    |(?P<with>\bwith\b)
+    |(?P<open>\()
+    |(?P<close>\))
+    |(?P<unsure>['"`´;\#$\\\[\]]|/\*|%[(s])
+    """,
+    re.IGNORECASE | re.DOTALL | re.VERBOSE,
+)
+_WITH_PATTERN = re.compile(r"\bwith\b", re.IGNORECASE)
+# sqlparse only reads `with` as a keyword of its own when a name follows it
+_NAME_FOLLOWS_PATTERN = re.compile(r"\s+[\w\"`]")
+_NON_SPACE_PATTERN = re.compile(r"\S")
+# sqlparse reads a run of these as one operator, so `+--` doesn't start a comment
+_OPERATOR_CHARS = frozenset("+/@#%^&|")
+
+
+def _find_cte_insertion_point(sql: str) -> Optional[Tuple[int, bool]]:
+    """Find where _inject_ctes_into_sql should put the injected CTEs, in one
+    pass over `sql` that skips comments and quoted strings. Returns the
+    position and whether the statement already starts with a `with`, or None
+    if the statement isn't simple enough to be sure, and has to be parsed.
+    """
+    first = _NON_SPACE_PATTERN.search(sql)
+    if first is None:
+        return None
+    depth = 0
+    leading = True
+    with_end = None
+    end = 0
+    for match in _CTE_SCAN_PATTERN.finditer(sql):
+        kind = match.lastgroup
+        start = match.start()
+        if leading and _NON_SPACE_PATTERN.search(sql, end, start):
+            leading = False
+        end = match.end()
+        if kind == "comment":
+            if start > 0 and sql[start - 1] in _OPERATOR_CHARS:
+                return None
+            continue
+        elif kind == "with":
+            if depth == 0 and with_end is None:
+                # sqlparse would inject the CTEs after a `with` anywhere in the
+                # statement, so only the leading one is left to this scan
+                if not leading or not _NAME_FOLLOWS_PATTERN.match(sql, end):
+                    return None
+                with_end = end
+        elif kind == "bracketed":
+            if _WITH_PATTERN.search(match.group()):
+                return None
+        elif kind == "open":
+            depth += 1
+        elif kind == "close":
+            depth -= 1
+            if depth < 0:
+                return None
+        elif kind == "unsure":
+            return None
+        leading = False
+    if depth != 0:
+        return None
+    if with_end is None:
+        return first.start(), False
+    # _NAME_FOLLOWS_PATTERN made sure there is a name after the `with`
+    after_with = _NON_SPACE_PATTERN.search(sql, with_end)
+    assert after_with is not None
+    return after_with.start(), True
+
+
 def _compiled_type_for(model: ParsedNode):
     if type(model) not in COMPILED_TYPES:
         raise InternalException(
@@ -109,6 +185,26 @@ def _extend_prepended_ctes(prepended_ctes, new_prepended_ctes):
         _add_prepended_cte(prepended_ctes, new_cte)
 
 
+def _bitset(positions: Iterable[int]) -> int:
+    """Build an int with the bits at the given positions set."""
+    digits = bytearray(b"0")
+    for position in positions:
+        if position >= len(digits):
+            digits.extend(b"0" * (position + 1 - len(digits)))
+        digits[position] = ord("1")
+    return int(digits[::-1], 2)
+
+
+def _bit_positions(bitset: int) -> Iterator[int]:
+    """Yield the positions of the bits that are set in an int, highest first."""
+    digits = bin(bitset)
+    highest = len(digits) - 1
+    index = digits.find("1", 2)
+    while index != -1:
+        yield highest - index
+        index = digits.find("1", index + 1)
+
+
 def _get_tests_for_node(manifest: Manifest, unique_id: UniqueID) -> List[UniqueID]:
     """Get a list of tests that depend on the node with the
     provided unique id"""
@@ -234,6 +330,19 @@ class Compiler:
         if len(ctes) == 0:
             return sql
 
+        injected_sql = ", ".join(c.sql for c in ctes)
+        insertion_point = _find_cte_insertion_point(sql)
+        if insertion_point is not None:
+            position, has_with = insertion_point
+            if has_with:
+                # add a comma, which will come after the injected CTEs
+                return f"{sql[:position]}{injected_sql},{sql[position:]}"
+            else:
+                # no with stmt, add one, and inject CTEs right at the beginning
+                return f"{sql[:position]}with{injected_sql}{sql[position:]}"
+
+        # sqlparse handles the statements the scan isn't sure about, like
+        # several statements separated by semicolons
         parsed_stmts = sqlparse.parse(sql)
         parsed = parsed_stmts[0]
 
@@ -253,7 +362,7 @@ class Compiler:
             trailing_comma = sqlparse.sql.Token(sqlparse.tokens.Punctuation, ",")
             parsed.insert_after(with_stmt, trailing_comma)
 
-        token = sqlparse.sql.Token(sqlparse.tokens.Keyword, ", ".join(c.sql for c in ctes))
+        token = sqlparse.sql.Token(sqlparse.tokens.Keyword, injected_sql)
         parsed.insert_after(with_stmt, token)
 
         return str(parsed)
@@ -296,39 +405,17 @@ class Compiler:
                     f"During compilation, found a cte reference that "
                     f"could not be resolved: {cte.id}"
                 )
-            cte_model = manifest.nodes[cte.id]
-
-            if not cte_model.is_ephemeral_model:
+            if not manifest.nodes[cte.id].is_ephemeral_model:
                 raise InternalException(f"{cte.id} is not ephemeral")
 
-            # This model has already been compiled, so it's been
-            # through here before
-            if getattr(cte_model, "compiled", False):
-                assert isinstance(cte_model, tuple(COMPILED_TYPES.values()))
-                cte_model = cast(NonSourceCompiledNode, cte_model)
-                new_prepended_ctes = cte_model.extra_ctes
-
-            # if the cte_model isn't compiled, i.e. first time here
-            else:
-                # This is an ephemeral parsed model that we can compile.
-                # Compile and update the node
-                cte_model = self._compile_node(cte_model, manifest, extra_context)
-                # recursively call this method
-                cte_model, new_prepended_ctes = self._recursively_prepend_ctes(
-                    cte_model, manifest, extra_context
-                )
-                # Save compiled SQL file and sync manifest
-                self._write_node(cte_model)
-                manifest.sync_update_node(cte_model)
-
+            # Models that share ephemeral ancestors, possibly in other
+            # threads, share the CTEs built for them
+            new_prepended_ctes = manifest.ephemeral_ctes.get_or_build(
+                cte.id,
+                lambda: self._build_ephemeral_ctes(cte.id, manifest, extra_context),
+            )
             _extend_prepended_ctes(prepended_ctes, new_prepended_ctes)
 
-            new_cte_name = self.add_ephemeral_prefix(cte_model.name)
-            rendered_sql = cte_model._pre_injected_sql or cte_model.compiled_sql
-            sql = f" {new_cte_name} as (\n{rendered_sql}\n)"
-
-            _add_prepended_cte(prepended_ctes, InjectedCTE(id=cte.id, sql=sql))
-
         injected_sql = self._inject_ctes_into_sql(
             model.compiled_sql,
             prepended_ctes,
@@ -343,6 +430,45 @@ class Compiler:
 
         return model, prepended_ctes
 
+    def _build_ephemeral_ctes(
+        self,
+        unique_id: str,
+        manifest: Manifest,
+        extra_context: Optional[Dict[str, Any]],
+    ) -> List[InjectedCTE]:
+        """Return the CTEs to inject for the ephemeral model `unique_id`:
+        those of the ephemeral models it refers to, followed by its own,
+        compiling it first if it hasn't been compiled yet.
+        """
+        cte_model = manifest.nodes[unique_id]
+
+        # This model has already been compiled, so it's been
+        # through here before
+        if getattr(cte_model, "compiled", False):
+            assert isinstance(cte_model, tuple(COMPILED_TYPES.values()))
+            cte_model = cast(NonSourceCompiledNode, cte_model)
+            new_prepended_ctes = cte_model.extra_ctes
+
+        # if the cte_model isn't compiled, i.e. first time here
+        else:
+            # This is an ephemeral parsed model that we can compile.
+            # Compile and update the node
+            cte_model = self._compile_node(cte_model, manifest, extra_context)
+            # recursively call this method
+            cte_model, new_prepended_ctes = self._recursively_prepend_ctes(
+                cte_model, manifest, extra_context
+            )
+            # Save compiled SQL file and sync manifest
+            self._write_node(cte_model)
+            manifest.sync_update_node(cte_model)
+
+        ctes = list(new_prepended_ctes)
+        new_cte_name = self.add_ephemeral_prefix(cte_model.name)
+        rendered_sql = cte_model._pre_injected_sql or cte_model.compiled_sql
+        sql = f" {new_cte_name} as (\n{rendered_sql}\n)"
+        _add_prepended_cte(ctes, InjectedCTE(id=unique_id, sql=sql))
+        return ctes
+
     # creates a compiled_node from the ManifestNode passed in,
     # creates a "context" dictionary for jinja rendering,
     # and then renders the "compiled_sql" using the node, the
@@ -439,37 +565,65 @@ class Compiler:
         #  \/       |  test2 ----|  |
         # test1 ----|---------------|
 
-        for node_id in linker.graph:
-            # If node is executable (in manifest.nodes) and does _not_
-            # represent a test, continue.
-            if (
-                node_id in manifest.nodes
-                and manifest.nodes[node_id].resource_type != NodeType.Test
-            ):
-                # Get *everything* upstream of the node
-                all_upstream_nodes = nx.traversal.bfs_tree(linker.graph, node_id, reverse=True)
-                # Get the set of upstream nodes not including the current node.
-                upstream_nodes = set([n for n in all_upstream_nodes if n != node_id])
-
-                # Get all tests that depend on any upstream nodes.
-                upstream_tests = []
-                for upstream_node in upstream_nodes:
-                    upstream_tests += _get_tests_for_node(manifest, upstream_node)
-
-                for upstream_test in upstream_tests:
-                    # Get the set of all nodes that the test depends on
-                    # including the upstream_node itself. This is necessary
-                    # because tests can depend on multiple nodes (ex:
-                    # relationship tests). Test nodes do not distinguish
-                    # between what node the test is "testing" and what
-                    # node(s) it depends on.
-                    test_depends_on = set(manifest.nodes[upstream_test].depends_on_nodes)
-
-                    # If the set of nodes that an upstream test depends on
-                    # is a subset of all upstream nodes of the current node,
-                    # add an edge from the upstream test to the current node.
-                    if test_depends_on.issubset(upstream_nodes):
-                        linker.graph.add_edge(upstream_test, node_id)
+        # Rather than walking the ancestors of every node, the descendants
+        # of every node are computed once, in reverse topological order, as
+        # bitsets over the nodes' positions in that order. A test is then
+        # upstream of the executable nodes that descend from every node it
+        # depends on.
+        graph = linker.graph
+        order = list(nx.topological_sort(graph))
+        position = {node_id: index for index, node_id in enumerate(order)}
+        executable = _bitset(
+            position[node_id]
+            for node_id in order
+            if node_id in manifest.nodes and manifest.nodes[node_id].resource_type != NodeType.Test
+        )
+
+        # the tests to add edges from, by the nodes they depend on. Tests
+        # that depend on a node outside of the graph can't be upstream of
+        # anything.
+        tests_by_node: Dict[UniqueID, List[UniqueID]] = defaultdict(list)
+        remaining_deps: Dict[UniqueID, int] = {}
+        for node_id in order:
+            for test_id in _get_tests_for_node(manifest, node_id):
+                if test_id in remaining_deps:
+                    continue
+                test_depends_on = set(manifest.nodes[test_id].depends_on_nodes)
+                if not all(depends_on in position for depends_on in test_depends_on):
+                    continue
+                remaining_deps[test_id] = len(test_depends_on)
+                for depends_on in test_depends_on:
+                    tests_by_node[depends_on].append(test_id)
+
+        test_edges: List[Tuple[UniqueID, UniqueID]] = []
+        # the nodes downstream of every node the test depends on so far
+        downstream_of_test: Dict[UniqueID, int] = {}
+        # the descendants of nodes whose parents haven't all been visited yet
+        descendants: Dict[UniqueID, int] = {}
+        unvisited_parents = {node_id: graph.in_degree(node_id) for node_id in order}
+        for node_id in reversed(order):
+            node_descendants = 0
+            for child_id in graph.successors(node_id):
+                node_descendants |= descendants[child_id] | (1 << position[child_id])
+                unvisited_parents[child_id] -= 1
+                if unvisited_parents[child_id] == 0:
+                    del descendants[child_id]
+            if unvisited_parents[node_id]:
+                descendants[node_id] = node_descendants
+
+            for test_id in tests_by_node.get(node_id, []):
+                if test_id in downstream_of_test:
+                    downstream_of_test[test_id] &= node_descendants
+                else:
+                    downstream_of_test[test_id] = node_descendants
+                remaining_deps[test_id] -= 1
+                if remaining_deps[test_id] == 0:
+                    downstream = downstream_of_test.pop(test_id) & executable
+                    test_edges.extend(
+                        (test_id, order[index]) for index in _bit_positions(downstream)
+                    )
+
+        graph.add_edges_from(test_edges)
 
     def compile(self, manifest: Manifest, write=True, add_test_edges=False) -> Graph:
         self.initialize()
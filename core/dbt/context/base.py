@@ -1,6 +1,6 @@
 import json
 import os
-from typing import Any, Dict, NoReturn, Optional, Mapping
+from typing import Any, Dict, NoReturn, Optional, Mapping, Set, Tuple
 
 from dbt import flags
 from dbt import tracking
@@ -14,7 +14,7 @@ from dbt.exceptions import (
     disallow_secret_env_var,
 )
 from dbt.logger import SECRET_ENV_PREFIX
-from dbt.events.functions import fire_event, get_invocation_id
+from dbt.events.functions import fire_event, flush_log_writer, get_invocation_id
 from dbt.events.types import MacroEventInfo, MacroEventDebug
 from dbt.version import __version__ as dbt_version
 
@@ -86,9 +86,10 @@ def get_context_modules() -> Dict[str, Dict[str, Any]]:
 
 
 class ContextMember:
-    def __init__(self, value, name=None):
+    def __init__(self, value, name=None, shared=False):
         self.name = name
         self.inner = value
+        self.shared = shared
 
     def key(self, default):
         if self.name is None:
@@ -108,25 +109,43 @@ def contextproperty(value):
     return ContextMember(property(value))
 
 
+def sharedcontextproperty(value):
+    """A contextproperty whose value only depends on the config, so it is
+    computed once and shared by every context built with the same config
+    during an invocation, instead of once per context.
+    """
+    if isinstance(value, str):
+        return lambda v: ContextMember(property(v), name=value, shared=True)
+    return ContextMember(property(value), shared=True)
+
+
 class ContextMeta(type):
     def __new__(mcls, name, bases, dct):
         context_members = {}
         context_attrs = {}
+        shared_members = set()
         new_dct = {}
 
         for base in bases:
             context_members.update(getattr(base, "_context_members_", {}))
             context_attrs.update(getattr(base, "_context_attrs_", {}))
+            shared_members.update(getattr(base, "_shared_context_members_", set()))
 
         for key, value in dct.items():
             if isinstance(value, ContextMember):
                 context_key = value.key(key)
                 context_members[context_key] = value.inner
                 context_attrs[context_key] = key
+                # static methods are the same for every context, too
+                if value.shared or isinstance(value.inner, staticmethod):
+                    shared_members.add(context_key)
+                else:
+                    shared_members.discard(context_key)
                 value = value.inner
             new_dct[key] = value
         new_dct["_context_members_"] = context_members
         new_dct["_context_attrs_"] = context_attrs
+        new_dct["_shared_context_members_"] = frozenset(shared_members)
         return type.__new__(mcls, name, bases, new_dct)
 
 
@@ -143,7 +162,14 @@ class Var:
         self._context: Mapping[str, Any] = context
         self._cli_vars: Mapping[str, Any] = cli_vars
         self._node: Optional[CompiledResource] = node
-        self._merged: Mapping[str, Any] = self._generate_merged()
+        self._merged_vars: Optional[Mapping[str, Any]] = None
+
+    @property
+    def _merged(self) -> Mapping[str, Any]:
+        # most nodes never call var(), so only merge the vars on first use
+        if self._merged_vars is None:
+            self._merged_vars = self._generate_merged()
+        return self._merged_vars
 
     def _generate_merged(self) -> Mapping[str, Any]:
         return self._cli_vars
@@ -181,16 +207,57 @@ class Var:
             return self.get_missing_var(var_name)
 
 
+# The shared context members (see sharedcontextproperty) of each context
+# class, with the config and invocation they were computed for.
+_shared_builtins: Tuple[Any, Optional[str], Dict[type, Dict[str, Any]]] = (None, None, {})
+
+
+def _copy_dicts(value: Any) -> Any:
+    # the shared members are computed once, but every context gets its own copy
+    # of the dictionaries in them, as it did when they were computed per context,
+    # so that a macro changing e.g. `target` only changes it for its own node
+    if isinstance(value, dict):
+        return type(value)((key, _copy_dicts(item)) for key, item in value.items())
+    return value
+
+
 class BaseContext(metaclass=ContextMeta):
+    # set by ContextMeta
+    _context_members_: Dict[str, Any]
+    _context_attrs_: Dict[str, Any]
+    _shared_context_members_: Set[str]
+
     # subclass is TargetContext
     def __init__(self, cli_vars):
-        self._ctx = {}
+        self._ctx: Dict[str, Any] = {}
         self.cli_vars = cli_vars
         self.env_vars = {}
 
+    def _get_shared_builtins(self) -> Dict[str, Any]:
+        global _shared_builtins
+        config = getattr(self, "config", None)
+        invocation_id = get_invocation_id()
+        shared_config, shared_invocation_id, by_class = _shared_builtins
+        if shared_config is not config or shared_invocation_id != invocation_id:
+            by_class = {}
+            _shared_builtins = (config, invocation_id, by_class)
+        cls = type(self)
+        if cls not in by_class:
+            by_class[cls] = {
+                key: self._context_members_[key].__get__(self)
+                for key in self._shared_context_members_
+            }
+        return by_class[cls]
+
     def generate_builtins(self):
-        builtins: Dict[str, Any] = {}
+        # the members that are the same for every context are only computed
+        # for the first one, then copied into the others
+        builtins: Dict[str, Any] = {
+            key: _copy_dicts(value) for key, value in self._get_shared_builtins().items()
+        }
         for key, value in self._context_members_.items():
+            if key in builtins:
+                continue
             if hasattr(value, "__get__"):
                 # handle properties, bound methods, etc
                 value = value.__get__(self)
@@ -205,7 +272,7 @@ class BaseContext(metaclass=ContextMeta):
         self._ctx.update(builtins)
         return self._ctx
 
-    @contextproperty
+    @sharedcontextproperty
     def dbt_version(self) -> str:
         """The `dbt_version` variable returns the installed version of dbt that
         is currently running. It can be used for debugging or auditing
@@ -513,7 +580,7 @@ class BaseContext(metaclass=ContextMeta):
         """
         return get_invocation_id()
 
-    @contextproperty
+    @sharedcontextproperty
     def modules(self) -> Dict[str, Any]:
         """The `modules` variable in the Jinja context contains useful Python
         modules for operating on data.
@@ -538,7 +605,7 @@ class BaseContext(metaclass=ContextMeta):
         """  # noqa
         return get_context_modules()
 
-    @contextproperty
+    @sharedcontextproperty
     def flags(self) -> Any:
         """The `flags` variable contains true/false values for flags provided
         on the command line.
@@ -569,6 +636,8 @@ class BaseContext(metaclass=ContextMeta):
               {{ print("Running some_macro: " ~ arg1 ~ ", " ~ arg2) }}
             {% endmacro %}"
         """
+        # keep the output in order with log lines still waiting to be written
+        flush_log_writer()
         print(msg)
         return ""
 
@@ -6,7 +6,7 @@ from dbt.logger import SECRET_ENV_PREFIX
 from dbt.node_types import NodeType
 from dbt.utils import MultiDict
 
-from dbt.context.base import contextproperty, contextmember, Var
+from dbt.context.base import contextproperty, contextmember, sharedcontextproperty, Var
 from dbt.context.target import TargetContext
 from dbt.exceptions import raise_parsing_error, disallow_secret_env_var
 
@@ -18,7 +18,7 @@ class ConfiguredContext(TargetContext):
     def __init__(self, config: AdapterRequiredConfig) -> None:
         super().__init__(config, config.cli_vars)
 
-    @contextproperty
+    @sharedcontextproperty
     def project_name(self) -> str:
         return self.config.project_name
 
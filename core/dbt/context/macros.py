@@ -1,4 +1,16 @@
-from typing import Any, Dict, Iterable, Union, Optional, List, Iterator, Mapping, Set
+from typing import (
+    AbstractSet,
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Union,
+    Optional,
+    List,
+    Iterator,
+    Mapping,
+    Set,
+)
 
 from dbt.clients.jinja import MacroGenerator, MacroStack
 from dbt.contracts.graph.parsed import ParsedMacro
@@ -6,9 +18,115 @@ from dbt.include.global_project import PROJECT_NAME as GLOBAL_PROJECT_NAME
 from dbt.exceptions import raise_duplicate_macro_name, raise_compiler_error
 
 
-FlatNamespace = Dict[str, MacroGenerator]
+FlatNamespace = Mapping[str, MacroGenerator]
 NamespaceMember = Union[FlatNamespace, MacroGenerator]
-FullNamespace = Dict[str, NamespaceMember]
+FullNamespace = Mapping[str, NamespaceMember]
+MacroIndexNamespace = Dict[str, ParsedMacro]
+
+
+# The macros of a manifest, by package and by name, sorted into the
+# namespaces that a MacroNamespace searches. None of that depends on the
+# node a context is built for, so a single index is shared by every
+# context built for a manifest (see get_macro_index), and each
+# MacroNamespace only creates the MacroGenerators its node calls.
+class MacroIndex:
+    def __init__(self, root_package: str, internal_packages: List[str]) -> None:
+        self.root_package = root_package
+        # internal packages comes from get_adapter_package_names
+        self.internal_package_names = set(internal_packages)
+        self.internal_package_names_order = internal_packages
+        # [package name][macro name] = ParsedMacro
+        self.internal_packages: Dict[str, MacroIndexNamespace] = {}
+        self.packages: Dict[str, MacroIndexNamespace] = {}
+        self._global_project_namespace: Optional[MacroIndexNamespace] = None
+        # the names a MacroNamespace has, by search package
+        self._names: Dict[str, FrozenSet[str]] = {}
+
+    def _add_macro_to(
+        self,
+        hierarchy: Dict[str, MacroIndexNamespace],
+        macro: ParsedMacro,
+    ):
+        if macro.package_name in hierarchy:
+            namespace = hierarchy[macro.package_name]
+        else:
+            namespace = {}
+            hierarchy[macro.package_name] = namespace
+
+        if macro.name in namespace:
+            raise_duplicate_macro_name(namespace[macro.name], macro, macro.package_name)
+        namespace[macro.name] = macro
+
+    def add_macro(self, macro: ParsedMacro):
+        # internal macros (from plugins) will be processed separately from
+        # project macros, so store them in a different place
+        if macro.package_name in self.internal_package_names:
+            self._add_macro_to(self.internal_packages, macro)
+            self._global_project_namespace = None
+        else:
+            self._add_macro_to(self.packages, macro)
+        self._names.clear()
+
+    def add_macros(self, macros: Iterable[ParsedMacro]):
+        for macro in macros:
+            self.add_macro(macro)
+
+    @property
+    def global_project_namespace(self) -> MacroIndexNamespace:
+        if self._global_project_namespace is None:
+            # Iterate in reverse-order and overwrite: the packages that are
+            # first in the list are the ones we want to "win".
+            namespace: MacroIndexNamespace = {}
+            for pkg in reversed(self.internal_package_names_order):
+                if pkg in self.internal_packages:
+                    namespace.update(self.internal_packages[pkg])
+            self._global_project_namespace = namespace
+        return self._global_project_namespace
+
+    def names(self, search_package: str) -> FrozenSet[str]:
+        if search_package not in self._names:
+            names: Set[str] = set(self.packages.get(search_package, {}))
+            names.update(self.packages.get(self.root_package, {}))
+            names.update(self.packages)
+            names.add(GLOBAL_PROJECT_NAME)
+            names.update(self.global_project_namespace)
+            self._names[search_package] = frozenset(names)
+        return self._names[search_package]
+
+
+def get_macro_index(manifest, root_package: str, internal_packages: List[str]) -> MacroIndex:
+    """Get the MacroIndex of the manifest's macros. It is kept with the
+    manifest's macro lookup, so it is rebuilt along with it when macros are
+    added or replaced.
+    """
+    indexes = manifest.macro_lookup.namespace_indexes
+    key = (root_package, tuple(internal_packages))
+    if key in indexes:
+        return indexes[key]
+    index = MacroIndex(root_package, internal_packages)
+    index.add_macros(manifest.macros.values())
+    indexes[key] = index
+    return index
+
+
+# The macros of one package, by name, as MacroGenerators that are created by
+# the MacroNamespace the first time they are looked up.
+class LazyFlatNamespace(Mapping):
+    def __init__(self, macros: MacroIndexNamespace, namespace: "MacroNamespace") -> None:
+        self._macros = macros
+        self._namespace = namespace
+
+    def __getitem__(self, key: str) -> MacroGenerator:
+        return self._namespace.get_macro_generator(self._macros[key])
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._macros
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._macros)
+
+    def __len__(self) -> int:
+        return len(self._macros)
 
 
 # The point of this class is to collect the various macros
@@ -19,18 +137,50 @@ FullNamespace = Dict[str, NamespaceMember]
 # depends on the package of the node, so it only works for one
 # particular local package at a time for "flattening" into a context.
 # 'get_by_package' should work for any macro.
+# The MacroGenerator for a macro is only created when it is looked up, and
+# is then reused for the rest of the life of the namespace.
 class MacroNamespace(Mapping):
     def __init__(
         self,
-        global_namespace: FlatNamespace,  # root package macros
-        local_namespace: FlatNamespace,  # packages for *this* node
-        global_project_namespace: FlatNamespace,  # internal packages
-        packages: Dict[str, FlatNamespace],  # non-internal packages
+        index: MacroIndex,
+        search_package: str,
+        ctx: Dict[str, Any],
+        node: Optional[Any] = None,
+        thread_ctx: Optional[MacroStack] = None,
     ):
-        self.global_namespace: FlatNamespace = global_namespace
-        self.local_namespace: FlatNamespace = local_namespace
-        self.packages: Dict[str, FlatNamespace] = packages
-        self.global_project_namespace: FlatNamespace = global_project_namespace
+        self.index = index
+        self.ctx = ctx
+        self.node = node
+        self.thread_ctx = thread_ctx
+        self._generators: Dict[str, MacroGenerator] = {}
+        self._names = index.names(search_package)
+
+        # the package for *this* node, unless it is an internal package
+        local_macros = index.packages.get(search_package, {})
+        # the root package, which overrides everything else except local
+        # external package macro calls
+        global_macros: MacroIndexNamespace = {}
+        if search_package != index.root_package:
+            global_macros = index.packages.get(index.root_package, {})
+        self.global_namespace: FlatNamespace = LazyFlatNamespace(global_macros, self)
+        self.local_namespace: FlatNamespace = LazyFlatNamespace(local_macros, self)
+        self.packages: Dict[str, FlatNamespace] = {
+            package_name: LazyFlatNamespace(macros, self)
+            for package_name, macros in index.packages.items()
+        }
+        self.global_project_namespace: FlatNamespace = LazyFlatNamespace(
+            index.global_project_namespace, self
+        )
+
+    def get_macro_generator(self, macro: ParsedMacro) -> MacroGenerator:
+        if macro.unique_id not in self._generators:
+            # MacroGenerator is in clients/jinja.py
+            # a MacroGenerator object is a callable object that will
+            # execute the MacroGenerator.__call__ function
+            self._generators[macro.unique_id] = MacroGenerator(
+                macro, self.ctx, self.node, self.thread_ctx
+            )
+        return self._generators[macro.unique_id]
 
     def _search_order(self) -> Iterable[Union[FullNamespace, FlatNamespace]]:
         yield self.local_namespace  # local package
@@ -45,12 +195,9 @@ class MacroNamespace(Mapping):
 
     # provides special keys method for MacroNamespace iterator
     # returns keys from local_namespace, global_namespace, packages,
-    # global_project_namespace
-    def _keys(self) -> Set[str]:
-        keys: Set[str] = set()
-        for search in self._search_order():
-            keys.update(search)
-        return keys
+    # global_project_namespace, as computed by the index for this package
+    def _keys(self) -> AbstractSet[str]:
+        return self._names
 
     # special iterator using special keys
     def __iter__(self) -> Iterator[str]:
@@ -66,6 +213,9 @@ class MacroNamespace(Mapping):
                 return dct[key]
         raise KeyError(key)
 
+    def __contains__(self, key: object) -> bool:
+        return key in self._names
+
     def get_from_package(self, package_name: Optional[str], name: str) -> Optional[MacroGenerator]:
         pkg: FlatNamespace
         if package_name is None:
@@ -78,9 +228,9 @@ class MacroNamespace(Mapping):
             raise_compiler_error(f"Could not find package '{package_name}'")
 
 
-# This class builds the MacroNamespace by adding macros to
-# internal_packages or packages, and locals/globals.
-# Call 'build_namespace' to return a MacroNamespace.
+# This class builds the MacroNamespace by adding macros to a MacroIndex.
+# Call 'build_namespace' to return a MacroNamespace, or
+# 'build_namespace_from_index' to use an index that has already been built.
 # This is used by ManifestContext (and subclasses)
 class MacroNamespaceBuilder:
     def __init__(
@@ -93,80 +243,22 @@ class MacroNamespaceBuilder:
     ) -> None:
         self.root_package = root_package
         self.search_package = search_package
-        # internal packages comes from get_adapter_package_names
-        self.internal_package_names = set(internal_packages)
-        self.internal_package_names_order = internal_packages
-        # macro_func is added here if in root package, since
-        # the root package acts as a "global" namespace, overriding
-        # everything else except local external package macro calls
-        self.globals: FlatNamespace = {}
-        # macro_func is added here if it's the package for this node
-        self.locals: FlatNamespace = {}
-        # Create a dictionary of [package name][macro name] =
-        #     MacroGenerator object which acts like a function
-        self.internal_packages: Dict[str, FlatNamespace] = {}
-        self.packages: Dict[str, FlatNamespace] = {}
+        self.internal_packages = internal_packages
+        self.index = MacroIndex(root_package, internal_packages)
         self.thread_ctx = thread_ctx
         self.node = node
 
-    def _add_macro_to(
-        self,
-        hierarchy: Dict[str, FlatNamespace],
-        macro: ParsedMacro,
-        macro_func: MacroGenerator,
-    ):
-        if macro.package_name in hierarchy:
-            namespace = hierarchy[macro.package_name]
-        else:
-            namespace = {}
-            hierarchy[macro.package_name] = namespace
-
-        if macro.name in namespace:
-            raise_duplicate_macro_name(macro_func.macro, macro, macro.package_name)
-        hierarchy[macro.package_name][macro.name] = macro_func
-
     def add_macro(self, macro: ParsedMacro, ctx: Dict[str, Any]):
-        macro_name: str = macro.name
-
-        # MacroGenerator is in clients/jinja.py
-        # a MacroGenerator object is a callable object that will
-        # execute the MacroGenerator.__call__ function
-        macro_func: MacroGenerator = MacroGenerator(macro, ctx, self.node, self.thread_ctx)
-
-        # internal macros (from plugins) will be processed separately from
-        # project macros, so store them in a different place
-        if macro.package_name in self.internal_package_names:
-            self._add_macro_to(self.internal_packages, macro, macro_func)
-        else:
-            # if it's not an internal package
-            self._add_macro_to(self.packages, macro, macro_func)
-            # add to locals if it's the package this node is in
-            if macro.package_name == self.search_package:
-                self.locals[macro_name] = macro_func
-            # add to globals if it's in the root package
-            elif macro.package_name == self.root_package:
-                self.globals[macro_name] = macro_func
+        self.index.add_macro(macro)
 
     def add_macros(self, macros: Iterable[ParsedMacro], ctx: Dict[str, Any]):
-        for macro in macros:
-            self.add_macro(macro, ctx)
+        self.index.add_macros(macros)
 
     def build_namespace(
         self, macros: Iterable[ParsedMacro], ctx: Dict[str, Any]
     ) -> MacroNamespace:
         self.add_macros(macros, ctx)
+        return self.build_namespace_from_index(self.index, ctx)
 
-        # Iterate in reverse-order and overwrite: the packages that are first
-        # in the list are the ones we want to "win".
-        global_project_namespace: FlatNamespace = {}
-        for pkg in reversed(self.internal_package_names_order):
-            if pkg in self.internal_packages:
-                # add the macros pointed to by this package name
-                global_project_namespace.update(self.internal_packages[pkg])
-
-        return MacroNamespace(
-            global_namespace=self.globals,  # root package macros
-            local_namespace=self.locals,  # packages for *this* node
-            global_project_namespace=global_project_namespace,  # internal packages
-            packages=self.packages,  # non internal_packages
-        )
+    def build_namespace_from_index(self, index: MacroIndex, ctx: Dict[str, Any]) -> MacroNamespace:
+        return MacroNamespace(index, self.search_package, ctx, self.node, self.thread_ctx)
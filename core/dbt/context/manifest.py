@@ -1,13 +1,13 @@
 from typing import List
 
-from dbt.clients.jinja import MacroStack
+from dbt.clients.jinja import LazyContext, MacroStack
 from dbt.contracts.connection import AdapterRequiredConfig
 from dbt.contracts.graph.manifest import Manifest
 from dbt.context.macro_resolver import TestMacroNamespace
 
 
 from .configured import ConfiguredContext
-from .macros import MacroNamespaceBuilder
+from .macros import MacroNamespaceBuilder, get_macro_index
 
 
 class ManifestContext(ConfiguredContext):
@@ -26,6 +26,9 @@ class ManifestContext(ConfiguredContext):
         search_package: str,
     ) -> None:
         super().__init__(config)
+        # macros are looked up in the namespace when they are first used,
+        # rather than all being added to the context
+        self._ctx = LazyContext(self._ctx)
         self.manifest = manifest
         # this is the package of the node for which this context was built
         self.search_package = search_package
@@ -36,10 +39,11 @@ class ManifestContext(ConfiguredContext):
         self.namespace = self._build_namespace()
 
     def _build_namespace(self):
-        # this takes all the macros in the manifest and adds them
-        # to the MacroNamespaceBuilder stored in self.namespace
+        # this builds the namespace stored in self.namespace over the index
+        # of the manifest's macros, which is shared by all of its contexts
         builder = self._get_namespace_builder()
-        return builder.build_namespace(self.manifest.macros.values(), self._ctx)
+        index = get_macro_index(self.manifest, builder.root_package, builder.internal_packages)
+        return builder.build_namespace_from_index(index, self._ctx)
 
     def _get_namespace_builder(self) -> MacroNamespaceBuilder:
         # avoid an import loop
@@ -63,7 +67,12 @@ class ManifestContext(ConfiguredContext):
             dct.update(self.namespace.local_namespace)
             dct.update(self.namespace.project_namespace)
         else:
-            dct.update(self.namespace)
+            # Only the macros that override other context values are added
+            # to the dictionary, the rest are found through the namespace
+            for key in list(dct):
+                if key in self.namespace:
+                    dct[key] = self.namespace[key]
+            dct.fallback = self.namespace
         return dct
 
 
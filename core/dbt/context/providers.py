@@ -19,7 +19,7 @@ from dbt.adapters.factory import get_adapter, get_adapter_package_names, get_ada
 from dbt.clients import agate_helper
 from dbt.clients.jinja import get_rendered, MacroGenerator, MacroStack
 from dbt.config import RuntimeConfig, Project
-from .base import contextmember, contextproperty, Var
+from .base import contextmember, contextproperty, sharedcontextproperty, Var
 from .configured import FQNLookup
 from .context_config import ContextConfig
 from dbt.logger import SECRET_ENV_PREFIX
@@ -968,7 +968,7 @@ class ProviderContext(ManifestContext):
     def column(self) -> Type[Column]:
         return self.adapter.Column
 
-    @contextproperty
+    @sharedcontextproperty
     def env(self) -> Dict[str, Any]:
         return self.target
 
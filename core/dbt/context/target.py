@@ -2,7 +2,7 @@ from typing import Any, Dict
 
 from dbt.contracts.connection import HasCredentials
 
-from dbt.context.base import BaseContext, contextproperty
+from dbt.context.base import BaseContext, sharedcontextproperty
 
 
 class TargetContext(BaseContext):
@@ -11,7 +11,7 @@ class TargetContext(BaseContext):
         super().__init__(cli_vars=cli_vars)
         self.config = config
 
-    @contextproperty
+    @sharedcontextproperty
     def target(self) -> Dict[str, Any]:
         """`target` contains information about your connection to the warehouse
         (specified in profiles.yml). Some configs are shared between all
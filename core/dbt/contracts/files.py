@@ -2,7 +2,7 @@ import hashlib
 import os
 from dataclasses import dataclass, field
 from mashumaro.types import SerializableType
-from typing import List, Optional, Union, Dict, Any
+from typing import List, Optional, Union, Dict, Any, NamedTuple
 
 from dbt.dataclass_schema import dbtClassMixin, StrEnum
 
@@ -46,6 +46,7 @@ class FilePath(dbtClassMixin):
     relative_path: str
     modification_time: float
     project_root: str
+    file_size: Optional[int] = None
 
     @property
     def search_key(self) -> str:
@@ -69,7 +70,22 @@ class FilePath(dbtClassMixin):
 
     def seed_too_large(self) -> bool:
         """Return whether the file this represents is over the seed size limit"""
-        return os.stat(self.full_path).st_size > MAXIMUM_SEED_SIZE
+        file_size = self.file_size
+        if file_size is None:
+            file_size = os.stat(self.full_path).st_size
+        return file_size > MAXIMUM_SEED_SIZE
+
+    def unchanged_since(self, other: Union["FilePath", "SavedFileStat"]) -> bool:
+        """Return whether the file's size and modification time are the same
+        as when `other` was found, so that its contents can be assumed to be
+        unchanged.
+        """
+        return (
+            self.modification_time != 0.0
+            and self.file_size is not None
+            and self.modification_time == other.modification_time
+            and self.file_size == other.file_size
+        )
 
 
 @dataclass
@@ -316,3 +332,25 @@ class SchemaSourceFile(BaseSourceFile):
 
 
 AnySourceFile = Union[SchemaSourceFile, SourceFile]
+
+
+class SavedFileStat(NamedTuple):
+    """What read_files needs from a source file in the saved manifest to tell
+    whether the file on disk has changed since it was parsed.
+    """
+
+    parse_file_type: Optional[ParseFileType]
+    modification_time: float
+    file_size: Optional[int]
+    checksum: FileHash
+
+    @classmethod
+    def from_source_file(cls, source_file: AnySourceFile) -> Optional["SavedFileStat"]:
+        if not isinstance(source_file.path, FilePath):
+            return None
+        return cls(
+            parse_file_type=source_file.parse_file_type,
+            modification_time=source_file.path.modification_time,
+            file_size=source_file.path.file_size,
+            checksum=source_file.checksum,
+        )
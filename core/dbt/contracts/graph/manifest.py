@@ -1,4 +1,5 @@
 import enum
+import threading
 from dataclasses import dataclass, field
 from itertools import chain, islice
 from mashumaro import DataClassMessagePackMixin
@@ -25,6 +26,7 @@ from uuid import UUID
 
 from dbt.contracts.graph.compiled import (
     CompileResultNode,
+    InjectedCTE,
     ManifestNode,
     NonSourceCompiledNode,
     GraphMemberNode,
@@ -223,6 +225,36 @@ class AnalysisLookup(RefableLookup):
     _lookup_types: ClassVar[set] = set([NodeType.Analysis])
 
 
+class EphemeralCTECache:
+    """The CTEs to inject for each ephemeral model: those of the ephemeral
+    models it refers to, followed by its own. Each entry is built once per
+    manifest, by the first thread that needs it, and any other thread that
+    needs it meanwhile waits for that instead of compiling the model again.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._node_locks: Dict[UniqueID, threading.Lock] = {}
+        self.storage: Dict[UniqueID, List[InjectedCTE]] = {}
+
+    def get_or_build(
+        self, unique_id: UniqueID, build: Callable[[], List[InjectedCTE]]
+    ) -> List[InjectedCTE]:
+        ctes = self.storage.get(unique_id)
+        if ctes is not None:
+            return ctes
+        with self._lock:
+            node_lock = self._node_locks.setdefault(unique_id, threading.Lock())
+        # building an entry only ever waits on the entries of the model's
+        # ephemeral ancestors, so threads can't deadlock on these locks
+        with node_lock:
+            ctes = self.storage.get(unique_id)
+            if ctes is None:
+                ctes = build()
+                self.storage[unique_id] = ctes
+        return ctes
+
+
 def _search_packages(
     current_project: str,
     node_package: str,
@@ -417,6 +449,57 @@ def _get_locality(
         return Locality.Imported
 
 
+class MacroLookup(dbtClassMixin):
+    """An index of macros by name. The candidates for a name, with their
+    locality, are computed on the first search for each root project and
+    adapter type, and reused after that.
+    """
+
+    def __init__(self, macros: Mapping[str, ParsedMacro]):
+        # the dictionary this lookup was built from, used to detect when the
+        # macros have been replaced and the lookup must be rebuilt
+        self.macros = macros
+        self.storage: Dict[str, List[ParsedMacro]] = {}
+        self._candidates: Dict[str, Dict[Tuple[str, Optional[str]], List[MacroCandidate]]] = {}
+        # the MacroIndex used to build the macro namespaces of contexts, by
+        # root project and internal packages (see dbt.context.macros)
+        self.namespace_indexes: Dict[Tuple[str, Tuple[str, ...]], Any] = {}
+        self.populate(macros)
+
+    def add_macro(self, macro: ParsedMacro):
+        if macro.name not in self.storage:
+            self.storage[macro.name] = []
+        self.storage[macro.name].append(macro)
+        # the localities must be recomputed to include this macro
+        self._candidates.pop(macro.name, None)
+        self.namespace_indexes.clear()
+
+    def populate(self, macros: Mapping[str, ParsedMacro]):
+        for macro in macros.values():
+            self.add_macro(macro)
+
+    def get_candidates(
+        self, name: str, root_project_name: str, adapter_type: Optional[str]
+    ) -> List[MacroCandidate]:
+        if name not in self.storage:
+            return []
+        by_project = self._candidates.setdefault(name, {})
+        key = (root_project_name, adapter_type)
+        if key not in by_project:
+            # avoid an import cycle
+            from dbt.adapters.factory import get_adapter_package_names
+
+            packages = set(get_adapter_package_names(adapter_type))
+            by_project[key] = [
+                MacroCandidate(
+                    locality=_get_locality(macro, root_project_name, packages),
+                    macro=macro,
+                )
+                for macro in self.storage[name]
+            ]
+        return by_project[key]
+
+
 class Searchable(Protocol):
     resource_type: NodeType
     package_name: str
@@ -477,6 +560,16 @@ class MacroMethods:
     def __init__(self):
         self.macros = []
         self.metadata = {}
+        self._macro_lookup = None
+
+    @property
+    def macro_lookup(self) -> MacroLookup:
+        if self._macro_lookup is None or self._macro_lookup.macros is not self.macros:
+            self._macro_lookup = MacroLookup(self.macros)
+        return self._macro_lookup
+
+    def rebuild_macro_lookup(self):
+        self._macro_lookup = MacroLookup(self.macros)
 
     def find_macro_by_name(
         self, name: str, root_project_name: str, package: Optional[str]
@@ -531,18 +624,10 @@ class MacroMethods:
         filter: Optional[Callable[[MacroCandidate], bool]] = None,
     ) -> CandidateList:
         """Find macros by their name."""
-        # avoid an import cycle
-        from dbt.adapters.factory import get_adapter_package_names
-
         candidates: CandidateList = CandidateList()
-        packages = set(get_adapter_package_names(self.metadata.adapter_type))
-        for unique_id, macro in self.macros.items():
-            if macro.name != name:
-                continue
-            candidate = MacroCandidate(
-                locality=_get_locality(macro, root_project_name, packages),
-                macro=macro,
-            )
+        for candidate in self.macro_lookup.get_candidates(
+            name, root_project_name, self.metadata.adapter_type
+        ):
             if filter is None or filter(candidate):
                 candidates.append(candidate)
 
@@ -601,6 +686,9 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
     _analysis_lookup: Optional[AnalysisLookup] = field(
         default=None, metadata={"serialize": lambda x: None, "deserialize": lambda x: None}
     )
+    _macro_lookup: Optional[MacroLookup] = field(
+        default=None, metadata={"serialize": lambda x: None, "deserialize": lambda x: None}
+    )
     _parsing_info: ParsingInfo = field(
         default_factory=ParsingInfo,
         metadata={"serialize": lambda x: None, "deserialize": lambda x: None},
@@ -609,6 +697,10 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
         default_factory=flags.MP_CONTEXT.Lock,
         metadata={"serialize": lambda x: None, "deserialize": lambda x: None},
     )
+    _ephemeral_ctes: EphemeralCTECache = field(
+        default_factory=EphemeralCTECache,
+        metadata={"serialize": lambda x: None, "deserialize": lambda x: None},
+    )
 
     def __pre_serialize__(self):
         # serialization won't work with anything except an empty source_patches because
@@ -619,6 +711,7 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
     @classmethod
     def __post_deserialize__(cls, obj):
         obj._lock = flags.MP_CONTEXT.Lock()
+        obj._ephemeral_ctes = EphemeralCTECache()
         return obj
 
     def sync_update_node(self, new_node: NonSourceCompiledNode) -> NonSourceCompiledNode:
@@ -851,6 +944,10 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
             self._analysis_lookup = AnalysisLookup(self)
         return self._analysis_lookup
 
+    @property
+    def ephemeral_ctes(self) -> EphemeralCTECache:
+        return self._ephemeral_ctes
+
     # Called by dbt.parser.manifest._resolve_refs_for_exposure
     # and dbt.parser.manifest._process_refs_for_node
     def resolve_ref(
@@ -985,6 +1082,8 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
 
         self.macros[macro.unique_id] = macro
         source_file.macros.append(macro.unique_id)
+        if self._macro_lookup is not None:
+            self._macro_lookup.add_macro(macro)
 
     def has_file(self, source_file: SourceFile) -> bool:
         key = source_file.file_id
@@ -1074,6 +1173,7 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
             self._ref_lookup,
             self._disabled_lookup,
             self._analysis_lookup,
+            self._macro_lookup,
         )
         return self.__class__, args
 
@@ -1082,6 +1182,7 @@ class MacroManifest(MacroMethods):
     def __init__(self, macros):
         self.macros = macros
         self.metadata = ManifestMetadata()
+        self._macro_lookup = None
         # This is returned by the 'graph' context property
         # in the ProviderContext class.
         self.flat_graph = {}
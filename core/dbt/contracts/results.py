@@ -15,11 +15,12 @@ from dbt.logger import (
     TimingProcessor,
     JsonOnly,
 )
-from dbt.utils import lowercase
+from dbt.utils import lowercase, JSONEncoder
 from dbt.dataclass_schema import dbtClassMixin, StrEnum
 
 import agate
 
+import dataclasses
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import (
@@ -28,11 +29,12 @@ from typing import (
     List,
     Optional,
     Any,
+    Iterator,
     NamedTuple,
     Sequence,
 )
 
-from dbt.clients.system import write_json
+from dbt.clients.system import write_json, write_file_chunks
 
 
 @dataclass
@@ -486,3 +488,28 @@ class CatalogArtifact(CatalogResults, ArtifactMixin):
             errors=errors,
             _compile_results=compile_results,
         )
+
+    def write(self, path: str):
+        # the same json as write_json, but serialized and encoded one table at
+        # a time, rather than as one dictionary and string of the whole catalog
+        write_file_chunks(path, self._iterencode())
+
+    def _iterencode(self) -> Iterator[str]:
+        encoder = JSONEncoder()
+        dct = dataclasses.replace(self, nodes={}, sources={}).to_dict(omit_none=False)
+        yield "{"
+        for index, (key, value) in enumerate(dct.items()):
+            if index:
+                yield ", "
+            yield f"{encoder.encode(key)}: "
+            if key not in ("nodes", "sources"):
+                yield encoder.encode(value)
+                continue
+            yield "{"
+            for table_index, (unique_id, table) in enumerate(getattr(self, key).items()):
+                if table_index:
+                    yield ", "
+                yield f"{encoder.encode(unique_id)}: "
+                yield encoder.encode(table.to_dict(omit_none=False))
+            yield "}"
+        yield "}"
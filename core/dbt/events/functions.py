@@ -1,8 +1,19 @@
 import colorama
 from colorama import Style
 import dbt.events.functions as this  # don't worry I hate it too.
-from dbt.events.base_types import NoStdOut, Event, NoFile, ShowException, Cache
+from dbt.events.base_types import (
+    NoStdOut,
+    Event,
+    NoFile,
+    ShowException,
+    Cache,
+    TestLevel,
+    DebugLevel,
+    InfoLevel,
+    WarnLevel,
+)
 from dbt.events.types import EventBufferFull, T_Event, MainReportVersion, EmptyLine
+from dbt.helper_types import Lazy
 import dbt.flags as flags
 
 # TODO this will need to move eventually
@@ -19,7 +30,11 @@ from logging.handlers import RotatingFileHandler
 import os
 import uuid
 import threading
-from typing import Any, Dict, List, Optional, Union
+import atexit
+import functools
+import queue
+import traceback
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Type, Union
 from collections import deque
 
 global LOG_VERSION
@@ -50,6 +65,15 @@ format_color = True
 format_json = False
 invocation_id: Optional[str] = None
 
+# the background writer used when `--async-logging` is passed, see setup_event_logger
+LOG_WRITER: Optional["AsyncLogWriter"] = None
+# the most events waiting to be written before fire_event blocks the thread firing them
+LOG_QUEUE_SIZE = 10000
+# the most events the background writer formats and writes in one go
+LOG_BATCH_SIZE = 500
+# messages longer than this are cut short in the records of `--compact-event-history`
+EVENT_RECORD_MESSAGE_LENGTH = 256
+
 # Colorama needs some help on windows because we're using logger.info
 # intead of print(). If the Windows env doesn't have a TERM var set,
 # then we should override the logging stream to use the colorama
@@ -116,6 +140,10 @@ def setup_event_logger(log_path, level_override=None):
     this.FILE_LOG.handlers.clear()
     this.FILE_LOG.addHandler(file_handler)
 
+    stop_log_writer()
+    if flags.ASYNC_LOGGING:
+        this.LOG_WRITER = AsyncLogWriter()
+
 
 # used for integration tests
 def capture_stdout_logs() -> StringIO:
@@ -151,7 +179,7 @@ def scrub_secrets(msg: str, secrets: List[str]) -> str:
 # returns a dictionary representation of the event fields.
 # the message may contain secrets which must be scrubbed at the usage site.
 def event_to_serializable_dict(
-    e: T_Event,
+    e: T_Event, ts: Optional[datetime] = None, thread_name: Optional[str] = None
 ) -> Dict[str, Any]:
 
     log_line = dict()
@@ -171,13 +199,13 @@ def event_to_serializable_dict(
     event_dict = {
         "type": "log_line",
         "log_version": LOG_VERSION,
-        "ts": get_ts_rfc3339(),
+        "ts": get_ts_rfc3339(ts),
         "pid": e.get_pid(),
         "msg": e.message(),
         "level": e.level_tag(),
         "data": log_line,
         "invocation_id": e.get_invocation_id(),
-        "thread_name": e.get_thread_name(),
+        "thread_name": e.get_thread_name() if thread_name is None else thread_name,
         "code": e.code,
     }
 
@@ -186,52 +214,95 @@ def event_to_serializable_dict(
 
 # translates an Event to a completely formatted text-based log line
 # type hinting everything as strings so we don't get any unintentional string conversions via str()
-def create_info_text_log_line(e: T_Event) -> str:
+# ts and thread_name default to now and the current thread, the background log writer passes
+# the ones captured when the event was fired.
+def create_info_text_log_line(e: T_Event, ts: Optional[datetime] = None) -> str:
     color_tag: str = "" if this.format_color else Style.RESET_ALL
-    ts: str = get_ts().strftime("%H:%M:%S")
+    ts_str: str = (ts or get_ts()).strftime("%H:%M:%S")
     scrubbed_msg: str = scrub_secrets(e.message(), env_secrets())
-    log_line: str = f"{color_tag}{ts}  {scrubbed_msg}"
+    log_line: str = f"{color_tag}{ts_str}  {scrubbed_msg}"
     return log_line
 
 
-def create_debug_text_log_line(e: T_Event) -> str:
+def create_debug_text_log_line(
+    e: T_Event, ts: Optional[datetime] = None, thread_name: Optional[str] = None
+) -> str:
     log_line: str = ""
     # Create a separator if this is the beginning of an invocation
     if type(e) == MainReportVersion:
         separator = 30 * "="
-        log_line = f"\n\n{separator} {get_ts()} | {get_invocation_id()} {separator}\n"
+        log_line = f"\n\n{separator} {ts or get_ts()} | {get_invocation_id()} {separator}\n"
     color_tag: str = "" if this.format_color else Style.RESET_ALL
-    ts: str = get_ts().strftime("%H:%M:%S.%f")
+    ts_str: str = (ts or get_ts()).strftime("%H:%M:%S.%f")
     scrubbed_msg: str = scrub_secrets(e.message(), env_secrets())
     level: str = e.level_tag() if len(e.level_tag()) == 5 else f"{e.level_tag()} "
     thread = ""
-    if threading.current_thread().getName():
+    if thread_name is None:
         thread_name = threading.current_thread().getName()
+    if thread_name:
         thread_name = thread_name[:10]
         thread_name = thread_name.ljust(10, " ")
         thread = f" [{thread_name}]:"
-    log_line = log_line + f"{color_tag}{ts} [{level}]{thread} {scrubbed_msg}"
+    log_line = log_line + f"{color_tag}{ts_str} [{level}]{thread} {scrubbed_msg}"
     return log_line
 
 
 # translates an Event to a completely formatted json log line
-def create_json_log_line(e: T_Event) -> Optional[str]:
+def create_json_log_line(
+    e: T_Event, ts: Optional[datetime] = None, thread_name: Optional[str] = None
+) -> Optional[str]:
     if type(e) == EmptyLine:
         return None  # will not be sent to logger
     # using preformatted ts string instead of formatting it here to be extra careful about timezone
-    values = event_to_serializable_dict(e)
+    values = event_to_serializable_dict(e, ts, thread_name)
     raw_log_line = json.dumps(values, sort_keys=True)
     return scrub_secrets(raw_log_line, env_secrets())
 
 
 # calls create_stdout_text_log_line() or create_json_log_line() according to logger config
-def create_log_line(e: T_Event, file_output=False) -> Optional[str]:
+def create_log_line(
+    e: T_Event,
+    file_output=False,
+    ts: Optional[datetime] = None,
+    thread_name: Optional[str] = None,
+) -> Optional[str]:
     if this.format_json:
-        return create_json_log_line(e)  # json output, both console and file
+        return create_json_log_line(e, ts, thread_name)  # json output, both console and file
     elif file_output is True or flags.DEBUG:
-        return create_debug_text_log_line(e)  # default file output
+        return create_debug_text_log_line(e, ts, thread_name)  # default file output
     else:
-        return create_info_text_log_line(e)  # console output
+        return create_info_text_log_line(e, ts)  # console output
+
+
+# the lines an event is written as, paired with the logger each goes to. The stdout line
+# reuses the file line when both have the same format (json, or text with --debug) rather
+# than formatting the event twice.
+def create_log_lines(
+    e: T_Event, ts: Optional[datetime] = None, thread_name: Optional[str] = None
+) -> List[Tuple[Logger, str]]:
+    log_lines: List[Tuple[Logger, str]] = []
+    file_line: Optional[str] = None
+    # always logs debug level regardless of user input
+    if not isinstance(e, NoFile):
+        file_line = create_log_line(e, file_output=True, ts=ts, thread_name=thread_name)
+        if file_line:
+            log_lines.append((this.FILE_LOG, file_line))
+
+    if not isinstance(e, NoStdOut):
+        # explicitly checking the debug flag here so that potentially expensive-to-construct
+        # log messages are not constructed if debug messages are never shown.
+        if e.level_tag() == "debug" and not flags.DEBUG:
+            return log_lines  # eat the message in case it was one of the expensive ones
+        if e.level_tag() != "error" and flags.QUIET:
+            return log_lines  # eat all non-exception messages in quiet mode
+
+        if not isinstance(e, NoFile) and (this.format_json or flags.DEBUG):
+            stdout_line = file_line
+        else:
+            stdout_line = create_log_line(e, ts=ts, thread_name=thread_name)
+        if stdout_line:
+            log_lines.append((this.STDOUT_LOG, stdout_line))
+    return log_lines
 
 
 # allows for resuse of this obnoxious if else tree.
@@ -276,6 +347,76 @@ def send_exc_to_logger(
         )
 
 
+class EventRecord(NamedTuple):
+    """What EVENT_HISTORY keeps of an event with `--compact-event-history`,
+    in place of the event itself and everything it references.
+    """
+
+    code: str
+    level: str
+    ts: str
+    msg: str
+
+
+def create_event_record(e: Event) -> EventRecord:
+    msg = e.message()
+    if len(msg) > EVENT_RECORD_MESSAGE_LENGTH:
+        msg = msg[: EVENT_RECORD_MESSAGE_LENGTH - 3] + "..."
+    # code is declared as an abstract property, but events set it as a str
+    return EventRecord(code=str(e.code), level=e.level_tag(), ts=get_ts_rfc3339(), msg=msg)
+
+
+# the level, and whether it's a cache event, goes to the file log and goes to stdout,
+# of every event of a type
+@functools.lru_cache(maxsize=None)
+def _event_type_traits(event_type: Type[Event]) -> Tuple[str, bool, bool, bool]:
+    if issubclass(event_type, (TestLevel, DebugLevel)):
+        level_tag = "debug"
+    elif issubclass(event_type, InfoLevel):
+        level_tag = "info"
+    elif issubclass(event_type, WarnLevel):
+        level_tag = "warn"
+    else:
+        level_tag = "error"
+    return (
+        level_tag,
+        issubclass(event_type, Cache),
+        not issubclass(event_type, NoFile),
+        not issubclass(event_type, NoStdOut),
+    )
+
+
+_LOGGING_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warn": logging.WARNING,
+    "error": logging.ERROR,
+}
+
+
+def event_enabled(event_type: Type[Event]) -> bool:
+    """Return whether fire_event would write an event of this type to any log,
+    given the flags and the configured loggers. Call sites that build expensive
+    events check this first, and skip building and firing events that would
+    be thrown away. Skipped events are not in EVENT_HISTORY either.
+    """
+    level_tag, cache, file_output, stdout_output = _event_type_traits(event_type)
+    if cache and not flags.LOG_CACHE_EVENTS:
+        return False
+    if flags.ENABLE_LEGACY_LOGGER:
+        return True
+    level = _LOGGING_LEVELS[level_tag]
+    if file_output and this.FILE_LOG.isEnabledFor(level):
+        return True
+    if not stdout_output:
+        return False
+    if level_tag == "debug" and not flags.DEBUG:
+        return False
+    if level_tag != "error" and flags.QUIET:
+        return False
+    return this.STDOUT_LOG.isEnabledFor(level)
+
+
 # top-level method for accessing the new eventing system
 # this is where all the side effects happen branched by event type
 # (i.e. - mutating the event history, printing to stdout, logging
@@ -288,11 +429,12 @@ def fire_event(e: Event) -> None:
     # if and only if the event history deque will be completely filled by this event
     # fire warning that old events are now being dropped
     global EVENT_HISTORY
+    history_entry = create_event_record(e) if flags.COMPACT_EVENT_HISTORY else e
     if len(EVENT_HISTORY) == (flags.EVENT_BUFFER_SIZE - 1):
-        EVENT_HISTORY.append(e)
+        EVENT_HISTORY.append(history_entry)
         fire_event(EventBufferFull())
     else:
-        EVENT_HISTORY.append(e)
+        EVENT_HISTORY.append(history_entry)
 
     # backwards compatibility for plugins that require old logger (dbt-rpc)
     if flags.ENABLE_LEGACY_LOGGER:
@@ -303,34 +445,127 @@ def fire_event(e: Event) -> None:
             send_to_logger(GLOBAL_LOGGER, e.level_tag(), log_line)
         return  # exit the function to avoid using the current logger as well
 
-    # always logs debug level regardless of user input
-    if not isinstance(e, NoFile):
-        log_line = create_log_line(e, file_output=True)
-        # doesn't send exceptions to exception logger
-        if log_line:
-            send_to_logger(FILE_LOG, level_tag=e.level_tag(), log_line=log_line)
+    if this.LOG_WRITER is not None:
+        # exceptions have to be logged on the thread handling them, and errors are written
+        # right away, after everything that was fired before them.
+        if not isinstance(e, ShowException) and e.level_tag() != "error":
+            this.LOG_WRITER.put(e)
+            return
+        this.LOG_WRITER.flush()
 
-    if not isinstance(e, NoStdOut):
-        # explicitly checking the debug flag here so that potentially expensive-to-construct
-        # log messages are not constructed if debug messages are never shown.
-        if e.level_tag() == "debug" and not flags.DEBUG:
-            return  # eat the message in case it was one of the expensive ones
-        if e.level_tag() != "error" and flags.QUIET:
-            return  # eat all non-exception messages in quiet mode
-
-        log_line = create_log_line(e)
-        if log_line:
-            if not isinstance(e, ShowException):
-                send_to_logger(STDOUT_LOG, level_tag=e.level_tag(), log_line=log_line)
-            else:
-                send_exc_to_logger(
-                    STDOUT_LOG,
-                    level_tag=e.level_tag(),
-                    log_line=log_line,
-                    exc_info=e.exc_info,
-                    stack_info=e.stack_info,
-                    extra=e.extra,
-                )
+    for logger, log_line in create_log_lines(e):
+        # doesn't send exceptions to exception logger
+        if logger is this.STDOUT_LOG and isinstance(e, ShowException):
+            send_exc_to_logger(
+                logger,
+                level_tag=e.level_tag(),
+                log_line=log_line,
+                exc_info=e.exc_info,
+                stack_info=e.stack_info,
+                extra=e.extra,
+            )
+        else:
+            send_to_logger(logger, level_tag=e.level_tag(), log_line=log_line)
+
+
+class QueuedEvent(NamedTuple):
+    event: Event
+    ts: datetime
+    thread_name: str
+
+
+class AsyncLogWriter:
+    """Writes fired events to the file and stdout loggers from a background
+    thread. Events wait in a bounded queue along with the time they were fired
+    and the name of the thread that fired them, so their lines read the same as
+    when they are written synchronously. The writer takes whatever is queued, up
+    to LOG_BATCH_SIZE events, and hands each logger the consecutive lines of
+    the same level as one message.
+    """
+
+    def __init__(self, maxsize: int = LOG_QUEUE_SIZE, batch_size: int = LOG_BATCH_SIZE) -> None:
+        self.batch_size = batch_size
+        self.queue: "queue.Queue[Optional[QueuedEvent]]" = queue.Queue(maxsize)
+        self.thread = threading.Thread(target=self._run, name="log_writer", daemon=True)
+        self.thread.start()
+
+    def put(self, e: Event) -> None:
+        # lazy values, like the relations cache dumps, have to show the state when the
+        # event was fired, and may take locks that the firing thread holds while the
+        # queue is full.
+        for value in vars(e).values():
+            if isinstance(value, Lazy):
+                value.force()
+        self.queue.put(QueuedEvent(e, get_ts(), threading.current_thread().getName()))
+
+    def flush(self) -> None:
+        """Block until every event queued so far has been written."""
+        self.queue.join()
+
+    def stop(self) -> None:
+        """Write everything that is queued, then stop the writer thread."""
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            records = [record for record in batch if record is not None]
+            stopping = len(records) < len(batch)
+            try:
+                self._write(records)
+            except Exception:
+                # the thread that fired the event is long gone, and this one must keep
+                # writing or flush() would never return.
+                traceback.print_exc(file=sys.stderr)
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+    def _write(self, records: List[QueuedEvent]) -> None:
+        pending: Dict[Logger, List[Tuple[str, str]]] = {}
+        for record in records:
+            level_tag = record.event.level_tag()
+            for logger, log_line in create_log_lines(record.event, record.ts, record.thread_name):
+                pending.setdefault(logger, []).append((level_tag, log_line))
+
+        for logger, log_lines in pending.items():
+            group: List[str] = []
+            for i, (level_tag, log_line) in enumerate(log_lines):
+                group.append(log_line)
+                if i + 1 == len(log_lines) or log_lines[i + 1][0] != level_tag:
+                    send_to_logger(logger, level_tag=level_tag, log_line="\n".join(group))
+                    group = []
+
+
+def flush_log_writer() -> None:
+    """Write out the events waiting for the background log writer, if any."""
+    if this.LOG_WRITER is not None:
+        this.LOG_WRITER.flush()
+
+
+@atexit.register
+def stop_log_writer() -> None:
+    if this.LOG_WRITER is not None:
+        this.LOG_WRITER.stop()
+        this.LOG_WRITER = None
+
+
+def _drop_log_writer_in_child() -> None:
+    # a forked process gets a copy of the writer's queue, but not its thread, so
+    # nothing would ever write the events it queued. Log synchronously instead.
+    this.LOG_WRITER = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_drop_log_writer_in_child)
 
 
 def get_invocation_id() -> str:
@@ -354,7 +589,8 @@ def get_ts() -> datetime:
 
 
 # preformatted time stamp
-def get_ts_rfc3339() -> str:
-    ts = get_ts()
+def get_ts_rfc3339(ts: Optional[datetime] = None) -> str:
+    if ts is None:
+        ts = get_ts()
     ts_rfc3339 = ts.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
     return ts_rfc3339
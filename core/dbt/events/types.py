@@ -702,6 +702,71 @@ class DumpAfterRenameSchema(DebugLevel, Cache):
         return f"after rename: {self.dump.force()}"
 
 
+@dataclass
+class EvictSchema(DebugLevel, Cache):
+    database: Optional[str]
+    schema: Optional[str]
+    code: str = "E045"
+
+    def message(self) -> str:
+        return f'Evicting schema "{self.database}.{self.schema}" from the relations cache'
+
+
+@dataclass
+class SavedRelationsCacheUsed(DebugLevel):
+    reused: int
+    listed: int
+    code: str = "E046"
+
+    def message(self) -> str:
+        return (
+            f"Reusing {self.reused} schemas from the saved relations cache, "
+            f"listing {self.listed}"
+        )
+
+
+@dataclass
+class SavedRelationsCacheInvalid(DebugLevel):
+    path: str
+    exc: str
+    code: str = "E047"
+
+    def message(self) -> str:
+        return f"Could not read the saved relations cache at {self.path}: {self.exc}"
+
+
+@dataclass
+class ConnectionPoolHit(DebugLevel):
+    conn_name: Optional[str]
+    code: str = "E048"
+
+    def message(self) -> str:
+        return f'Re-using a pooled connection for "{self.conn_name}"'
+
+
+@dataclass
+class ConnectionPoolMiss(DebugLevel):
+    conn_name: Optional[str]
+    code: str = "E049"
+
+    def message(self) -> str:
+        return f'No pooled connection for "{self.conn_name}", opening a new one'
+
+
+@dataclass
+class ConnectionPoolStats(DebugLevel):
+    hits: int
+    misses: int
+    discarded: int
+    code: str = "E050"
+
+    def message(self) -> str:
+        return (
+            f"Connection pool: {self.hits} hits, {self.misses} misses, "
+            f"{self.discarded} stale or broken connections closed"
+        )
+
+
 @dataclass
 class AdapterImportError(InfoLevel):
     exc: Exception
@@ -1486,6 +1551,28 @@ class BuildingCatalog(InfoLevel):
         return "Building catalog"
 
 
+@dataclass
+class IncrementalCatalog(InfoLevel):
+    refreshed: int
+    total: int
+    code: str = "E051"
+
+    def message(self) -> str:
+        return (
+            f"Refreshing {self.refreshed} of {self.total} schemas, "
+            "reusing the previous catalog for the rest"
+        )
+
+
+@dataclass
+class IncrementalCatalogUnavailable(InfoLevel):
+    reason: str
+    code: str = "E052"
+
+    def message(self) -> str:
+        return f"Building the whole catalog: {self.reason}"
+
+
 @dataclass
 class CompileComplete(InfoLevel):
     code: str = "Q002"
@@ -2063,6 +2150,17 @@ class DefaultSelector(InfoLevel):
         return f"Using default selector {self.name}"
 
 
+@dataclass
+class CriticalPathNoRunResults(WarnLevel):
+    code: str = "Q036"
+
+    def message(self) -> str:
+        return (
+            "Critical path scheduling requires run_results.json from a previous "
+            "run, supplied with --state. Scheduling by graph depth instead."
+        )
+
+
 @dataclass
 class NodeStart(DebugLevel, NodeInfo):
     unique_id: str
@@ -2468,6 +2566,12 @@ if 1 == 0:
     DumpAfterAddGraph(Lazy.defer(lambda: dict()))
     DumpBeforeRenameSchema(Lazy.defer(lambda: dict()))
     DumpAfterRenameSchema(Lazy.defer(lambda: dict()))
+    EvictSchema(database="", schema="")
+    SavedRelationsCacheUsed(reused=0, listed=0)
+    SavedRelationsCacheInvalid(path="", exc="")
+    ConnectionPoolHit(conn_name="")
+    ConnectionPoolMiss(conn_name="")
+    ConnectionPoolStats(hits=0, misses=0, discarded=0)
     AdapterImportError(exc=Exception())
     PluginLoadError()
     SystemReportReturnCode(returncode=0)
@@ -2547,6 +2651,8 @@ if 1 == 0:
     CatalogWritten(path="")
     CannotGenerateDocs()
     BuildingCatalog()
+    IncrementalCatalog(refreshed=0, total=0)
+    IncrementalCatalogUnavailable(reason="")
     CompileComplete()
     FreshnessCheckComplete()
     ServingDocsPort(address="", port=0)
@@ -2704,6 +2810,7 @@ if 1 == 0:
     )
     PrintCancelLine(conn_name="")
     DefaultSelector(name="")
+    CriticalPathNoRunResults()
     NodeStart(node_info={}, unique_id="")
     NodeFinished(node_info={}, unique_id="", run_result={})
     QueryCancelationUnsupported(type="")
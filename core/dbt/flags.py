@@ -35,6 +35,14 @@ INDIRECT_SELECTION = None
 LOG_CACHE_EVENTS = None
 EVENT_BUFFER_SIZE = 100000
 QUIET = None
+PARSE_WORKERS = 1
+RELATIONS_CACHE_MAX_SCHEMAS = 0
+RELATIONS_CACHE_TTL = 0
+JINJA_CACHE = None
+ASYNC_LOGGING = None
+COMPACT_EVENT_HISTORY = None
+CONNECTION_POOL_SIZE = 0
+CONNECTION_POOL_MAX_IDLE = 300
 
 # Global CLI defaults. These flags are set from three places:
 # CLI args, environment variables, and user_config (profiles.yml).
@@ -57,6 +65,14 @@ flag_defaults = {
     "LOG_CACHE_EVENTS": False,
     "EVENT_BUFFER_SIZE": 100000,
     "QUIET": False,
+    "PARSE_WORKERS": 1,
+    "RELATIONS_CACHE_MAX_SCHEMAS": 0,
+    "RELATIONS_CACHE_TTL": 0,
+    "JINJA_CACHE": False,
+    "ASYNC_LOGGING": False,
+    "COMPACT_EVENT_HISTORY": False,
+    "CONNECTION_POOL_SIZE": 0,
+    "CONNECTION_POOL_MAX_IDLE": 300,
 }
 
 
@@ -106,7 +122,9 @@ def set_from_args(args, user_config):
     global STRICT_MODE, FULL_REFRESH, WARN_ERROR, USE_EXPERIMENTAL_PARSER, STATIC_PARSER
     global WRITE_JSON, PARTIAL_PARSE, USE_COLORS, STORE_FAILURES, PROFILES_DIR, DEBUG, LOG_FORMAT
     global INDIRECT_SELECTION, VERSION_CHECK, FAIL_FAST, SEND_ANONYMOUS_USAGE_STATS
-    global PRINTER_WIDTH, WHICH, LOG_CACHE_EVENTS, EVENT_BUFFER_SIZE, QUIET
+    global PRINTER_WIDTH, WHICH, LOG_CACHE_EVENTS, EVENT_BUFFER_SIZE, QUIET, PARSE_WORKERS
+    global RELATIONS_CACHE_MAX_SCHEMAS, RELATIONS_CACHE_TTL, JINJA_CACHE, ASYNC_LOGGING
+    global COMPACT_EVENT_HISTORY, CONNECTION_POOL_SIZE, CONNECTION_POOL_MAX_IDLE
 
     STRICT_MODE = False  # backwards compatibility
     # cli args without user_config or env var option
@@ -132,6 +150,14 @@ def set_from_args(args, user_config):
     LOG_CACHE_EVENTS = get_flag_value("LOG_CACHE_EVENTS", args, user_config)
     EVENT_BUFFER_SIZE = get_flag_value("EVENT_BUFFER_SIZE", args, user_config)
     QUIET = get_flag_value("QUIET", args, user_config)
+    PARSE_WORKERS = get_flag_value("PARSE_WORKERS", args, user_config)
+    RELATIONS_CACHE_MAX_SCHEMAS = get_flag_value("RELATIONS_CACHE_MAX_SCHEMAS", args, user_config)
+    RELATIONS_CACHE_TTL = get_flag_value("RELATIONS_CACHE_TTL", args, user_config)
+    JINJA_CACHE = get_flag_value("JINJA_CACHE", args, user_config)
+    ASYNC_LOGGING = get_flag_value("ASYNC_LOGGING", args, user_config)
+    COMPACT_EVENT_HISTORY = get_flag_value("COMPACT_EVENT_HISTORY", args, user_config)
+    CONNECTION_POOL_SIZE = get_flag_value("CONNECTION_POOL_SIZE", args, user_config)
+    CONNECTION_POOL_MAX_IDLE = get_flag_value("CONNECTION_POOL_MAX_IDLE", args, user_config)
 
 
 def get_flag_value(flag, args, user_config):
@@ -150,6 +176,11 @@ def get_flag_value(flag, args, user_config):
                 "PROFILES_DIR",
                 "INDIRECT_SELECTION",
                 "EVENT_BUFFER_SIZE",
+                "PARSE_WORKERS",
+                "RELATIONS_CACHE_MAX_SCHEMAS",
+                "RELATIONS_CACHE_TTL",
+                "CONNECTION_POOL_SIZE",
+                "CONNECTION_POOL_MAX_IDLE",
             ]:
                 flag_value = env_value
             else:
@@ -158,7 +189,16 @@ def get_flag_value(flag, args, user_config):
             flag_value = getattr(user_config, lc_flag)
         else:
             flag_value = flag_defaults[flag]
-    if flag in ["PRINTER_WIDTH", "EVENT_BUFFER_SIZE"]:  # must be ints
+    # must be ints
+    if flag in [
+        "PRINTER_WIDTH",
+        "EVENT_BUFFER_SIZE",
+        "PARSE_WORKERS",
+        "RELATIONS_CACHE_MAX_SCHEMAS",
+        "RELATIONS_CACHE_TTL",
+        "CONNECTION_POOL_SIZE",
+        "CONNECTION_POOL_MAX_IDLE",
+    ]:
         flag_value = int(flag_value)
     if flag == "PROFILES_DIR":
         flag_value = os.path.abspath(flag_value)
@@ -185,4 +225,12 @@ def get_flag_dict():
         "log_cache_events": LOG_CACHE_EVENTS,
         "event_buffer_size": EVENT_BUFFER_SIZE,
         "quiet": QUIET,
+        "parse_workers": PARSE_WORKERS,
+        "relations_cache_max_schemas": RELATIONS_CACHE_MAX_SCHEMAS,
+        "relations_cache_ttl": RELATIONS_CACHE_TTL,
+        "jinja_cache": JINJA_CACHE,
+        "async_logging": ASYNC_LOGGING,
+        "compact_event_history": COMPACT_EVENT_HISTORY,
+        "connection_pool_size": CONNECTION_POOL_SIZE,
+        "connection_pool_max_idle": CONNECTION_POOL_MAX_IDLE,
     }
@@ -1,5 +1,4 @@
 from typing import Set, Iterable, Iterator, Optional, NewType
-from itertools import product
 import networkx as nx  # type: ignore
 
 from dbt.exceptions import InternalException
@@ -73,30 +72,46 @@ class Graph:
         """Create and return a new graph that is a shallow copy of the graph,
         but with only the nodes in include_nodes. Transitive edges across
         removed nodes are preserved as explicit new edges.
-        """
 
-        new_graph = self.graph.copy()
+        Rather than removing unselected nodes one at a time (which adds the
+        cross product of each removed node's in and out edges), this walks
+        forward from each selected node through unselected nodes only, and
+        adds an edge to each selected node it reaches.
+        """
         include_nodes = set(selected)
 
-        for node in self:
-            if node not in include_nodes:
-                source_nodes = [x for x, _ in new_graph.in_edges(node)]
-                target_nodes = [x for _, x in new_graph.out_edges(node)]
-
-                new_edges = product(source_nodes, target_nodes)
-                non_cyclic_new_edges = [
-                    (source, target) for source, target in new_edges if source != target
-                ]  # removes cyclic refs
-
-                new_graph.add_edges_from(non_cyclic_new_edges)
-                new_graph.remove_node(node)
-
         for node in include_nodes:
-            if node not in new_graph:
+            if node not in self.graph:
                 raise ValueError(
                     "Couldn't find model '{}' -- does it exist or is " "it disabled?".format(node)
                 )
 
+        new_graph = nx.DiGraph()
+        new_graph.add_nodes_from((node, self.graph.nodes[node]) for node in include_nodes)
+        # edges between selected nodes are kept as-is
+        new_graph.add_edges_from(
+            (source, target)
+            for source, target in self.graph.edges(include_nodes)
+            if target in include_nodes
+        )
+
+        for source in include_nodes:
+            stack = [node for node in self.graph.successors(source) if node not in include_nodes]
+            visited: Set[UniqueId] = set()
+            reached: Set[UniqueId] = set()
+            while stack:
+                node = stack.pop()
+                if node in visited:
+                    continue
+                visited.add(node)
+                for successor in self.graph.successors(node):
+                    if successor in include_nodes:
+                        reached.add(successor)
+                    else:
+                        stack.append(successor)
+            reached.discard(source)
+            new_graph.add_edges_from((source, target) for target in reached)
+
         return Graph(new_graph)
 
     def subgraph(self, nodes: Iterable[UniqueId]) -> "Graph":
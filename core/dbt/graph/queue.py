@@ -2,7 +2,7 @@ import networkx as nx  # type: ignore
 import threading
 
 from queue import PriorityQueue
-from typing import Dict, Set, List, Generator, Optional
+from typing import Dict, Set, List, Generator, Optional, Iterable, Mapping
 
 from .graph import UniqueId
 from dbt.contracts.graph.parsed import ParsedSourceDefinition, ParsedExposure, ParsedMetric
@@ -20,7 +20,13 @@ class GraphQueue:
     the same time, as there is an unlocked race!
     """
 
-    def __init__(self, graph: nx.DiGraph, manifest: Manifest, selected: Set[UniqueId]):
+    def __init__(
+        self,
+        graph: nx.DiGraph,
+        manifest: Manifest,
+        selected: Set[UniqueId],
+        node_weights: Optional[Dict[UniqueId, float]] = None,
+    ):
         self.graph = graph
         self.manifest = manifest
         self._selected = selected
@@ -34,9 +40,16 @@ class GraphQueue:
         # this lock controls most things
         self.lock = threading.Lock()
         # store the 'score' of each node as a number. Lower is higher priority.
-        self._scores = self._get_scores(self.graph)
+        self._scores: Mapping[str, float]
+        if node_weights is None:
+            self._scores = self._get_scores(self.graph)
+        else:
+            self._scores = self._get_critical_path_scores(self.graph, node_weights)
+        # the number of unfinished parents of each node. A node can be queued
+        # once this reaches 0.
+        self._remaining_parents: Dict[UniqueId, int] = dict(self.graph.in_degree())
         # populate the initial queue
-        self._find_new_additions()
+        self._find_new_additions(self.graph.nodes)
         # awaits after task end
         self.some_task_done = threading.Condition(self.lock)
 
@@ -106,6 +119,38 @@ class GraphQueue:
 
         return scores
 
+    @staticmethod
+    def _get_critical_path_scores(
+        graph: nx.DiGraph, node_weights: Dict[UniqueId, float]
+    ) -> Dict[str, float]:
+        """Scoring nodes for processing order by their critical path.
+
+        The critical path of a node is its own weight plus the heaviest
+        critical path among its children, i.e. the longest weighted path from
+        the node to a sink. Nodes heading the longest chains of work are
+        processed first, so the score is the negated path length.
+
+        Nodes with no known weight (e.g. new since the previous run) are given
+        the mean of the known weights, or 1 if no weights are known at all.
+
+        Args:
+            graph: The graph to be scored.
+            node_weights: A dictionary of `node name`:`weight` pairs,
+                typically previous execution times in seconds.
+
+        Returns:
+            A dictionary consisting of `node name`:`score` pairs.
+        """
+        known = [node_weights[n] for n in graph if n in node_weights]
+        default_weight = sum(known) / len(known) if known else 1.0
+
+        paths: Dict[UniqueId, float] = {}
+        for node in reversed(list(nx.topological_sort(graph))):
+            longest_child = max((paths[child] for child in graph.successors(node)), default=0.0)
+            paths[node] = node_weights.get(node, default_weight) + longest_child
+
+        return {node: -path for node, path in paths.items()}
+
     def get(self, block: bool = True, timeout: Optional[float] = None) -> GraphMemberNode:
         """Get a node off the inner priority queue. By default, this blocks.
 
@@ -152,12 +197,16 @@ class GraphQueue:
         """
         return node in self.in_progress or node in self.queued
 
-    def _find_new_additions(self) -> None:
-        """Find any nodes in the graph that need to be added to the internal
+    def _find_new_additions(self, candidates: Iterable[UniqueId]) -> None:
+        """Find any nodes in candidates that need to be added to the internal
         queue and add them.
+
+        Callers must hold the lock.
+
+        :param candidates: The node IDs that may have become ready.
         """
-        for node, in_degree in self.graph.in_degree():
-            if not self._already_known(node) and in_degree == 0:
+        for node in candidates:
+            if not self._already_known(node) and self._remaining_parents[node] == 0:
                 self.inner.put((self._scores[node], node))
                 self.queued.add(node)
 
@@ -170,8 +219,13 @@ class GraphQueue:
         """
         with self.lock:
             self.in_progress.remove(node_id)
+            # only the children of the finished node can have become ready
+            successors = list(self.graph.successors(node_id))
+            for successor in successors:
+                self._remaining_parents[successor] -= 1
+            del self._remaining_parents[node_id]
             self.graph.remove_node(node_id)
-            self._find_new_additions()
+            self._find_new_additions(successors)
             self.inner.task_done()
             self.some_task_done.notify_all()
 
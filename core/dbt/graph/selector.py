@@ -1,4 +1,4 @@
-from typing import Set, List, Optional, Tuple
+from typing import Set, List, Optional, Tuple, Dict
 
 from .graph import Graph, UniqueId
 from .queue import GraphQueue
@@ -264,14 +264,19 @@ class NodeSelector(MethodManager):
 
         return filtered_nodes
 
-    def get_graph_queue(self, spec: SelectionSpec) -> GraphQueue:
+    def get_graph_queue(
+        self,
+        spec: SelectionSpec,
+        node_weights: Optional[Dict[UniqueId, float]] = None,
+    ) -> GraphQueue:
         """Returns a queue over nodes in the graph that tracks progress of
-        dependecies.
+        dependecies. If node_weights are given, nodes are prioritized by their
+        weighted critical path instead of their depth in the graph.
         """
         selected_nodes = self.get_selected(spec)
         new_graph = self.full_graph.get_subset_graph(selected_nodes)
         # should we give a way here for consumers to mutate the graph?
-        return GraphQueue(new_graph.graph, self.manifest, selected_nodes)
+        return GraphQueue(new_graph.graph, self.manifest, selected_nodes, node_weights)
 
 
 class ResourceTypeSelector(NodeSelector):
@@ -1,4 +1,4 @@
-{% macro statement(name=None, fetch_result=False, auto_begin=True) -%}
+{% macro statement(name=None, fetch_result=False, auto_begin=True, stream=False) -%}
   {%- if execute: -%}
     {%- set sql = caller() -%}
 
@@ -7,7 +7,11 @@
       {{ write(sql) }}
     {%- endif -%}
 
-    {%- set res, table = adapter.execute(sql, auto_begin=auto_begin, fetch=fetch_result) -%}
+    {%- if stream -%}
+      {%- set res, table = adapter.execute(sql, auto_begin=auto_begin, fetch=fetch_result, stream=true) -%}
+    {%- else -%}
+      {%- set res, table = adapter.execute(sql, auto_begin=auto_begin, fetch=fetch_result) -%}
+    {%- endif -%}
     {%- if name is not none -%}
       {{ store_result(name, response=res, agate_table=table) }}
     {%- endif -%}
@@ -31,9 +35,10 @@
 {%- endmacro %}
 
 
-{# a user-friendly interface into statements #}
-{% macro run_query(sql) %}
-  {% call statement("run_query_statement", fetch_result=true, auto_begin=false) %}
+{# a user-friendly interface into statements. With stream=true, the result is
+   fetched in chunks into a ColumnarResult, call .to_agate() on it for an agate table #}
+{% macro run_query(sql, stream=false) %}
+  {% call statement("run_query_statement", fetch_result=true, auto_begin=false, stream=stream) %}
     {{ sql }}
   {% endcall %}
 
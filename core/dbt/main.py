@@ -9,7 +9,7 @@ from contextlib import contextmanager
 from pathlib import Path
 
 import dbt.version
-from dbt.events.functions import fire_event, setup_event_logger
+from dbt.events.functions import fire_event, setup_event_logger, stop_log_writer
 from dbt.events.types import (
     MainEncounteredError,
     MainKeyboardInterrupt,
@@ -142,6 +142,7 @@ def main(args=None):
             fire_event(MainStackTrace(stack_trace=traceback.format_exc()))
             exit_code = ExitCodes.UnhandledError.value
 
+    stop_log_writer()
     sys.exit(exit_code)
 
 
@@ -492,6 +493,21 @@ def _add_defer_argument(*subparsers):
         )
 
 
+def _add_scheduling_argument(*subparsers):
+    for sub in subparsers:
+        sub.add_argument(
+            "--scheduling-mode",
+            choices=["depth", "critical-path"],
+            default="depth",
+            help="""
+            The order in which ready nodes are run. "depth" runs the nodes
+            nearest the roots of the DAG first. "critical-path" runs the nodes
+            heading the slowest chains of work first, using execution times
+            from the run_results.json in the --state directory.
+            """,
+        )
+
+
 def _build_run_subparser(subparsers, base_subparser):
     run_sub = subparsers.add_parser(
         "run",
@@ -557,6 +573,15 @@ def _build_docs_generate_subparser(subparsers, base_subparser):
         Do not run "dbt compile" as part of docs generation
         """,
     )
+    generate_sub.add_argument(
+        "--incremental",
+        action="store_true",
+        help="""
+        Only query the warehouse for the schemas that dbt has built in, or
+        that changed, since the previous catalog.json was generated, and reuse
+        the previous catalog for the rest.
+        """,
+    )
     return generate_sub
 
 
@@ -1073,6 +1098,97 @@ def parse_args(args, cls=DBTArgumentParser):
         """,
     )
 
+    p.add_argument(
+        "--parse-workers",
+        dest="parse_workers",
+        help="""
+        Sets the number of worker processes used to parse model and snapshot
+        files. Defaults to 1, which parses serially.
+        """,
+    )
+
+    p.add_argument(
+        "--relations-cache-max-schemas",
+        dest="relations_cache_max_schemas",
+        help="""
+        Sets the maximum number of schemas kept in the relations cache. The
+        least recently used schemas are evicted beyond this, and listed again
+        from the database when they are next needed. Defaults to 0, which
+        keeps every schema.
+        """,
+    )
+
+    p.add_argument(
+        "--relations-cache-ttl",
+        dest="relations_cache_ttl",
+        help="""
+        If set, the relations cache is saved to the target directory, and the
+        next invocation reuses each saved schema for up to this many seconds
+        after it was listed, unless dbt changed relations in it. Defaults to
+        0, which lists every schema on every invocation.
+        """,
+    )
+
+    p.add_argument(
+        "--connection-pool-size",
+        dest="connection_pool_size",
+        help="""
+        If set, released warehouse connections are rolled back, reset and
+        kept open for reuse by the next node, up to this many idle
+        connections at a time, instead of being closed. Only adapters that
+        can reset a connection's session pool it. Defaults to 0, which opens
+        a new connection for every node.
+        """,
+    )
+
+    p.add_argument(
+        "--connection-pool-max-idle",
+        dest="connection_pool_max_idle",
+        help="""
+        Sets the number of seconds a pooled connection may be idle before it
+        is closed instead of reused. Defaults to 300.
+        """,
+    )
+
+    p.add_optional_argument_inverse(
+        "--jinja-cache",
+        enable_help="""
+        Allow for caching the compiled python code of jinja templates in the
+        target directory, so that later invocations can skip compiling
+        templates that have not changed.
+        """,
+        disable_help="""
+        Disallow caching compiled jinja templates in the target directory.
+        This is the default.
+        """,
+    )
+
+    p.add_optional_argument_inverse(
+        "--async-logging",
+        enable_help="""
+        Allow for formatting and writing log lines on a background thread, in
+        batches, so that threads firing events don't wait on the log file and
+        stdout. Errors are still written as soon as they happen.
+        """,
+        disable_help="""
+        Disallow writing log lines from a background thread. This is the
+        default.
+        """,
+    )
+
+    p.add_optional_argument_inverse(
+        "--compact-event-history",
+        enable_help="""
+        Allow for keeping only the code, level, timestamp and the start of
+        the message of each event in EVENT_HISTORY, instead of the event
+        itself, to save memory on long runs.
+        """,
+        disable_help="""
+        Disallow compacting EVENT_HISTORY, it keeps the events themselves.
+        This is the default.
+        """,
+    )
+
     p.add_argument(
         "-q",
         "--quiet",
@@ -1117,6 +1233,8 @@ def parse_args(args, cls=DBTArgumentParser):
     _add_selection_arguments(run_sub, compile_sub, generate_sub, test_sub, snapshot_sub, seed_sub)
     # --defer
     _add_defer_argument(run_sub, test_sub, build_sub, snapshot_sub)
+    # --scheduling-mode
+    _add_scheduling_argument(run_sub, build_sub)
     # --full-refresh
     _add_table_mutability_arguments(run_sub, compile_sub, build_sub)
 
@@ -1,9 +1,12 @@
 from dataclasses import dataclass
 from dataclasses import field
 from datetime import datetime
+import math
+import multiprocessing
 import os
 import traceback
-from typing import Dict, Optional, Mapping, Callable, Any, List, Type, Union, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Mapping, Callable, Any, List, Type, Union, Tuple, cast
 from itertools import chain
 import time
 
@@ -17,7 +20,7 @@ from dbt.adapters.factory import (
     get_adapter_package_names,
 )
 from dbt.helper_types import PathSet
-from dbt.events.functions import fire_event, get_invocation_id
+from dbt.events.functions import event_enabled, fire_event, flush_log_writer, get_invocation_id
 from dbt.events.types import (
     PartialParsingFullReparseBecauseOfError,
     PartialParsingExceptionFile,
@@ -41,7 +44,7 @@ from dbt.events.types import (
 )
 from dbt.logger import DbtProcessState
 from dbt.node_types import NodeType
-from dbt.clients.jinja import get_rendered, MacroStack
+from dbt.clients.jinja import get_rendered, MacroStack, template_bytecode_cache
 from dbt.clients.jinja_static import statically_extract_macro_calls
 from dbt.clients.system import make_directory
 from dbt.config import Project, RuntimeConfig
@@ -49,10 +52,10 @@ from dbt.context.docs import generate_runtime_docs_context
 from dbt.context.macro_resolver import MacroResolver, TestMacroNamespace
 from dbt.context.configured import generate_macro_context
 from dbt.context.providers import ParseProvider
-from dbt.contracts.files import FileHash, ParseFileType, SchemaSourceFile
-from dbt.parser.read_files import read_files, load_source_file
+from dbt.contracts.files import AnySourceFile, FileHash, ParseFileType, SchemaSourceFile
+from dbt.parser.read_files import read_files, load_source_file, load_source_file_contents
 from dbt.parser.partial import PartialParsing, special_override_macros
-from dbt.contracts.graph.compiled import ManifestNode
+from dbt.contracts.graph.compiled import CompileResultNode, ManifestNode
 from dbt.contracts.graph.manifest import (
     Manifest,
     Disabled,
@@ -67,6 +70,7 @@ from dbt.contracts.graph.parsed import (
     ColumnInfo,
     ParsedExposure,
     ParsedMetric,
+    ManifestNodes,
 )
 from dbt.contracts.util import Writable
 from dbt.exceptions import (
@@ -95,8 +99,19 @@ from dbt.version import __version__
 from dbt.dataclass_schema import StrEnum, dbtClassMixin
 
 PARTIAL_PARSE_FILE_NAME = "partial_parse.msgpack"
+JINJA_CACHE_DIR_NAME = "jinja_cache"
 PARSING_STATE = DbtProcessState("parsing")
 
+# Parsers whose files can be parsed independently of each other, and so can be
+# handed out to a pool of worker processes when flags.PARSE_WORKERS > 1.
+# SchemaParser is not included: it patches nodes defined in other files.
+PARALLEL_PARSER_TYPES: Tuple[Type[Parser], ...] = (ModelParser, SnapshotParser)
+# Below this many files the cost of forking workers outweighs the gain
+PARALLEL_PARSE_MIN_FILES = 100
+# Threads used to read and hash project files. This is I/O bound, so it's not
+# tied to the number of CPUs; it pays off most on slow or network filesystems.
+READ_FILES_WORKERS = 16
+
 
 class ReparseReason(StrEnum):
     version_mismatch = "01_version_mismatch"
@@ -117,6 +132,7 @@ class ParserInfo(dbtClassMixin):
     parser: str
     elapsed: float
     parsed_path_count: int = 0
+    workers: int = 1
 
 
 # Part of saved performance info
@@ -151,6 +167,33 @@ class ManifestLoaderInfo(dbtClassMixin, Writable):
         return dct
 
 
+# The results of parsing a chunk of files in a worker process. These are
+# merged back into the loader's manifest in the parent process.
+@dataclass
+class ParsedFileChunk:
+    files: Dict[str, AnySourceFile]
+    nodes: List[ManifestNodes]
+    disabled: List[CompileResultNode]
+    env_vars: Dict[str, str]
+    parsing_info: ParsingInfo
+
+
+# Set in the parent process before the worker pool is forked, so that the
+# workers inherit the loader (and its macros) without pickling it.
+_PARALLEL_PARSE_STATE: Optional[Tuple["ManifestLoader", Project, Type[Parser]]] = None
+
+
+def _parse_file_chunk(file_ids: List[str]) -> Optional[ParsedFileChunk]:
+    assert _PARALLEL_PARSE_STATE is not None
+    loader, project, parser_cls = _PARALLEL_PARSE_STATE
+    try:
+        return loader.parse_file_chunk(project, parser_cls, file_ids)
+    except Exception:
+        # Exceptions don't survive pickling with their node context intact,
+        # so the parent re-parses the chunk serially to raise the real error.
+        return None
+
+
 # The ManifestLoader loads the manifest. The standard way to use the
 # ManifestLoader is using the 'get_full_manifest' class method, but
 # many tests use abbreviated processes.
@@ -190,6 +233,14 @@ class ManifestLoader:
         # This is a saved manifest from a previous run that's used for partial parsing
         self.saved_manifest: Optional[Manifest] = self.read_manifest_for_partial_parse()
 
+        # Compiled jinja templates are cached next to the partial parse file
+        if flags.JINJA_CACHE:
+            template_bytecode_cache.directory = os.path.join(
+                self.root_project.target_path, JINJA_CACHE_DIR_NAME
+            )
+        else:
+            template_bytecode_cache.directory = None
+
     # This is the method that builds a complete manifest. We sometimes
     # use an abbreviated process in tests.
     @classmethod
@@ -236,12 +287,19 @@ class ManifestLoader:
         # of parsers to lists of file strings. The file strings are
         # used to get the SourceFiles from the manifest files.
         start_read_files = time.perf_counter()
+        started_at = time.time()
         project_parser_files = {}
         saved_files = {}
         if self.saved_manifest:
             saved_files = self.saved_manifest.files
-        for project in self.all_projects.values():
-            read_files(project, self.manifest.files, project_parser_files, saved_files)
+        # Reading is mostly waiting on the filesystem, so overlap it in threads
+        with ThreadPoolExecutor(
+            max_workers=READ_FILES_WORKERS, thread_name_prefix="read_files"
+        ) as executor:
+            for project in self.all_projects.values():
+                read_files(
+                    project, self.manifest.files, project_parser_files, saved_files, executor
+                )
         orig_project_parser_files = project_parser_files
         self._perf_info.path_count = len(self.manifest.files)
         self._perf_info.read_files_elapsed = time.perf_counter() - start_read_files
@@ -290,8 +348,9 @@ class ManifestLoader:
                         if source_file:
                             parse_file_type = source_file.parse_file_type
                             fire_event(PartialParsingExceptionFile(file=file_id))
-                            file_dict = source_file.to_dict()
-                            fire_event(PartialParsingFile(file_dict=file_dict))
+                            if event_enabled(PartialParsingFile):
+                                file_dict = source_file.to_dict()
+                                fire_event(PartialParsingFile(file_dict=file_dict))
                     exc_info["parse_file_type"] = parse_file_type
                     fire_event(PartialParsingException(exc_info=exc_info))
 
@@ -314,6 +373,7 @@ class ManifestLoader:
             # the other files are loaded.  Also need to parse tests, specifically
             # generic tests
             start_load_macros = time.perf_counter()
+            self.load_file_contents_for_parsing(project_parser_files)
             self.load_and_parse_macros(project_parser_files)
 
             # If we're partially parsing check that certain macros have not been changed
@@ -324,6 +384,7 @@ class ManifestLoader:
                 self.manifest = self.new_manifest  # contains newly read files
                 project_parser_files = orig_project_parser_files
                 self.partially_parsing = False
+                self.load_file_contents_for_parsing(project_parser_files)
                 self.load_and_parse_macros(project_parser_files)
 
             self._perf_info.load_macros_elapsed = time.perf_counter() - start_load_macros
@@ -402,8 +463,24 @@ class ManifestLoader:
             # write out the fully parsed manifest
             self.write_manifest_for_partial_parse()
 
+            # a full parse renders every template that needs rendering while
+            # parsing, so the parse entries it didn't use are stale
+            if not self.partially_parsing:
+                template_bytecode_cache.prune(since=started_at)
+
         return self.manifest
 
+    # read_files doesn't read files that are unchanged since the saved manifest.
+    # Some of them may still need to be parsed, e.g. models that call a changed
+    # macro, so read those now. Schema files are parsed from the saved yaml dict.
+    def load_file_contents_for_parsing(self, project_parser_files):
+        for parser_files in project_parser_files.values():
+            for parser_name, file_ids in parser_files.items():
+                if parser_name == "SchemaParser":
+                    continue
+                for file_id in file_ids:
+                    load_source_file_contents(self.manifest.files[file_id])
+
     def load_and_parse_macros(self, project_parser_files):
         for project in self.all_projects.values():
             if project.project_name not in project_parser_files:
@@ -426,6 +503,9 @@ class ManifestLoader:
                     # increment parsed path count for performance tracking
                     self._perf_info.parsed_path_count += 1
 
+        # Partial parsing removes changed and deleted macros from the saved
+        # manifest, so the index of macros by name must be rebuilt
+        self.manifest.rebuild_macro_lookup()
         self.build_macro_resolver()
         # Look at changed macros and update the macro.depends_on.macros
         self.macro_depends_on()
@@ -456,18 +536,23 @@ class ManifestLoader:
 
             # Parse the project files for this parser
             parser: Parser = parser_cls(project, self.manifest, self.root_project)
-            for file_id in parser_files[parser_name]:
-                block = FileBlock(self.manifest.files[file_id])
-                if isinstance(parser, SchemaParser):
-                    assert isinstance(block.file, SchemaSourceFile)
-                    if self.partially_parsing:
-                        dct = block.file.pp_dict
+            workers = self.get_parse_workers(parser_cls, parser_files[parser_name])
+            if workers > 1:
+                self.parse_files_in_pool(project, parser, parser_files[parser_name], workers)
+                project_parsed_path_count += len(parser_files[parser_name])
+            else:
+                for file_id in parser_files[parser_name]:
+                    block = FileBlock(self.manifest.files[file_id])
+                    if isinstance(parser, SchemaParser):
+                        assert isinstance(block.file, SchemaSourceFile)
+                        if self.partially_parsing:
+                            dct = block.file.pp_dict
+                        else:
+                            dct = block.file.dict_from_yaml
+                        parser.parse_file(block, dct=dct)
                     else:
-                        dct = block.file.dict_from_yaml
-                    parser.parse_file(block, dct=dct)
-                else:
-                    parser.parse_file(block)
-                project_parsed_path_count += 1
+                        parser.parse_file(block)
+                    project_parsed_path_count += 1
 
             # Save timing info
             project_loader_info.parsers.append(
@@ -475,6 +560,7 @@ class ManifestLoader:
                     parser=parser.resource_type,
                     parsed_path_count=project_parsed_path_count,
                     elapsed=time.perf_counter() - parser_start_timer,
+                    workers=workers,
                 )
             )
             total_parsed_path_count += project_parsed_path_count
@@ -502,6 +588,82 @@ class ManifestLoader:
             self._perf_info.parsed_path_count + total_parsed_path_count
         )
 
+    # Returns the number of worker processes to use for parsing 'file_ids'
+    # with 'parser_cls'. 1 means the files are parsed serially.
+    def get_parse_workers(self, parser_cls: Type[Parser], file_ids: List[str]) -> int:
+        workers = flags.PARSE_WORKERS or 1
+        if (
+            workers <= 1
+            or parser_cls not in PARALLEL_PARSER_TYPES
+            or len(file_ids) < PARALLEL_PARSE_MIN_FILES
+            # The workers rely on inheriting the loader's state
+            or "fork" not in multiprocessing.get_all_start_methods()
+        ):
+            return 1
+        return min(workers, len(file_ids))
+
+    # Parse the files in chunks in a pool of forked worker processes, then merge
+    # the results into the manifest in file order, so that the manifest is the
+    # same as it would be after a serial parse.
+    def parse_files_in_pool(
+        self, project: Project, parser: Parser, file_ids: List[str], workers: int
+    ) -> None:
+        global _PARALLEL_PARSE_STATE
+        # A few chunks per worker evens out the load when file sizes vary
+        chunk_size = math.ceil(len(file_ids) / (workers * 4))
+        chunks = [file_ids[i : i + chunk_size] for i in range(0, len(file_ids), chunk_size)]
+
+        _PARALLEL_PARSE_STATE = (self, project, type(parser))
+        # the workers log synchronously, so write out what is queued before them
+        flush_log_writer()
+        try:
+            with multiprocessing.get_context("fork").Pool(processes=workers) as pool:
+                for chunk, result in zip(chunks, pool.imap(_parse_file_chunk, chunks)):
+                    if result is None:
+                        for file_id in chunk:
+                            parser.parse_file(FileBlock(self.manifest.files[file_id]))
+                    else:
+                        self.merge_parsed_file_chunk(result)
+        finally:
+            _PARALLEL_PARSE_STATE = None
+
+    # Called in a worker process. The files are parsed into a scratch manifest
+    # that shares the macros and files of the loader's manifest, so that only
+    # the nodes created from 'file_ids' are sent back to the parent.
+    def parse_file_chunk(
+        self, project: Project, parser_cls: Type[Parser], file_ids: List[str]
+    ) -> ParsedFileChunk:
+        manifest = Manifest(
+            macros=self.manifest.macros,
+            files=self.manifest.files,
+            metadata=self.manifest.metadata,
+        )
+        parser = parser_cls(project, manifest, self.root_project)
+        for file_id in file_ids:
+            parser.parse_file(FileBlock(manifest.files[file_id]))
+        return ParsedFileChunk(
+            files={file_id: manifest.files[file_id] for file_id in file_ids},
+            # nothing in the scratch manifest has been compiled
+            nodes=cast(List[ManifestNodes], list(manifest.nodes.values())),
+            disabled=list(chain.from_iterable(manifest.disabled.values())),
+            env_vars=dict(manifest.env_vars),
+            parsing_info=manifest._parsing_info,
+        )
+
+    def merge_parsed_file_chunk(self, result: ParsedFileChunk) -> None:
+        # The source files already reference their nodes
+        self.manifest.files.update(result.files)
+        for node in result.nodes:
+            self.manifest.add_node_nofile(node)
+        for disabled in result.disabled:
+            self.manifest.add_disabled_nofile(disabled)
+        self.manifest.env_vars.update(result.env_vars)
+        parsing_info = self.manifest._parsing_info
+        parsing_info.static_analysis_path_count += result.parsing_info.static_analysis_path_count
+        parsing_info.static_analysis_parsed_path_count += (
+            result.parsing_info.static_analysis_parsed_path_count
+        )
+
     # This should only be called after the macros have been loaded
     def build_macro_resolver(self):
         internal_package_names = get_adapter_package_names(self.root_project.credentials.type)
@@ -2,25 +2,30 @@ import pathlib
 from dbt.clients.system import load_file_contents
 from dbt.contracts.files import (
     FilePath,
+    RemoteFile,
     ParseFileType,
     SourceFile,
     FileHash,
     AnySourceFile,
     SchemaSourceFile,
+    SavedFileStat,
 )
 
 from dbt.parser.schemas import yaml_from_file, schema_file_keys, check_format_version
 from dbt.exceptions import ParsingException
 from dbt.parser.search import filesystem_search
-from typing import Optional
+from typing import List, Optional, Tuple, Union
 
 
-# This loads the files contents and creates the SourceFile object
+# This loads the files contents and creates the SourceFile object. If the
+# file has already been read and hashed by read_and_hash, pass the result
+# in as 'loaded'.
 def load_source_file(
     path: FilePath,
     parse_file_type: ParseFileType,
     project_name: str,
     saved_files,
+    loaded: Optional[Tuple[str, FileHash]] = None,
 ) -> Optional[AnySourceFile]:
 
     sf_cls = SchemaSourceFile if parse_file_type == ParseFileType.Schema else SourceFile
@@ -31,25 +36,16 @@ def load_source_file(
         project_name=project_name,
     )
 
-    skip_loading_schema_file = False
-    if (
-        parse_file_type == ParseFileType.Schema
-        and saved_files
-        and source_file.file_id in saved_files
-    ):
-        old_source_file = saved_files[source_file.file_id]
-        if (
-            source_file.path.modification_time != 0.0
-            and old_source_file.path.modification_time == source_file.path.modification_time
-        ):
-            source_file.checksum = old_source_file.checksum
-            source_file.dfy = old_source_file.dfy
-            skip_loading_schema_file = True
-
-    if not skip_loading_schema_file:
-        file_contents = load_file_contents(path.absolute_path, strip=False)
-        source_file.checksum = FileHash.from_contents(file_contents)
-        source_file.contents = file_contents.strip()
+    # The contents of unchanged schema files are not needed after this, and
+    # other unchanged files are read by load_source_file_contents if they turn
+    # out to need parsing.
+    saved_stat = get_unchanged_file_stat(path, parse_file_type, project_name, saved_files)
+    if saved_stat is not None:
+        source_file.checksum = saved_stat.checksum
+        if parse_file_type == ParseFileType.Schema:
+            source_file.dfy = saved_files[source_file.file_id].dfy
+    else:
+        load_source_file_contents(source_file, loaded)
 
     if parse_file_type == ParseFileType.Schema and source_file.contents:
         dfy = yaml_from_file(source_file)
@@ -61,6 +57,52 @@ def load_source_file(
     return source_file
 
 
+# The size, modification time and checksum of a file in the saved manifest
+def get_saved_file_stat(saved_files, file_id: str) -> Optional[SavedFileStat]:
+    if not saved_files or file_id not in saved_files:
+        return None
+    return SavedFileStat.from_source_file(saved_files[file_id])
+
+
+# If the file's size and modification time haven't changed since the saved
+# manifest, return what was saved about it, so that it doesn't need to be
+# read and hashed again.
+def get_unchanged_file_stat(
+    path: FilePath, parse_file_type: ParseFileType, project_name: str, saved_files
+) -> Optional[SavedFileStat]:
+    if not saved_files:
+        return None
+    # the same as BaseSourceFile.file_id
+    file_id = f"{project_name}://{path.original_file_path}"
+    saved_stat = get_saved_file_stat(saved_files, file_id)
+    if (
+        saved_stat is not None
+        and saved_stat.parse_file_type == parse_file_type
+        and path.unchanged_since(saved_stat)
+    ):
+        return saved_stat
+    return None
+
+
+# Reading and hashing is the part of loading a file that waits on the
+# filesystem, so this is what get_source_files runs concurrently. The path is
+# typed like a source file's, but a RemoteFile has no real path to read.
+def read_and_hash(path: Union[FilePath, RemoteFile]) -> Tuple[str, FileHash]:
+    file_contents = load_file_contents(path.absolute_path, strip=False)
+    return file_contents, FileHash.from_contents(file_contents)
+
+
+# Read and hash the contents of a source file. Also used for files that were
+# skipped by load_source_file because they hadn't changed.
+def load_source_file_contents(
+    source_file: AnySourceFile, loaded: Optional[Tuple[str, FileHash]] = None
+) -> None:
+    if source_file.contents is None:
+        file_contents, checksum = loaded or read_and_hash(source_file.path)
+        source_file.checksum = checksum
+        source_file.contents = file_contents.strip()
+
+
 # Do some minimal validation of the yaml in a schema file.
 # Check version, that key values are lists and that each element in
 # the lists has a 'name' key
@@ -91,14 +133,22 @@ def validate_yaml(file_path, dct):
 
 
 # Special processing for big seed files
-def load_seed_source_file(match: FilePath, project_name) -> SourceFile:
+def load_seed_source_file(
+    match: FilePath,
+    project_name,
+    saved_files,
+    loaded: Optional[Tuple[str, FileHash]] = None,
+) -> SourceFile:
     if match.seed_too_large():
         # We don't want to calculate a hash of this file. Use the path.
         source_file = SourceFile.big_seed(match)
     else:
-        file_contents = load_file_contents(match.absolute_path, strip=False)
-        checksum = FileHash.from_contents(file_contents)
-        source_file = SourceFile(path=match, checksum=checksum)
+        source_file = SourceFile(path=match, checksum=FileHash.empty())
+        saved_stat = get_unchanged_file_stat(match, ParseFileType.Seed, project_name, saved_files)
+        if saved_stat is not None:
+            source_file.checksum = saved_stat.checksum
+        else:
+            _, source_file.checksum = loaded or read_and_hash(match)
         source_file.contents = ""
     source_file.parse_file_type = ParseFileType.Seed
     source_file.project_name = project_name
@@ -107,31 +157,51 @@ def load_seed_source_file(match: FilePath, project_name) -> SourceFile:
 
 # Use the FilesystemSearcher to get a bunch of FilePaths, then turn
 # them into a bunch of FileSource objects
-def get_source_files(project, paths, extension, parse_file_type, saved_files):
+def get_source_files(project, paths, extension, parse_file_type, saved_files, executor=None):
     # file path list
     fp_list = filesystem_search(project, paths, extension)
+    # singular tests live in /tests but only generic tests live
+    # in /tests/generic so we want to skip those
+    if parse_file_type == ParseFileType.SingularTest:
+        fp_list = [fp for fp in fp_list if pathlib.Path(fp.relative_path).parts[0] != "generic"]
+
+    # If an executor is passed in, read and hash the files that need it
+    # concurrently. Everything else is done in order below, so the files
+    # come out in the same order either way.
+    loaded: List[Optional[Tuple[str, FileHash]]] = [None] * len(fp_list)
+    if executor:
+
+        def needs_reading(fp: FilePath) -> bool:
+            if parse_file_type == ParseFileType.Seed and fp.seed_too_large():
+                return False
+            return (
+                get_unchanged_file_stat(fp, parse_file_type, project.project_name, saved_files)
+                is None
+            )
+
+        to_read = [index for index, fp in enumerate(fp_list) if needs_reading(fp)]
+        results = executor.map(read_and_hash, [fp_list[index] for index in to_read])
+        for index, result in zip(to_read, results):
+            loaded[index] = result
+
     # file block list
     fb_list = []
-    for fp in fp_list:
+    for fp, fp_loaded in zip(fp_list, loaded):
         if parse_file_type == ParseFileType.Seed:
-            fb_list.append(load_seed_source_file(fp, project.project_name))
-        # singular tests live in /tests but only generic tests live
-        # in /tests/generic so we want to skip those
+            fb_list.append(load_seed_source_file(fp, project.project_name, saved_files, fp_loaded))
         else:
-            if parse_file_type == ParseFileType.SingularTest:
-                path = pathlib.Path(fp.relative_path)
-                if path.parts[0] == "generic":
-                    continue
-            file = load_source_file(fp, parse_file_type, project.project_name, saved_files)
+            file = load_source_file(
+                fp, parse_file_type, project.project_name, saved_files, fp_loaded
+            )
             # only append the list if it has contents. added to fix #3568
             if file:
                 fb_list.append(file)
     return fb_list
 
 
-def read_files_for_parser(project, files, dirs, extension, parse_ft, saved_files):
+def read_files_for_parser(project, files, dirs, extension, parse_ft, saved_files, executor=None):
     parser_files = []
-    source_files = get_source_files(project, dirs, extension, parse_ft, saved_files)
+    source_files = get_source_files(project, dirs, extension, parse_ft, saved_files, executor)
     for sf in source_files:
         files[sf.file_id] = sf
         parser_files.append(sf.file_id)
@@ -142,51 +212,93 @@ def read_files_for_parser(project, files, dirs, extension, parse_ft, saved_files
 # dictionary needs to be passed in. What determines the order of
 # the various projects? Is the root project always last? Do the
 # non-root projects need to be done separately in order?
-def read_files(project, files, parser_files, saved_files):
+def read_files(project, files, parser_files, saved_files, executor=None):
 
     project_files = {}
 
     project_files["MacroParser"] = read_files_for_parser(
-        project, files, project.macro_paths, ".sql", ParseFileType.Macro, saved_files
+        project, files, project.macro_paths, ".sql", ParseFileType.Macro, saved_files, executor
     )
 
     project_files["ModelParser"] = read_files_for_parser(
-        project, files, project.model_paths, ".sql", ParseFileType.Model, saved_files
+        project, files, project.model_paths, ".sql", ParseFileType.Model, saved_files, executor
     )
 
     project_files["SnapshotParser"] = read_files_for_parser(
-        project, files, project.snapshot_paths, ".sql", ParseFileType.Snapshot, saved_files
+        project,
+        files,
+        project.snapshot_paths,
+        ".sql",
+        ParseFileType.Snapshot,
+        saved_files,
+        executor,
     )
 
     project_files["AnalysisParser"] = read_files_for_parser(
-        project, files, project.analysis_paths, ".sql", ParseFileType.Analysis, saved_files
+        project,
+        files,
+        project.analysis_paths,
+        ".sql",
+        ParseFileType.Analysis,
+        saved_files,
+        executor,
     )
 
     project_files["SingularTestParser"] = read_files_for_parser(
-        project, files, project.test_paths, ".sql", ParseFileType.SingularTest, saved_files
+        project,
+        files,
+        project.test_paths,
+        ".sql",
+        ParseFileType.SingularTest,
+        saved_files,
+        executor,
     )
 
     # all generic tests within /tests must be nested under a /generic subfolder
     project_files["GenericTestParser"] = read_files_for_parser(
-        project, files, project.generic_test_paths, ".sql", ParseFileType.GenericTest, saved_files
+        project,
+        files,
+        project.generic_test_paths,
+        ".sql",
+        ParseFileType.GenericTest,
+        saved_files,
+        executor,
     )
 
     project_files["SeedParser"] = read_files_for_parser(
-        project, files, project.seed_paths, ".csv", ParseFileType.Seed, saved_files
+        project, files, project.seed_paths, ".csv", ParseFileType.Seed, saved_files, executor
     )
 
     project_files["DocumentationParser"] = read_files_for_parser(
-        project, files, project.docs_paths, ".md", ParseFileType.Documentation, saved_files
+        project,
+        files,
+        project.docs_paths,
+        ".md",
+        ParseFileType.Documentation,
+        saved_files,
+        executor,
     )
 
     project_files["SchemaParser"] = read_files_for_parser(
-        project, files, project.all_source_paths, ".yml", ParseFileType.Schema, saved_files
+        project,
+        files,
+        project.all_source_paths,
+        ".yml",
+        ParseFileType.Schema,
+        saved_files,
+        executor,
     )
 
     # Also read .yaml files for schema files. Might be better to change
     # 'read_files_for_parser' accept an array in the future.
     yaml_files = read_files_for_parser(
-        project, files, project.all_source_paths, ".yaml", ParseFileType.Schema, saved_files
+        project,
+        files,
+        project.all_source_paths,
+        ".yaml",
+        ParseFileType.Schema,
+        saved_files,
+        executor,
     )
     project_files["SchemaParser"].extend(yaml_files)
 
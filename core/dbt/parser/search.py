@@ -73,6 +73,7 @@ def filesystem_search(project: Project, relative_dirs: List[str], extension: str
             relative_path=result["relative_path"],
             modification_time=result["modification_time"],
             project_root=root,
+            file_size=result.get("file_size"),
         )
         file_path_list.append(file_match)
 
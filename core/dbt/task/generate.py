@@ -1,13 +1,20 @@
+import dataclasses
 import os
 import shutil
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple, Set
+from itertools import chain
+from typing import Dict, Iterator, List, Any, Mapping, Optional, Tuple, Set, Union
+
+import agate
 
 from dbt.dataclass_schema import ValidationError
 
 from .compile import CompileTask
+from .runnable import RESULT_FILE_NAME
 
+from dbt.adapters.cache import RelationsCache
 from dbt.adapters.factory import get_adapter
+from dbt.clients.agate_helper import ColumnarResult
 from dbt.contracts.graph.compiled import CompileResultNode
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.results import (
@@ -21,8 +28,9 @@ from dbt.contracts.results import (
     StatsDict,
     ColumnMetadata,
     CatalogArtifact,
+    RunResultsArtifact,
 )
-from dbt.exceptions import InternalException
+from dbt.exceptions import InternalException, RuntimeException
 from dbt.include.global_project import DOCS_INDEX_FILE_PATH
 from dbt.events.functions import fire_event
 from dbt.events.types import (
@@ -30,6 +38,8 @@ from dbt.events.types import (
     CatalogWritten,
     CannotGenerateDocs,
     BuildingCatalog,
+    IncrementalCatalog,
+    IncrementalCatalogUnavailable,
 )
 from dbt.parser.manifest import ManifestLoader
 import dbt.utils
@@ -39,6 +49,9 @@ import dbt.exceptions
 
 CATALOG_FILENAME = "catalog.json"
 
+# a lowercased database and schema name, as in mapping_key
+SchemaKey = Tuple[Optional[str], str]
+
 
 def get_stripped_prefix(source: Dict[str, Any], prefix: str) -> Dict[str, Any]:
     """Go through the source, extracting every key/value pair where the key starts
@@ -67,7 +80,8 @@ class Catalog(Dict[CatalogKey, CatalogTable]):
         for col in columns:
             self.add_column(col)
 
-    def get_table(self, data: PrimitiveDict) -> CatalogTable:
+    @staticmethod
+    def get_key(data: PrimitiveDict) -> CatalogKey:
         database = data.get("table_database")
         if database is None:
             dkey: Optional[str] = None
@@ -75,7 +89,7 @@ class Catalog(Dict[CatalogKey, CatalogTable]):
             dkey = str(database)
 
         try:
-            key = CatalogKey(
+            return CatalogKey(
                 dkey,
                 str(data["table_schema"]),
                 str(data["table_name"]),
@@ -84,6 +98,9 @@ class Catalog(Dict[CatalogKey, CatalogTable]):
             raise dbt.exceptions.CompilationException(
                 "Catalog information missing required key {} (got {})".format(exc, data)
             )
+
+    def get_table(self, data: PrimitiveDict) -> CatalogTable:
+        key = self.get_key(data)
         table: CatalogTable
         if key in self:
             table = self[key]
@@ -94,6 +111,8 @@ class Catalog(Dict[CatalogKey, CatalogTable]):
 
     def add_column(self, data: PrimitiveDict):
         table = self.get_table(data)
+        if table is None:
+            return
         column_data = get_stripped_prefix(data, "column_")
         # the index should really never be that big so it's ok to end up
         # serializing this to JSON (2^53 is the max safe value there)
@@ -129,6 +148,66 @@ class Catalog(Dict[CatalogKey, CatalogTable]):
         return nodes, sources
 
 
+class MappedCatalog(Catalog):
+    """A Catalog that maps each table to the unique IDs of its nodes and
+    sources when its first column is added, so the result of
+    make_unique_id_map is ready as soon as the last column is. Tables that
+    no node or source refers to are not kept.
+    """
+
+    def __init__(self, manifest: Manifest):
+        super().__init__([])
+        self.node_map, self.source_map = get_unique_id_mapping(manifest)
+        self.nodes: Dict[str, CatalogTable] = {}
+        self.sources: Dict[str, CatalogTable] = {}
+        self.unmapped: Set[CatalogKey] = set()
+
+    def add_table(self, table: Union[agate.Table, ColumnarResult]):
+        """Add the columns of one catalog query's result."""
+        # a ColumnarResult casts each column once, rather than building agate rows
+        rows = table.typed_rows() if isinstance(table, ColumnarResult) else table.rows
+        for row in rows:
+            self.add_column(dict(zip(table.column_names, map(dbt.utils._coerce_decimal, row))))
+
+    def get_table(self, data: PrimitiveDict) -> Optional[CatalogTable]:  # type: ignore
+        key = self.get_key(data)
+        if key in self:
+            return self[key]
+        if key in self.unmapped:
+            return None
+
+        mapping_key = CatalogKey(
+            dbt.utils.lowercase(key.database), key.schema.lower(), key.name.lower()
+        )
+        node_id = self.node_map.get(mapping_key)
+        source_ids = self.source_map.get(mapping_key, set())
+        if node_id is None and not source_ids:
+            self.unmapped.add(key)
+            return None
+
+        table = build_catalog_table(data)
+        self[key] = table
+        # the replaced tables share the columns dictionary with this one, so
+        # they get the columns added after this first one too
+        if node_id is not None:
+            self.nodes[node_id] = table.replace(unique_id=node_id)
+        for unique_id in source_ids:
+            if unique_id in self.sources:
+                dbt.exceptions.raise_ambiguous_catalog_match(
+                    unique_id,
+                    self.sources[unique_id].to_dict(omit_none=True),
+                    table.to_dict(omit_none=True),
+                )
+            else:
+                self.sources[unique_id] = table.replace(unique_id=unique_id)
+        return table
+
+    def make_unique_id_map(
+        self, manifest: Manifest
+    ) -> Tuple[Dict[str, CatalogTable], Dict[str, CatalogTable]]:
+        return self.nodes, self.sources
+
+
 def format_stats(stats: PrimitiveDict) -> StatsDict:
     """Given a dictionary following this layout:
 
@@ -179,6 +258,93 @@ def mapping_key(node: CompileResultNode) -> CatalogKey:
     return CatalogKey(dkey, node.schema.lower(), node.identifier.lower())
 
 
+def mapping_schema(node: CompileResultNode) -> SchemaKey:
+    return dbt.utils.lowercase(node.database), node.schema.lower()
+
+
+def catalog_nodes(manifest: Manifest) -> Iterator[CompileResultNode]:
+    """The nodes and sources that the catalog has a table for, as in
+    BaseAdapter._get_catalog_schemas.
+    """
+    return chain(
+        (
+            node
+            for node in manifest.nodes.values()
+            if (node.is_relational and not node.is_ephemeral_model)
+        ),
+        manifest.sources.values(),
+    )
+
+
+def get_changed_schemas(
+    manifest: Manifest,
+    previous: CatalogArtifact,
+    run_results: Optional[RunResultsArtifact],
+    cache: RelationsCache,
+) -> Set[SchemaKey]:
+    """Find the schemas whose tables in the previous catalog may be out of
+    date. A schema has changed if:
+        - run_results, from an invocation after the previous catalog was
+          generated, has a result that wasn't skipped for a node in it
+        - the previous catalog has no table for a node or source in it, or
+          the table is for a different relation
+        - the relations cache listed it, and disagrees with the previous
+          catalog about whether a node or source's relation exists
+    """
+    changed: Set[SchemaKey] = set()
+    if run_results is not None:
+        for result in run_results.results:
+            result_node = manifest.nodes.get(result.unique_id)
+            if (
+                result_node is not None
+                and result_node.is_relational
+                and not result_node.is_ephemeral_model
+                and result.status != NodeStatus.Skipped
+            ):
+                changed.add(mapping_schema(result_node))
+
+    cached_names: Dict[SchemaKey, Set[str]] = {}
+    for node in catalog_nodes(manifest):
+        schema_key = mapping_schema(node)
+        if schema_key in changed:
+            continue
+        key = mapping_key(node)
+        tables = previous.sources if node.unique_id in manifest.sources else previous.nodes
+        table = tables.get(node.unique_id)
+        in_previous = table is not None and table.key() == key
+
+        if schema_key in cache:
+            if schema_key not in cached_names:
+                cached_names[schema_key] = {
+                    relation.identifier.lower()
+                    for relation in cache.get_relations(*schema_key)
+                    if relation.identifier is not None
+                }
+            # a relation that doesn't exist yet has no table in either
+            if in_previous != (key.name in cached_names[schema_key]):
+                changed.add(schema_key)
+        elif not in_previous:
+            changed.add(schema_key)
+    return changed
+
+
+def reuse_previous_tables(
+    tables: Dict[str, CatalogTable],
+    previous: Dict[str, CatalogTable],
+    manifest_nodes: Mapping[str, CompileResultNode],
+    refreshed: Set[SchemaKey],
+) -> None:
+    """Add the tables of the previous catalog that are still for a node or
+    source in the manifest, in a schema that wasn't refreshed, to tables.
+    """
+    for unique_id, table in previous.items():
+        node = manifest_nodes.get(unique_id)
+        if node is None or unique_id in tables:
+            continue
+        if mapping_schema(node) not in refreshed and table.key() == mapping_key(node):
+            tables[unique_id] = table
+
+
 def get_unique_id_mapping(
     manifest: Manifest,
 ) -> Tuple[Dict[CatalogKey, str], Dict[CatalogKey, Set[str]]]:
@@ -204,8 +370,46 @@ class GenerateTask(CompileTask):
             raise InternalException("manifest should not be None in _get_manifest")
         return self.manifest
 
+    def _read_previous_artifacts(
+        self,
+    ) -> Optional[Tuple[CatalogArtifact, Optional[RunResultsArtifact]]]:
+        """Read the catalog.json that an incremental catalog starts from, and
+        the run_results.json of an invocation since, if there was one. Returns
+        None if the whole catalog has to be built instead.
+        """
+        catalog_path = os.path.join(self.config.target_path, CATALOG_FILENAME)
+        results_path = os.path.join(self.config.target_path, RESULT_FILE_NAME)
+        if not os.path.exists(catalog_path):
+            fire_event(IncrementalCatalogUnavailable(reason=f"{catalog_path} does not exist"))
+            return None
+        try:
+            previous = CatalogArtifact.read_and_check_versions(catalog_path)
+            run_results = None
+            if os.path.exists(results_path):
+                run_results = RunResultsArtifact.read_and_check_versions(results_path)
+        except (RuntimeException, ValidationError) as exc:
+            fire_event(IncrementalCatalogUnavailable(reason=str(exc)))
+            return None
+        if previous.errors:
+            fire_event(
+                IncrementalCatalogUnavailable(reason=f"{catalog_path} was generated with errors")
+            )
+            return None
+
+        # docs generate and compile don't change the warehouse
+        if run_results is not None and (
+            run_results.args.get("which") in ("generate", "compile")
+            or run_results.metadata.generated_at <= previous.metadata.generated_at
+        ):
+            run_results = None
+        return previous, run_results
+
     def run(self) -> CatalogArtifact:
         compile_results = None
+        previous_artifacts = None
+        if getattr(self.args, "incremental", False):
+            # before compiling, which writes its own run_results.json
+            previous_artifacts = self._read_previous_artifacts()
         if self.args.compile:
             compile_results = CompileTask.run(self)
             if any(r.status == NodeStatus.Error for r in compile_results):
@@ -235,22 +439,45 @@ class GenerateTask(CompileTask):
             raise InternalException("self.manifest was None in run!")
 
         adapter = get_adapter(self.config)
+        catalog_manifest = self.manifest
+        refreshed: Set[SchemaKey] = set()
+        if previous_artifacts is not None:
+            previous, run_results = previous_artifacts
+            # the relations cache is only filled when compiling
+            refreshed = get_changed_schemas(self.manifest, previous, run_results, adapter.cache)
+            catalog_manifest = dataclasses.replace(
+                self.manifest,
+                nodes={
+                    unique_id: node
+                    for unique_id, node in self.manifest.nodes.items()
+                    if mapping_schema(node) in refreshed
+                },
+                sources={
+                    unique_id: source
+                    for unique_id, source in self.manifest.sources.items()
+                    if mapping_schema(source) in refreshed
+                },
+            )
+            total = len({mapping_schema(node) for node in catalog_nodes(self.manifest)})
+            fire_event(IncrementalCatalog(refreshed=len(refreshed), total=total))
+
+        # each database's catalog is added as soon as it is fetched, rather
+        # than merged with the others and then added
+        catalog = MappedCatalog(self.manifest)
+        exceptions: List[Exception] = []
         with adapter.connection_named("generate_catalog"):
             fire_event(BuildingCatalog())
-            catalog_table, exceptions = adapter.get_catalog(self.manifest)
-
-        catalog_data: List[PrimitiveDict] = [
-            dict(zip(catalog_table.column_names, map(dbt.utils._coerce_decimal, row)))
-            for row in catalog_table
-        ]
-
-        catalog = Catalog(catalog_data)
+            for catalog_table in adapter.iter_catalogs(catalog_manifest, exceptions):
+                catalog.add_table(catalog_table)
 
         errors: Optional[List[str]] = None
         if exceptions:
             errors = [str(e) for e in exceptions]
 
         nodes, sources = catalog.make_unique_id_map(self.manifest)
+        if previous_artifacts is not None:
+            reuse_previous_tables(nodes, previous.nodes, self.manifest.nodes, refreshed)
+            reuse_previous_tables(sources, previous.sources, self.manifest.sources, refreshed)
         results = self.get_catalog_results(
             nodes=nodes,
             sources=sources,
@@ -30,6 +30,7 @@ from dbt.events.types import (
     EmptyLine,
     PrintCancelLine,
     DefaultSelector,
+    CriticalPathNoRunResults,
     NodeStart,
     NodeFinished,
     QueryCancelationUnsupported,
@@ -48,7 +49,14 @@ from dbt.exceptions import (
     warn_or_error,
 )
 
-from dbt.graph import GraphQueue, NodeSelector, SelectionSpec, parse_difference, Graph
+from dbt.graph import (
+    GraphQueue,
+    NodeSelector,
+    SelectionSpec,
+    parse_difference,
+    Graph,
+    UniqueId,
+)
 from dbt.parser.manifest import ManifestLoader
 
 import dbt.exceptions
@@ -141,10 +149,25 @@ class GraphRunnableTask(ManifestTask):
     def get_node_selector(self) -> NodeSelector:
         raise NotImplementedException(f"get_node_selector not implemented for task {type(self)}")
 
+    def get_node_weights(self) -> Optional[Dict[UniqueId, float]]:
+        """With --scheduling-mode critical-path, weight each node by its
+        execution time in the previous run_results.json. Returns None to
+        schedule by graph depth.
+        """
+        if getattr(self.args, "scheduling_mode", None) != "critical-path":
+            return None
+        if self.previous_state is None or self.previous_state.results is None:
+            fire_event(CriticalPathNoRunResults())
+            return None
+        return {
+            UniqueId(result.unique_id): result.execution_time
+            for result in self.previous_state.results.results
+        }
+
     def get_graph_queue(self) -> GraphQueue:
         selector = self.get_node_selector()
         spec = self.get_selection_spec()
-        return selector.get_graph_queue(spec)
+        return selector.get_graph_queue(spec, self.get_node_weights())
 
     def _runtime_initialize(self):
         super()._runtime_initialize()
@@ -416,6 +439,7 @@ class GraphRunnableTask(ManifestTask):
             self.after_run(adapter, res)
             elapsed = time.time() - started
             self.after_hooks(adapter, res, elapsed)
+            adapter.save_relations_cache()
 
         finally:
             adapter.cleanup_connections()
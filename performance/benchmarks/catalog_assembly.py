@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+"""Measure the time and peak memory of turning per-database catalog results
+into catalog.json: merging them all, then a dict per row, a Catalog of every
+table and the unique ID mapping, as docs generate used to, against adding
+each result to a MappedCatalog as it arrives and writing the artifact a
+table at a time. Half of the tables belong to the manifest. Run with:
+python performance/benchmarks/catalog_assembly.py [ROWS_PER_DATABASE [DATABASES]]
+"""
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from types import SimpleNamespace
+
+import dbt.utils
+from dbt.clients.agate_helper import NUMBER_TYPE, TEXT_TYPE, ColumnarResult
+from dbt.clients.system import write_json
+from dbt.task.generate import Catalog, CatalogArtifact, MappedCatalog
+
+COLUMNS_PER_TABLE = 20
+COLUMN_NAMES = [
+    "table_database",
+    "table_schema",
+    "table_name",
+    "table_type",
+    "table_comment",
+    "column_name",
+    "column_index",
+    "column_type",
+    "column_comment",
+    "table_owner",
+]
+COLUMN_TYPES = [TEXT_TYPE] * 6 + [NUMBER_TYPE] + [TEXT_TYPE] * 3
+
+
+def catalog_result(database: int, rows: int) -> ColumnarResult:
+    result = ColumnarResult(COLUMN_NAMES, COLUMN_TYPES)
+    result.extend(
+        [
+            (
+                f"db_{database}",
+                f"schema_{i // COLUMNS_PER_TABLE % 50}",
+                f"table_{i // COLUMNS_PER_TABLE}",
+                "BASE TABLE",
+                None,
+                f"column_{i % COLUMNS_PER_TABLE}",
+                i % COLUMNS_PER_TABLE + 1,
+                "character varying(256)",
+                "a comment" if i % 3 else None,
+                "dbt",
+            )
+            for i in range(rows)
+        ]
+    )
+    return result
+
+
+def make_manifest(rows: int, databases: int):
+    nodes = {}
+    for database in range(databases):
+        for i in range(0, rows // COLUMNS_PER_TABLE, 2):
+            unique_id = f"model.bench.db_{database}_table_{i}"
+            nodes[unique_id] = SimpleNamespace(
+                database=f"db_{database}", schema=f"schema_{i % 50}", identifier=f"table_{i}"
+            )
+    return SimpleNamespace(nodes=nodes, sources={})
+
+
+def artifact(nodes, sources) -> CatalogArtifact:
+    return CatalogArtifact.from_results(
+        generated_at=datetime.utcnow(),
+        nodes=nodes,
+        sources=sources,
+        compile_results=None,
+        errors=None,
+    )
+
+
+def merged_catalog(results, manifest, path: str) -> None:
+    """The previous flow: merge every result, build a dict per row and a
+    Catalog of every table, map it, and encode the artifact in one go.
+    """
+    merged = ColumnarResult.merge(list(results))
+    catalog_data = [
+        dict(zip(merged.column_names, map(dbt.utils._coerce_decimal, row)))
+        for row in merged.typed_rows()
+    ]
+    nodes, sources = Catalog(catalog_data).make_unique_id_map(manifest)
+    write_json(path, artifact(nodes, sources).to_dict(omit_none=False))
+
+
+def mapped_catalog(results, manifest, path: str) -> None:
+    catalog = MappedCatalog(manifest)
+    for result in results:
+        catalog.add_table(result)
+    nodes, sources = catalog.make_unique_id_map(manifest)
+    artifact(nodes, sources).write(path)
+
+
+def measure(assemble, rows: int, databases: int, manifest, path: str):
+    # the results are made as they are consumed, like futures completing
+    results = (catalog_result(database, rows) for database in range(databases))
+    # don't bill this run for collecting the previous run's garbage
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    assemble(results, manifest, path)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def compare(rows: int, databases: int) -> None:
+    manifest = make_manifest(rows, databases)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        merged_path = os.path.join(tmpdir, "merged.json")
+        mapped_path = os.path.join(tmpdir, "mapped.json")
+        merged, merged_peak = measure(merged_catalog, rows, databases, manifest, merged_path)
+        mapped, mapped_peak = measure(mapped_catalog, rows, databases, manifest, mapped_path)
+        with open(merged_path) as merged_fp, open(mapped_path) as mapped_fp:
+            merged_catalog_json, mapped_catalog_json = json.load(merged_fp), json.load(mapped_fp)
+        # everything but generated_at and the invocation_id
+        del merged_catalog_json["metadata"], mapped_catalog_json["metadata"]
+        assert merged_catalog_json == mapped_catalog_json
+    print(
+        f"{rows * databases:>9} rows in {databases} databases: "
+        f"merged {merged:6.2f}s ({merged_peak:5.0f}MB peak), "
+        f"mapped as completed {mapped:6.2f}s ({mapped_peak:5.0f}MB peak)"
+    )
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    databases = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    compare(rows, databases)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+"""Time turning a large catalog query result into the rows docs generate
+builds catalog.json from: the per-row agate conversion dbt used to do, type
+testing every cell when fetching and again when filtering, against a
+ColumnarResult typed from cursor.description, as postgres__get_catalog now
+returns. Also times ColumnarResult.to_agate(), for macros that need a table.
+The rows are shaped like the postgres catalog query's. Run with:
+python performance/benchmarks/columnar_results.py [ROWS ...]
+"""
+import gc
+import json
+import sys
+import time
+
+import dbt.utils
+from dbt.adapters.base.impl import BaseAdapter
+from dbt.adapters.postgres.connections import COLUMN_TYPES
+from dbt.clients.agate_helper import ColumnarResult, table_from_rows
+
+# (name, postgres type oid) as in cursor.description; table_database is
+# a string literal, which postgres gives the unknown type
+DESCRIPTION = [
+    ("table_database", 705),
+    ("table_schema", 19),
+    ("table_name", 19),
+    ("table_type", 25),
+    ("table_comment", 25),
+    ("column_name", 19),
+    ("column_index", 21),
+    ("column_type", 25),
+    ("column_comment", 25),
+    ("table_owner", 19),
+]
+COLUMN_NAMES = [name for name, _ in DESCRIPTION]
+
+
+class Manifest:
+    def get_used_schemas(self):
+        return {("analytics", f"schema_{i}") for i in range(0, 50, 2)}
+
+
+def generate_rows(count: int):
+    return [
+        (
+            "analytics",
+            f"schema_{i % 50}",
+            f"table_{i // 20}",
+            "BASE TABLE",
+            None,
+            f"column_{i % 20}",
+            i % 20 + 1,
+            "character varying(256)",
+            "a comment" if i % 3 else None,
+            "dbt",
+        )
+        for i in range(count)
+    ]
+
+
+def per_row_catalog(rows):
+    """The previous flow: table_from_data_flat type testing every cell,
+    _catalog_filter_table doing it again, then a dict per agate row.
+    """
+    data = [dict(zip(COLUMN_NAMES, row)) for row in rows]
+    table_rows = []
+    text_only_columns = set()
+    for _row in data:
+        row = []
+        for col_name in COLUMN_NAMES:
+            value = _row[col_name]
+            if isinstance(value, (dict, list, tuple)):
+                value = json.dumps(value, cls=dbt.utils.JSONEncoder)
+                text_only_columns.add(col_name)
+            elif isinstance(value, str):
+                text_only_columns.add(col_name)
+            row.append(value)
+        table_rows.append(row)
+    table = table_from_rows(table_rows, COLUMN_NAMES, text_only_columns=text_only_columns)
+    table = BaseAdapter._catalog_filter_table(table, Manifest())
+    return [dict(zip(table.column_names, map(dbt.utils._coerce_decimal, row))) for row in table]
+
+
+def columnar_catalog(rows):
+    column_types = [COLUMN_TYPES.get(type_code) for _, type_code in DESCRIPTION]
+    result = ColumnarResult(COLUMN_NAMES, column_types)
+    result.extend(rows)
+    result = BaseAdapter._catalog_filter_table(result, Manifest())
+    return [
+        dict(zip(result.column_names, map(dbt.utils._coerce_decimal, row)))
+        for row in result.typed_rows()
+    ]
+
+
+def to_agate(rows):
+    column_types = [COLUMN_TYPES.get(type_code) for _, type_code in DESCRIPTION]
+    result = ColumnarResult(COLUMN_NAMES, column_types)
+    result.extend(rows)
+    return result.to_agate()
+
+
+def timed(func, rows):
+    # don't bill this run for collecting the previous run's garbage
+    gc.collect()
+    start = time.perf_counter()
+    result = func(rows)
+    return result, time.perf_counter() - start
+
+
+def compare(count: int) -> None:
+    rows = generate_rows(count)
+    columnar, columnar_elapsed = timed(columnar_catalog, rows)
+    per_row, per_row_elapsed = timed(per_row_catalog, rows)
+    assert columnar == per_row
+    _, to_agate_elapsed = timed(to_agate, rows)
+    print(
+        f"{count:>9} rows: per-row agate {per_row_elapsed:6.2f}s, "
+        f"columnar {columnar_elapsed:6.2f}s, columnar to_agate() {to_agate_elapsed:6.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000]
+    for size in sizes:
+        compare(size)
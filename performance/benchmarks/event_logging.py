@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+"""Time firing debug events from many threads with --debug file and stdout
+logging, as a run with a high thread count does, written synchronously by the
+threads that fire them against queued for the background log writer of
+--async-logging. "firing" is how long the threads were held up; "total"
+includes waiting for the writer to catch up. Run with:
+python performance/benchmarks/event_logging.py [THREADS [EVENTS]]
+"""
+import gc
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import dbt.events.functions as event_funcs
+import dbt.flags as flags
+from dbt.events.types import MacroEventDebug
+
+
+def fire_events(count: int) -> None:
+    name = threading.current_thread().getName()
+    for i in range(count):
+        event_funcs.fire_event(MacroEventDebug(msg=f"{name} ran statement {i}"))
+
+
+def timed(threads: int, events: int, async_logging: bool):
+    flags.ASYNC_LOGGING = async_logging
+    with tempfile.TemporaryDirectory() as log_path:
+        event_funcs.setup_event_logger(log_path)
+        # stdout is the terminal in a real run, keep it out of the benchmark output
+        event_funcs.STDOUT_LOG.handlers[-1].setStream(open(os.devnull, "w"))
+        workers = [
+            threading.Thread(target=fire_events, args=(events,), name=f"Thread-{i}")
+            for i in range(threads)
+        ]
+        # don't bill this run for collecting the previous run's garbage
+        gc.collect()
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        firing = time.perf_counter() - start
+        event_funcs.stop_log_writer()
+        total = time.perf_counter() - start
+        for handler in event_funcs.FILE_LOG.handlers:
+            handler.close()
+    return firing, total
+
+
+def compare(threads: int, events: int) -> None:
+    flags.DEBUG = True
+    flags.EVENT_BUFFER_SIZE = threads * events + 1
+    for async_logging in (False, True):
+        firing, total = timed(threads, events, async_logging)
+        print(
+            f"{threads} threads x {events} events, "
+            f"{'async' if async_logging else 'sync '}: "
+            f"firing {firing:6.2f}s, total {total:6.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    events = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    compare(threads, events)
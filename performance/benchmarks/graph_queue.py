@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+"""Measure how fast a GraphQueue hands out and retires the nodes of a large
+graph. Run with: python performance/benchmarks/graph_queue.py [SIZE ...]
+"""
+import sys
+import time
+
+from dbt.graph.queue import GraphQueue
+from synthetic import random_dag
+
+
+class Node:
+    def __init__(self, unique_id):
+        self.unique_id = unique_id
+
+
+class Manifest:
+    def expect(self, unique_id):
+        return Node(unique_id)
+
+
+def drain(size: int) -> None:
+    graph = random_dag(size)
+    start = time.perf_counter()
+    queue = GraphQueue(graph, Manifest(), set(graph))
+    setup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    while not queue.empty():
+        node = queue.get(block=False)
+        queue.mark_done(node.unique_id)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{size:>7} nodes: setup {setup:.3f}s, drain {elapsed:.3f}s "
+        f"({size / elapsed:,.0f} nodes/s)"
+    )
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 50_000]
+    for size in sizes:
+        drain(size)
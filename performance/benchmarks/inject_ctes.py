@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+"""Time injecting ephemeral CTEs into large generated model sql, with the
+scan Compiler._inject_ctes_into_sql uses now against the sqlparse parse it
+falls back to. The sql has comments, quoted strings and nested subqueries,
+with and without a leading `with`. Run with:
+python performance/benchmarks/inject_ctes.py [LINES ...]
+"""
+import gc
+import random
+import sys
+import time
+from unittest import mock
+
+import dbt.compilation
+from dbt.compilation import Compiler
+from dbt.contracts.graph.compiled import InjectedCTE
+
+CTES = [
+    InjectedCTE(id=f"model.bench.ephemeral_{i}", sql=f" __dbt__cte__ephemeral_{i} as (select 1)")
+    for i in range(3)
+]
+
+
+def generate_sql(lines: int, leading_with: bool, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    parts = ['-- generated mart\n/* {"app": "dbt", "node_id": "model.bench.mart"} */\n']
+    ctes = max(lines // 25, 1)
+    if leading_with:
+        for i in range(ctes):
+            parts.append(f"{'with' if i == 0 else ','} cte_{i} as (\n    select\n")
+            for j in range(20):
+                parts.append(
+                    f"        case when col_{j} = 'it''s -- not a comment' then 1 else 0 end"
+                    f" as flag_{j},  -- flag {j}\n"
+                )
+            parts.append(f"        id\n    from (select * from source_{rng.randrange(50)}) s\n)\n")
+        parts.append("select * from cte_0\n")
+    else:
+        parts.append("select\n")
+        for j in range(lines - 3):
+            parts.append(f"    coalesce(col_{j}, 'with ''{j}''') as col_{j},\n")
+        parts.append("    id\nfrom (select * from source_table) s\n")
+    return "".join(parts)
+
+
+def timed(compiler: Compiler, sql: str, repeat: int):
+    # don't bill this run for collecting the previous run's garbage
+    gc.collect()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        injected = compiler._inject_ctes_into_sql(sql, CTES)
+    return injected, (time.perf_counter() - start) / repeat
+
+
+def compare(lines: int) -> None:
+    compiler = Compiler(config=None)  # type: ignore
+    for leading_with in (True, False):
+        sql = generate_sql(lines, leading_with)
+        scanned, scan_elapsed = timed(compiler, sql, 20)
+        with mock.patch.object(dbt.compilation, "_find_cte_insertion_point", return_value=None):
+            parsed, parse_elapsed = timed(compiler, sql, 1)
+        assert scanned == parsed
+        print(
+            f"{sql.count(chr(10)):>6} lines ({len(sql) / 1024:6.0f}KB), "
+            f"{'with' if leading_with else 'select'}: "
+            f"scan {scan_elapsed * 1e3:7.2f}ms, sqlparse {parse_elapsed * 1e3:9.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [500, 2_000]
+    for size in sizes:
+        compare(size)
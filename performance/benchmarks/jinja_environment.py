@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""Measure get_rendered throughput with the shared jinja environments against
+building a new environment for every template, as get_environment used to.
+The strings are the kind rendered while parsing: project and schema yml
+values, and model sql with capture_macros. Each is timed without the bytecode
+cache, where compiling the template dominates, and with a warm one. Run with:
+python performance/benchmarks/jinja_environment.py [RENDERS]
+"""
+import gc
+import sys
+import tempfile
+import time
+from unittest import mock
+
+import dbt.clients.jinja as jinja
+from dbt.clients.jinja import get_rendered, template_bytecode_cache
+
+CTX = {"target": {"name": "dev", "schema": "analytics"}, "var": lambda name, default: default}
+TEMPLATES = [
+    # (source, capture_macros, native)
+    ("{{ target.schema }}_staging", False, False),
+    ("{{ var('enabled', true) }}", False, True),
+    ("{{ 'view' if target.name == 'dev' else 'table' }}", False, False),
+    (
+        "select {% for c in ['a', 'b', 'c'] %}{{ c }}{% if not loop.last %}, {% endif %}"
+        "{% endfor %} from {{ source_table }}",
+        True,
+        False,
+    ),
+]
+
+
+def per_call_environment(node=None, capture_macros=False, native=False):
+    """The previous get_environment: a new environment, with its
+    extensions and filters, for every template.
+    """
+    return jinja._build_environment(capture_macros, native)
+
+
+def timed(renders: int) -> float:
+    # don't bill this run for collecting the previous run's garbage
+    gc.collect()
+    start = time.perf_counter()
+    for i in range(renders):
+        source, capture_macros, native = TEMPLATES[i % len(TEMPLATES)]
+        get_rendered(source, CTX, capture_macros=capture_macros, native=native)
+    return time.perf_counter() - start
+
+
+def compare(renders: int, label: str) -> None:
+    timed(len(TEMPLATES))  # warm up the shared environments and the cache
+    shared = timed(renders)
+    with mock.patch.object(jinja, "get_environment", per_call_environment):
+        per_call = timed(renders)
+    print(
+        f"{renders} renders, {label}: per-call environment {renders / per_call:8.0f}/s, "
+        f"shared environment {renders / shared:8.0f}/s"
+    )
+
+
+if __name__ == "__main__":
+    renders = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    compare(renders, "no bytecode cache")
+    with tempfile.TemporaryDirectory() as directory:
+        template_bytecode_cache.directory = directory
+        compare(renders, "warm bytecode cache")
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+"""Time building the macro part of a node's context, for a manifest with a
+few thousand macros: the lazy MacroNamespace over a shared MacroIndex against
+the eager construction it replaced, which created a MacroGenerator for every
+macro and copied them all into the context. Run with:
+python performance/benchmarks/macro_namespace.py [MACROS [NODES]]
+"""
+import gc
+import sys
+import time
+from types import SimpleNamespace
+from typing import Any, Dict
+
+from dbt.clients.jinja import LazyContext, MacroGenerator, MacroStack
+from dbt.context.macros import MacroNamespaceBuilder, get_macro_index
+from dbt.contracts.graph.manifest import MacroLookup
+from dbt.contracts.graph.parsed import ParsedMacro
+from dbt.node_types import NodeType
+
+ROOT_PACKAGE = "my_project"
+PACKAGES = [ROOT_PACKAGE, "dbt_utils", "codegen", "audit_helper", "dbt_expectations"]
+INTERNAL_PACKAGES = ["dbt_postgres", "dbt"]
+# the number of macros a node calls while it is rendered
+CALLED = 10
+
+
+def make_macros(count: int) -> Dict[str, ParsedMacro]:
+    packages = PACKAGES + INTERNAL_PACKAGES
+    macros = {}
+    for i in range(count):
+        package_name = packages[i % len(packages)]
+        name = f"macro_{i // len(packages)}"
+        macro = ParsedMacro(
+            name=name,
+            resource_type=NodeType.Macro,
+            unique_id=f"macro.{package_name}.{name}",
+            package_name=package_name,
+            original_file_path=f"macros/{name}.sql",
+            root_path="/usr/src/app",
+            path=f"{name}.sql",
+            macro_sql=f"{{% macro {name}() %}}select 1{{% endmacro %}}",
+        )
+        macros[macro.unique_id] = macro
+    return macros
+
+
+def builtins() -> Dict[str, Any]:
+    # stands in for the ~100 context members of a ProviderContext
+    return {f"builtin_{i}": i for i in range(100)}
+
+
+def eager_context(manifest, search_package: str) -> Dict[str, Any]:
+    """The previous ManifestContext: a MacroGenerator for every macro,
+    sorted into namespaces and flattened into the context dictionary.
+    """
+    ctx: Dict[str, Any] = {}
+    thread_ctx = MacroStack()
+    internal = set(INTERNAL_PACKAGES)
+    packages: Dict[str, Dict[str, MacroGenerator]] = {}
+    internal_packages: Dict[str, Dict[str, MacroGenerator]] = {}
+    local_namespace: Dict[str, MacroGenerator] = {}
+    global_namespace: Dict[str, MacroGenerator] = {}
+    for macro in manifest.macros.values():
+        macro_func = MacroGenerator(macro, ctx, None, thread_ctx)
+        if macro.package_name in internal:
+            internal_packages.setdefault(macro.package_name, {})[macro.name] = macro_func
+        else:
+            packages.setdefault(macro.package_name, {})[macro.name] = macro_func
+            if macro.package_name == search_package:
+                local_namespace[macro.name] = macro_func
+            elif macro.package_name == ROOT_PACKAGE:
+                global_namespace[macro.name] = macro_func
+    global_project_namespace: Dict[str, MacroGenerator] = {}
+    for pkg in reversed(INTERNAL_PACKAGES):
+        global_project_namespace.update(internal_packages.get(pkg, {}))
+
+    ctx.update(builtins())
+    flat: Dict[str, Any] = dict(global_project_namespace)
+    flat["dbt"] = global_project_namespace
+    flat.update(packages)
+    flat.update(global_namespace)
+    flat.update(local_namespace)
+    ctx.update(flat)
+    for i in range(CALLED):
+        ctx[f"macro_{i}"]
+    return ctx
+
+
+def lazy_context(manifest, search_package: str) -> Dict[str, Any]:
+    """What ManifestContext does now: a MacroNamespace over the manifest's
+    shared MacroIndex, used as the fallback of the context dictionary.
+    """
+    ctx = LazyContext()
+    builder = MacroNamespaceBuilder(ROOT_PACKAGE, search_package, MacroStack(), INTERNAL_PACKAGES)
+    index = get_macro_index(manifest, ROOT_PACKAGE, INTERNAL_PACKAGES)
+    namespace = builder.build_namespace_from_index(index, ctx)
+    ctx.update(builtins())
+    for key in list(ctx):
+        if key in namespace:
+            ctx[key] = namespace[key]
+    ctx.fallback = namespace
+    for i in range(CALLED):
+        ctx[f"macro_{i}"]
+    return ctx
+
+
+def timed(build, manifest, nodes: int) -> float:
+    # don't bill this run for collecting the previous run's garbage
+    gc.collect()
+    start = time.perf_counter()
+    for i in range(nodes):
+        build(manifest, PACKAGES[i % len(PACKAGES)])
+    return time.perf_counter() - start
+
+
+def compare(macro_count: int, nodes: int) -> None:
+    macros = make_macros(macro_count)
+    manifest = SimpleNamespace(macros=macros, macro_lookup=MacroLookup(macros))
+
+    eager = timed(eager_context, manifest, nodes)
+    lazy = timed(lazy_context, manifest, nodes)
+    print(
+        f"{macro_count:>6} macros, {nodes:>5} nodes: "
+        f"eager {eager / nodes * 1e6:8.1f}us/node, lazy {lazy / nodes * 1e6:6.1f}us/node"
+    )
+
+
+if __name__ == "__main__":
+    macro_count = int(sys.argv[1]) if len(sys.argv) > 1 else 4_000
+    nodes = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000
+    compare(macro_count, nodes)
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+"""Measure filling a RelationsCache with many relations across many schemas,
+then listing each schema and renaming relations in it, the way a run does.
+Run with: python performance/benchmarks/relations_cache.py [RELATIONS [SCHEMAS]]
+"""
+import sys
+import time
+
+from dbt.adapters.base.relation import BaseRelation
+from dbt.adapters.cache import RelationsCache
+
+
+def measure(relation_count: int, schema_count: int) -> None:
+    relations = [
+        BaseRelation.create(database="db", schema=f"schema_{i % schema_count}", identifier=f"t{i}")
+        for i in range(relation_count)
+    ]
+    cache = RelationsCache()
+
+    start = time.perf_counter()
+    for relation in relations:
+        cache.add(relation)
+    fill = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(schema_count):
+        cache.get_relations("db", f"schema_{i}")
+    listing = time.perf_counter() - start
+
+    renamed = relations[:2000]
+    start = time.perf_counter()
+    for relation in renamed:
+        cache.rename(
+            relation, relation.incorporate(path={"identifier": f"{relation.identifier}_x"})
+        )
+    rename = time.perf_counter() - start
+
+    print(
+        f"{relation_count:>7} relations in {schema_count} schemas: fill {fill:.2f}s, "
+        f"list every schema {listing:.2f}s, {len(renamed)} renames {rename:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    relation_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    schema_count = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    measure(relation_count, schema_count)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+"""Time fetching a large query result: fetchall into an agate table, as
+`execute(..., fetch=True)` does, against fetchmany chunks into a
+ColumnarResult with `stream=True`, read as rows and then converted with
+to_agate(). The cursor is an in-memory stand-in, so this times dbt's side of
+the fetch only. Run with:
+python performance/benchmarks/streamed_results.py [ROWS ...]
+"""
+import datetime
+import gc
+import sys
+import time
+import tracemalloc
+from decimal import Decimal
+
+from dbt.adapters.sql import SQLConnectionManager
+from dbt.clients.agate_helper import ColumnarResult
+
+COLUMNS = [("id",), ("name",), ("amount",), ("created_at",)]
+
+
+class FakeCursor:
+    def __init__(self, rows: int) -> None:
+        self.description = COLUMNS
+        start = datetime.datetime(2022, 1, 1)
+        self._rows = [
+            (i, f"name_{i}", Decimal(i) / 100, start + datetime.timedelta(seconds=i))
+            for i in range(rows)
+        ]
+        self._position = 0
+
+    def fetchall(self):
+        return self.fetchmany(len(self._rows))
+
+    def fetchmany(self, size):
+        chunk = self._rows[self._position : self._position + size]
+        self._position += len(chunk)
+        return chunk
+
+
+def timed(func, rows: int):
+    # don't bill this run for collecting the previous run's garbage
+    gc.collect()
+    cursor = FakeCursor(rows)
+    start = time.perf_counter()
+    result = func(cursor)
+    elapsed = time.perf_counter() - start
+    # a second run for the peak memory, as tracing slows the first down
+    cursor = FakeCursor(rows)
+    gc.collect()
+    tracemalloc.start()
+    func(cursor)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 2**20
+
+
+def compare(rows: int) -> None:
+    table, fetchall, fetchall_peak = timed(SQLConnectionManager.get_result_from_cursor, rows)
+    result, streamed, streamed_peak = timed(
+        SQLConnectionManager.get_columnar_result_from_cursor, rows
+    )
+    assert isinstance(result, ColumnarResult) and len(result) == len(table)
+    gc.collect()
+    start = time.perf_counter()
+    converted = result.to_agate()
+    to_agate = time.perf_counter() - start
+    assert [list(r) for r in converted] == [list(r) for r in table]
+    print(
+        f"{rows:>9} rows: agate table {fetchall:6.2f}s ({fetchall_peak:6.0f}MB), "
+        f"streamed {streamed:6.2f}s ({streamed_peak:6.0f}MB), then to_agate() {to_agate:6.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000]
+    for size in sizes:
+        compare(size)
@@ -0,0 +1,54 @@
+import random
+
+import networkx as nx  # type: ignore
+
+
+def random_dag(size: int, max_parents: int = 3, window: int = 200, seed: int = 0) -> nx.DiGraph:
+    """Build a DAG shaped roughly like a dbt project: every node depends on
+    up to `max_parents` of the `window` nodes created just before it. Edges
+    point from parents to children, like the graph built by the Linker.
+    """
+    rng = random.Random(seed)
+    graph = nx.DiGraph()
+    for index in range(size):
+        node = f"model.bench.node_{index}"
+        graph.add_node(node)
+        if index == 0:
+            continue
+        first = max(0, index - window)
+        for parent in rng.sample(range(first, index), min(max_parents, index - first)):
+            graph.add_edge(f"model.bench.node_{parent}", node)
+    return graph
+
+
+def domain_dag(
+    size: int,
+    domain_size: int = 200,
+    max_parents: int = 3,
+    window: int = 30,
+    staging: int = 40,
+    seed: int = 0,
+) -> nx.DiGraph:
+    """Build a DAG shaped like a project split into domains: every node
+    depends on up to `max_parents` of the `window` nodes created just before
+    it in its domain, and some also depend on one of the first `staging`
+    nodes of an earlier domain. Unlike random_dag, the number of ancestors of
+    a node doesn't grow with the size of the project.
+    """
+    rng = random.Random(seed)
+    graph = nx.DiGraph()
+    for index in range(size):
+        node = f"model.bench.node_{index}"
+        graph.add_node(node)
+        domain_start = index - index % domain_size
+        position = index - domain_start
+        if position == 0:
+            continue
+        first = max(domain_start, index - window)
+        for parent in rng.sample(range(first, index), min(max_parents, index - first)):
+            graph.add_edge(f"model.bench.node_{parent}", node)
+        if position >= staging and domain_start > 0 and rng.random() < 0.1:
+            other_domain = rng.randrange(domain_start // domain_size) * domain_size
+            parent = other_domain + rng.randrange(staging)
+            graph.add_edge(f"model.bench.node_{parent}", node)
+    return graph
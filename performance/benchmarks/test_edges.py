@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""Compare Compiler.add_test_edges against the per-node ancestor search it
+replaced, on synthetic DAGs where every model has a couple of tests and some
+have a relationship test with an earlier model. The previous implementation
+is only timed up to --old-limit nodes, as it is quadratic. Run with:
+python performance/benchmarks/test_edges.py [--old-limit N] [SIZE ...]
+"""
+import argparse
+import gc
+import random
+import time
+from collections import defaultdict
+from types import SimpleNamespace
+
+import networkx as nx  # type: ignore
+
+from dbt.compilation import Compiler, Linker, _get_tests_for_node
+from dbt.node_types import NodeType
+from synthetic import domain_dag
+
+
+def build_project(size: int):
+    graph = domain_dag(size)
+    rng = random.Random(0)
+    nodes = {}
+    child_map = defaultdict(list)
+    for index, model_id in enumerate(list(graph)):
+        nodes[model_id] = SimpleNamespace(resource_type=NodeType.Model, depends_on_nodes=[])
+        depends_on = [[model_id], [model_id]]
+        if index > 0 and rng.random() < 0.2:
+            depends_on.append([model_id, f"model.bench.node_{rng.randrange(index)}"])
+        for test_index, test_depends_on in enumerate(depends_on):
+            test_id = f"test.bench.test_{index}_{test_index}"
+            nodes[test_id] = SimpleNamespace(
+                resource_type=NodeType.Test, depends_on_nodes=test_depends_on
+            )
+            for parent_id in test_depends_on:
+                graph.add_edge(parent_id, test_id)
+                child_map[parent_id].append(test_id)
+    return graph, SimpleNamespace(nodes=nodes, child_map=child_map)
+
+
+def ancestor_search(linker, manifest):
+    """The previous add_test_edges: the ancestors of every executable node,
+    then every test of each of those ancestors.
+    """
+    for node_id in linker.graph:
+        if node_id in manifest.nodes and manifest.nodes[node_id].resource_type != NodeType.Test:
+            all_upstream_nodes = nx.traversal.bfs_tree(linker.graph, node_id, reverse=True)
+            upstream_nodes = set([n for n in all_upstream_nodes if n != node_id])
+            upstream_tests = []
+            for upstream_node in upstream_nodes:
+                upstream_tests += _get_tests_for_node(manifest, upstream_node)
+            for upstream_test in upstream_tests:
+                test_depends_on = set(manifest.nodes[upstream_test].depends_on_nodes)
+                if test_depends_on.issubset(upstream_nodes):
+                    linker.graph.add_edge(upstream_test, node_id)
+
+
+def timed(func, graph, manifest):
+    linker = Linker()
+    linker.graph = graph.copy()
+    # don't bill this run for collecting the previous run's garbage
+    gc.collect()
+    start = time.perf_counter()
+    func(linker, manifest)
+    return linker.graph, time.perf_counter() - start
+
+
+def compare(size: int, old_limit: int) -> None:
+    graph, manifest = build_project(size)
+    compiler = Compiler(config=None)  # type: ignore
+
+    new, new_elapsed = timed(compiler.add_test_edges, graph, manifest)
+    added = new.number_of_edges() - graph.number_of_edges()
+    message = f"{size:>7} models, {added:>9} test edges: reachability {new_elapsed:.3f}s"
+    if size <= old_limit:
+        old, old_elapsed = timed(ancestor_search, graph, manifest)
+        assert set(new.edges()) == set(old.edges())
+        message += f", ancestor search {old_elapsed:.3f}s"
+    print(message)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--old-limit", type=int, default=10_000)
+    parser.add_argument("sizes", type=int, nargs="*", default=[1_000, 10_000, 50_000])
+    args = parser.parse_args()
+    for size in args.sizes:
+        compare(size, args.old_limit)
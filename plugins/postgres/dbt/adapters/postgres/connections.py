@@ -1,10 +1,13 @@
 from contextlib import contextmanager
 
+import agate
 import psycopg2
+from psycopg2 import extensions as psycopg2_extensions
 
 import dbt.exceptions
 from dbt.adapters.base import Credentials
 from dbt.adapters.sql import SQLConnectionManager
+from dbt.clients import agate_helper
 from dbt.contracts.connection import AdapterResponse
 from dbt.events import AdapterLogger
 
@@ -15,6 +18,17 @@ from typing import Optional
 
 logger = AdapterLogger("Postgres")
 
+# the agate types of the values psycopg2 returns for these type oids. Others,
+# like json and arrays, are inferred from the values
+COLUMN_TYPES = {
+    **{oid: agate_helper.NUMBER_TYPE for oid in psycopg2.NUMBER.values},
+    **{oid: agate_helper.TEXT_TYPE for oid in psycopg2.STRING.values},
+    **{oid: agate_helper.BOOLEAN_TYPE for oid in psycopg2_extensions.BOOLEAN.values},
+    **{oid: agate_helper.DATE_TYPE for oid in psycopg2_extensions.PYDATE.values},
+    **{oid: agate_helper.DATETIME_TYPE for oid in psycopg2_extensions.PYDATETIME.values},
+    **{oid: agate_helper.DATETIME_TYPE for oid in psycopg2_extensions.PYDATETIMETZ.values},
+}
+
 
 @dataclass
 class PostgresCredentials(Credentials):
@@ -149,6 +163,37 @@ class PostgresConnectionManager(SQLConnectionManager):
 
         return connection
 
+    @classmethod
+    def _reset_handle(cls, connection):
+        # DISCARD ALL drops temporary tables, prepared statements, advisory locks
+        # and listens, as well as resetting the session's settings and the role
+        # open() set. It can't run inside a transaction block, so it runs in
+        # autocommit mode, and so does setting the role again, so that it
+        # outlasts the next rollback.
+        handle = connection.handle
+        handle.rollback()
+        handle.autocommit = True
+        try:
+            handle.cursor().execute("discard all")
+            credentials = cls.get_credentials(connection.credentials)
+            if credentials.role:
+                handle.cursor().execute("set role {}".format(credentials.role))
+        finally:
+            handle.autocommit = False
+
+    @classmethod
+    def _is_handle_usable(cls, connection):
+        handle = connection.handle
+        if handle.closed:
+            return False
+        try:
+            handle.cursor().execute("select 1")
+            handle.rollback()
+        except Exception as e:
+            logger.debug(f"Pooled connection failed its health check: {e}")
+            return False
+        return True
+
     def cancel(self, connection):
         connection_name = connection.name
         try:
@@ -174,6 +219,10 @@ class PostgresConnectionManager(SQLConnectionManager):
     def get_credentials(cls, credentials):
         return credentials
 
+    @classmethod
+    def get_column_type(cls, type_code) -> Optional[agate.data_types.DataType]:
+        return COLUMN_TYPES.get(type_code)
+
     @classmethod
     def get_response(cls, cursor) -> AdapterResponse:
         message = str(cursor.statusmessage)
@@ -1,7 +1,7 @@
 
 {% macro postgres__get_catalog(information_schema, schemas) -%}
 
-  {%- call statement('catalog', fetch_result=True) -%}
+  {%- call statement('catalog', fetch_result=True, stream=True) -%}
     {#
       If the user has multiple databases set and the first one is wrong, this will fail.
       But we won't fail in the case where there are multiple quoting-difference-only dbs, which is better.
@@ -9,6 +9,7 @@ import os
 from shutil import rmtree
 from tempfile import mkdtemp
 from dbt.clients import agate_helper
+from dbt.exceptions import RuntimeException
 
 SAMPLE_CSV_DATA = """a,b,c,d,e,f,g
 1,n,test,3.2,20180806T11:33:29.320Z,True,NULL
@@ -179,3 +180,140 @@ class TestAgateHelper(unittest.TestCase):
         for i, row in enumerate(tbl):
             self.assertEqual(list(row), expected[i])
 
+
+
+class FetchManyCursor:
+    def __init__(self, rows):
+        self.rows = rows
+        self.chunk_sizes = []
+
+    def fetchmany(self, size):
+        self.chunk_sizes.append(size)
+        chunk, self.rows = self.rows[:size], self.rows[size:]
+        return chunk
+
+
+class TestColumnarResult(unittest.TestCase):
+    column_names = ['id', 'name', 'payload']
+    data = [
+        (1, 'one', {'a': 1}),
+        (2, '0002', None),
+        (3, 'three', [1, 2]),
+        (4, 'four', None),
+        (5, 'five', None),
+    ]
+
+    def test_from_cursor(self):
+        cursor = FetchManyCursor(list(self.data))
+        result = agate_helper.ColumnarResult.from_cursor(cursor, self.column_names, 2)
+        self.assertEqual(cursor.chunk_sizes, [2, 2, 2, 2])
+        self.assertEqual(len(result), 5)
+        self.assertEqual(result.column_names, ('id', 'name', 'payload'))
+        self.assertEqual(result.column('id'), [1, 2, 3, 4, 5])
+        self.assertEqual(list(result), self.data)
+        with self.assertRaises(KeyError):
+            result.column('missing')
+
+    def test_rows(self):
+        result = agate_helper.ColumnarResult(self.column_names)
+        result.extend(self.data)
+        rows = result.rows
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[0], (1, 'one', {'a': 1}))
+        self.assertEqual(rows[-1], (5, 'five', None))
+        self.assertEqual(rows[1:4:2], [self.data[1], self.data[3]])
+        with self.assertRaises(IndexError):
+            rows[5]
+        self.assertEqual(list(agate_helper.as_matrix(result)), self.data)
+
+    def test_to_agate(self):
+        result = agate_helper.ColumnarResult(self.column_names)
+        result.extend(self.data)
+        expected = agate_helper.table_from_data_flat(
+            [dict(zip(self.column_names, row)) for row in self.data], self.column_names
+        )
+        tbl = result.to_agate()
+        self.assertIs(result.to_agate(), tbl)
+        self.assertEqual(tbl.column_names, expected.column_names)
+        self.assertEqual(
+            [type(t) for t in tbl.column_types], [type(t) for t in expected.column_types]
+        )
+        self.assertEqual([list(r) for r in tbl], [list(r) for r in expected])
+        # '0002' stays text, as with table_from_data_flat
+        self.assertEqual(tbl[1]['name'], '0002')
+
+    def test_empty(self):
+        result = agate_helper.ColumnarResult.from_cursor(FetchManyCursor([]), ['a'], 10)
+        self.assertEqual(len(result), 0)
+        self.assertEqual(list(result), [])
+        self.assertEqual(len(result.to_agate()), 0)
+        self.assertEqual(list(agate_helper.ColumnarResult([]).rows), [])
+
+    def test_declared_types(self):
+        column_names = ['id', 'code', 'created_at', 'empty']
+        column_types = [
+            agate_helper.NUMBER_TYPE,
+            agate_helper.TEXT_TYPE,
+            agate_helper.DATETIME_TYPE,
+            agate_helper.TEXT_TYPE,
+        ]
+        rows = [
+            (1, '005', datetime(2022, 1, 1), None),
+            (2, 'null', datetime(2022, 1, 2), None),
+        ]
+        result = agate_helper.ColumnarResult(column_names, column_types)
+        result.extend(rows)
+        inferred = agate_helper.ColumnarResult(column_names)
+        inferred.extend(rows)
+
+        self.assertEqual(result.column_types, tuple(column_types))
+        # an all-null column is only text if its type says so
+        self.assertIsInstance(inferred.column_types[3], agate.data_types.Number)
+        self.assertEqual(
+            [type(t) for t in result.column_types[:3]],
+            [type(t) for t in inferred.column_types[:3]],
+        )
+        self.assertEqual(list(result.typed_rows()[1])[:3], list(inferred.typed_rows()[1])[:3])
+        self.assertEqual(
+            list(result.typed_rows()[0]), [Decimal(1), '005', datetime(2022, 1, 1), None]
+        )
+        # the values themselves are left as they were fetched
+        self.assertEqual(result[0], rows[0])
+
+        tbl = agate_helper.table_from_data_flat(
+            [dict(zip(column_names, row)) for row in rows], column_names, column_types
+        )
+        self.assertEqual(tbl.column_types, tuple(column_types))
+        self.assertEqual(tbl[1]['code'], 'null')
+
+    def test_agate_attributes(self):
+        result = agate_helper.ColumnarResult(self.column_names)
+        result.extend(self.data)
+        self.assertEqual(list(result.columns['id'].values()), [Decimal(i) for i in range(1, 6)])
+        self.assertEqual(len(result.where(lambda row: row['id'] > 2)), 3)
+        self.assertEqual(result.print_table, result.to_agate().print_table)
+        with self.assertRaises(AttributeError):
+            result.missing_attribute
+
+    def test_where_with_types(self):
+        result = agate_helper.ColumnarResult(['schema', 'n'])
+        result.extend([(1, 1), ('b', 2), (None, 3)])
+        text = result.with_types({'schema': agate_helper.TEXT_TYPE})
+        filtered = text.where(lambda row: row['schema'] is not None)
+        self.assertIsInstance(filtered, agate_helper.ColumnarResult)
+        self.assertEqual(list(filtered.typed_rows()), [('1', Decimal(1)), ('b', Decimal(2))])
+        self.assertEqual(list(filtered), [(1, 1), ('b', 2)])
+        # the original is unchanged
+        self.assertEqual(len(result), 3)
+
+    def test_merge(self):
+        first = agate_helper.ColumnarResult(['a', 'b'], [agate_helper.TEXT_TYPE, None])
+        first.extend([('x', 1)])
+        second = agate_helper.ColumnarResult(['a', 'b'], [agate_helper.TEXT_TYPE, None])
+        second.extend([('y', 2), ('z', 3)])
+        merged = agate_helper.ColumnarResult.merge([first, second])
+        self.assertEqual(list(merged), [('x', 1), ('y', 2), ('z', 3)])
+        self.assertIs(merged.column_types[0], agate_helper.TEXT_TYPE)
+
+        with self.assertRaises(RuntimeException):
+            agate_helper.ColumnarResult.merge([first, agate_helper.ColumnarResult(['a'])])
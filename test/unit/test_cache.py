@@ -1,10 +1,21 @@
-from unittest import TestCase
+from unittest import TestCase, mock
 from dbt.adapters.cache import RelationsCache
 from dbt.adapters.base.relation import BaseRelation
 from multiprocessing.dummy import Pool as ThreadPool
 import dbt.exceptions
+import dbt.flags as flags
+from dbt.events.types import (
+    AddRelation,
+    DropCascade,
+    DumpAfterAddGraph,
+    DumpAfterRenameSchema,
+    DumpBeforeAddGraph,
+    DumpBeforeRenameSchema,
+    RenameSchema,
+)
 
 import random
+import threading
 import time
 
 
@@ -489,3 +500,144 @@ class TestComplexCache(TestCase):
         self.assertEqual(len(self.cache.get_relations('dbt', 'bar')), 1)
         self.assertEqual(len(self.cache.get_relations('dbt_2', 'foo')), 1)
         self.assertEqual(len(self.cache.relations), 2)
+
+
+class TestBoundedCache(TestCase):
+    def setUp(self):
+        self.cache = RelationsCache(max_schemas=2)
+
+    def test_least_recently_used_schema_evicted(self):
+        self.cache.add(make_relation('dbt', 'one', 'a'))
+        self.cache.add(make_relation('dbt', 'two', 'b'))
+        # reading 'one' makes 'two' the least recently used
+        self.cache.get_relations('dbt', 'one')
+        self.cache.add(make_relation('dbt', 'three', 'c'))
+
+        self.assertEqual(self.cache.schemas, {('dbt', 'one'), ('dbt', 'three')})
+        self.assertNotIn(('dbt', 'two'), self.cache)
+        self.assertTrue(self.cache.is_evicted('dbt', 'two'))
+        self.assertEqual(len(self.cache.relations), 2)
+
+    def test_restore_schema(self):
+        self.cache.add(make_relation('dbt', 'one', 'a'))
+        self.cache.add(make_relation('dbt', 'two', 'b'))
+        self.cache.add(make_relation('dbt', 'three', 'c'))
+        self.assertTrue(self.cache.is_evicted('dbt', 'one'))
+
+        # relations added to an evicted schema don't make it cached again
+        self.cache.add(make_relation('dbt', 'one', 'd'))
+        self.assertNotIn(('dbt', 'one'), self.cache)
+
+        self.cache.restore_schema('dbt', 'one', [make_relation('dbt', 'one', 'a')])
+        self.assertIn(('dbt', 'one'), self.cache)
+        self.assertFalse(self.cache.is_evicted('dbt', 'one'))
+        self.assertEqual(
+            {r.identifier for r in self.cache.get_relations('dbt', 'one')}, {'a', 'd'}
+        )
+        # and the least recently used schema made way for it
+        self.assertTrue(self.cache.is_evicted('dbt', 'two'))
+
+    def test_linked_schema_not_evicted(self):
+        self.cache.add(make_relation('dbt', 'one', 'a'))
+        self.cache.add(make_relation('dbt', 'one', 'b'))
+        self.cache.add_link(make_relation('dbt', 'one', 'a'), make_relation('dbt', 'one', 'b'))
+        self.cache.add(make_relation('dbt', 'two', 'c'))
+        self.cache.add(make_relation('dbt', 'three', 'd'))
+
+        self.assertIn(('dbt', 'one'), self.cache)
+        self.assertTrue(self.cache.is_evicted('dbt', 'two'))
+        # the link still cascades
+        self.cache.drop(make_relation('dbt', 'one', 'a'))
+        self.assertEqual(self.cache.get_relations('dbt', 'one'), [])
+
+    def test_busy_schema_not_evicted(self):
+        self.cache.add(make_relation('dbt', 'one', 'a'))
+        self.cache.add(make_relation('dbt', 'two', 'b'))
+        lock = self.cache.schema_lock('dbt', 'one')
+        acquired = threading.Event()
+        release = threading.Event()
+
+        def hold_lock():
+            with lock:
+                acquired.set()
+                release.wait()
+
+        thread = threading.Thread(target=hold_lock)
+        thread.start()
+        acquired.wait()
+        try:
+            self.cache.add(make_relation('dbt', 'three', 'c'))
+        finally:
+            release.set()
+            thread.join()
+        self.assertIn(('dbt', 'one'), self.cache)
+        self.assertTrue(self.cache.is_evicted('dbt', 'two'))
+
+
+class TestSchemaLocks(TestCase):
+    def test_other_schemas_not_blocked(self):
+        cache = RelationsCache()
+        cache.add(make_relation('dbt', 'one', 'a'))
+        lock = cache.schema_lock('dbt', 'one')
+        acquired = threading.Event()
+        release = threading.Event()
+
+        def hold_lock():
+            with lock:
+                acquired.set()
+                release.wait()
+
+        thread = threading.Thread(target=hold_lock)
+        thread.start()
+        acquired.wait()
+        try:
+            # none of these need the lock of schema 'one'
+            cache.add(make_relation('dbt', 'two', 'b'))
+            cache.rename(make_relation('dbt', 'two', 'b'), make_relation('dbt', 'two', 'c'))
+            cache.drop(make_relation('dbt', 'two', 'c'))
+            self.assertEqual(cache.get_relations('dbt', 'two'), [])
+        finally:
+            release.set()
+            thread.join()
+
+
+class TestCacheEvents(TestCase):
+    # the events the cache only builds when they will be logged
+    GUARDED_EVENTS = (
+        AddRelation, DumpBeforeAddGraph, DumpAfterAddGraph, RenameSchema,
+        DumpBeforeRenameSchema, DumpAfterRenameSchema, DropCascade,
+    )
+
+    def setUp(self):
+        self.cache = RelationsCache()
+
+    def tearDown(self):
+        flags.LOG_CACHE_EVENTS = False
+
+    def run_operations(self):
+        self.cache.add(make_relation('dbt', 'schema', 'foo'))
+        self.cache.add(make_relation('dbt', 'schema', 'bar'))
+        self.cache.add_link(
+            make_relation('dbt', 'schema', 'foo'), make_relation('dbt', 'schema', 'bar')
+        )
+        self.cache.rename(make_relation('dbt', 'schema', 'foo'), make_relation('dbt', 'schema', 'baz'))
+        self.cache.drop(make_relation('dbt', 'schema', 'baz'))
+        self.cache.restore_schema('dbt', 'other', [make_relation('dbt', 'other', 'foo')])
+
+    def test_skipped_without_log_cache_events(self):
+        flags.LOG_CACHE_EVENTS = False
+        with mock.patch('dbt.adapters.cache.fire_event') as fire_event:
+            self.run_operations()
+        codes = {c[0][0].code for c in fire_event.call_args_list}
+        for event_type in self.GUARDED_EVENTS:
+            self.assertNotIn(event_type.code, codes)
+        self.assertEqual(self.cache.get_relations('dbt', 'schema'), [])
+        self.assertEqual(len(self.cache.get_relations('dbt', 'other')), 1)
+
+    def test_fired_with_log_cache_events(self):
+        flags.LOG_CACHE_EVENTS = True
+        with mock.patch('dbt.adapters.cache.fire_event') as fire_event:
+            self.run_operations()
+        codes = {c[0][0].code for c in fire_event.call_args_list}
+        for event_type in self.GUARDED_EVENTS:
+            self.assertIn(event_type.code, codes)
@@ -1,4 +1,6 @@
 import unittest
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import dbt.flags
@@ -569,3 +571,110 @@ class CompilerTest(unittest.TestCase):
             'select * from __dbt__cte__inner_ephemeral')
         )
 
+    def test__prepend_ctes__shared_ephemeral_compiled_once(self):
+        ephemeral_config = self.model_config.replace(materialized='ephemeral')
+
+        def model(name, raw_sql, config):
+            return ParsedModelNode(
+                name=name,
+                database='dbt',
+                schema='analytics',
+                alias=name,
+                resource_type=NodeType.Model,
+                unique_id=f'model.root.{name}',
+                fqn=['root', name],
+                package_name='root',
+                root_path='/usr/src/app',
+                config=config,
+                path=f'{name}.sql',
+                original_file_path=f'{name}.sql',
+                raw_sql=raw_sql,
+                checksum=FileHash.from_contents(''),
+            )
+
+        nodes = [
+            model('inner_ephemeral', 'select * from source_table', ephemeral_config),
+            model('ephemeral', 'select * from {{ ref("inner_ephemeral") }}', ephemeral_config),
+        ]
+        views = [
+            model(f'view_{i}', 'select * from {{ ref("ephemeral") }}', self.model_config)
+            for i in range(20)
+        ]
+        manifest = Manifest(
+            macros={},
+            nodes={n.unique_id: n for n in nodes + views},
+            sources={},
+            docs={},
+            disabled=[],
+            files={},
+            exposures={},
+            metrics={},
+            selectors={},
+        )
+
+        compiled_ids = Counter()
+        compile_node = dbt.compilation.Compiler._compile_node
+
+        def counting_compile_node(compiler, node, *args, **kwargs):
+            compiled_ids[node.unique_id] += 1
+            return compile_node(compiler, node, *args, **kwargs)
+
+        def compile_view(view):
+            compiler = dbt.compilation.Compiler(self.config)
+            return compiler.compile_node(view, manifest, write=False)
+
+        with patch.object(dbt.compilation.Compiler, '_compile_node', counting_compile_node):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(compile_view, views))
+
+        self.assertEqual(compiled_ids['model.root.inner_ephemeral'], 1)
+        self.assertEqual(compiled_ids['model.root.ephemeral'], 1)
+        for result in results:
+            self.assertEqual(
+                [cte.id for cte in result.extra_ctes],
+                ['model.root.inner_ephemeral', 'model.root.ephemeral'],
+            )
+            self.assertEqualIgnoreWhitespace(
+                result.compiled_sql,
+                ('with __dbt__cte__inner_ephemeral as ('
+                 'select * from source_table'
+                 '), '
+                 '__dbt__cte__ephemeral as ('
+                 'select * from __dbt__cte__inner_ephemeral'
+                 ') '
+                 'select * from __dbt__cte__ephemeral'))
+
+    def test__inject_ctes_into_sql(self):
+        compiler = dbt.compilation.Compiler(self.config)
+        ctes = [
+            InjectedCTE(id='model.root.a', sql=' __dbt__cte__a as (select 1)'),
+            InjectedCTE(id='model.root.b', sql=' __dbt__cte__b as (select 2)'),
+        ]
+        injected = ' __dbt__cte__a as (select 1),  __dbt__cte__b as (select 2)'
+        cases = [
+            # scanned
+            ('select * from x', f'with{injected}select * from x'),
+            ('\n-- with\nselect 1', f'\nwith{injected}-- with\nselect 1'),
+            (
+                "/* c */ WITH y as (select 'with') select 1",
+                f"/* c */ WITH {injected},y as (select 'with') select 1",
+            ),
+            ('select * from (with z as (select 1) select * from z)',
+             f'with{injected}select * from (with z as (select 1) select * from z)'),
+            # parsed
+            ('select 1; select 2', f'with{injected}select 1; '),
+            ('select now()::timestamp with time zone',
+             f'select now()::timestamp with {injected},time zone'),
+            ("select 'a\\'with' as x", f"with{injected}select 'a\\'with' as x"),
+        ]
+        for sql, expected in cases:
+            self.assertEqual(compiler._inject_ctes_into_sql(sql, ctes), expected)
+
+        find = dbt.compilation._find_cte_insertion_point
+        self.assertEqual(find('select * from x'), (0, False))
+        self.assertEqual(find('  with y as (select 1) select * from y'), (7, True))
+        self.assertIsNone(find('select 1; select 2'))
+        self.assertIsNone(find('select now()::timestamp with time zone'))
+        self.assertIsNone(find("select 'a\\'with' as x"))
+        self.assertIsNone(find('select (1'))
+        self.assertIsNone(find('  '))
@@ -9,13 +9,14 @@ import pytest
 from dbt.adapters import postgres
 from dbt.adapters import factory
 from dbt.adapters.base import AdapterConfig
-from dbt.clients.jinja import MacroStack
+from dbt.clients.jinja import LazyContext, MacroStack, get_rendered
 from dbt.contracts.graph.parsed import (
     ParsedModelNode, NodeConfig, DependsOn, ParsedMacro
 )
 from dbt.config.project import VarProvider
 from dbt.context import base, target, configured, providers, docs, manifest, macros
 from dbt.contracts.files import FileHash
+from dbt.contracts.graph.manifest import MacroLookup
 from dbt.node_types import NodeType
 import dbt.exceptions
 from .utils import profile_from_dict, config_from_parts_or_dicts, inject_adapter, clear_plugin
@@ -162,7 +163,8 @@ class TestRuntimeWrapper(unittest.TestCase):
 def assert_has_keys(
     required_keys: Set[str], maybe_keys: Set[str], ctx: Dict[str, Any]
 ):
-    keys = set(ctx)
+    # macros are looked up in the fallback of a LazyContext when they are used
+    keys = set(ctx).union(getattr(ctx, 'fallback', ()))
     for key in required_keys:
         assert key in keys, f'{key} in required keys but not in context'
         keys.remove(key)
@@ -307,7 +309,7 @@ def mock_manifest(config):
     for name in ['macro_a', 'macro_b']:
         macro = mock_macro(name, config.project_name)
         manifest_macros[macro.unique_id] = macro
-    return mock.MagicMock(macros=manifest_macros)
+    return mock.MagicMock(macros=manifest_macros, macro_lookup=MacroLookup(manifest_macros))
 
 
 def mock_model():
@@ -464,3 +466,89 @@ def test_macro_namespace(config_postgres, manifest_fx):
         assert result['dbt']['some_macro'].macro is pg_macro
         assert result['root']['some_macro'].macro is package_macro
         assert result['some_macro'].macro is package_macro
+
+
+def _real_macro(name, package_name, macro_sql):
+    return ParsedMacro(
+        name=name,
+        resource_type=NodeType.Macro,
+        unique_id=f'macro.{package_name}.{name}',
+        package_name=package_name,
+        original_file_path='macros/macro.sql',
+        root_path='/usr/src/app',
+        path='macro.sql',
+        macro_sql=macro_sql,
+    )
+
+
+def test_macro_namespace_is_lazy():
+    outer = _real_macro('outer', 'root', '{% macro outer() %}{{ inner() }}!{% endmacro %}')
+    inner = _real_macro('inner', 'root', '{% macro inner() %}inner{% endmacro %}')
+    unused = _real_macro('unused', 'root', '{% macro unused() %}unused{% endmacro %}')
+    lookup = MacroLookup({m.unique_id: m for m in (outer, inner, unused)})
+    manifest = mock.MagicMock(macros=lookup.macros, macro_lookup=lookup)
+
+    index = macros.get_macro_index(manifest, 'root', ['dbt'])
+    # the index is shared, until the macros change
+    assert macros.get_macro_index(manifest, 'root', ['dbt']) is index
+    ctx = LazyContext()
+    ctx['context'] = ctx
+    namespace = macros.MacroNamespaceBuilder(
+        'root', 'root', MacroStack(), ['dbt']
+    ).build_namespace_from_index(index, ctx)
+    ctx.fallback = namespace
+    assert 'unused' in ctx
+    assert set(ctx) == {'context'}
+
+    assert get_rendered('{{ outer() }}', ctx) == 'inner!'
+    assert set(namespace._generators) == {'macro.root.outer', 'macro.root.inner'}
+
+    lookup.add_macro(_real_macro('other', 'root', ''))
+    assert macros.get_macro_index(manifest, 'root', ['dbt']) is not index
+
+
+def test_shared_builtins(config_postgres, manifest_fx, get_adapter, get_include_paths):
+    def generate(config):
+        return providers.generate_runtime_model_context(
+            model=mock_model(),
+            config=config,
+            manifest=manifest_fx,
+        )
+
+    with mock.patch.object(
+        type(config_postgres), 'to_target_dict', autospec=True,
+        side_effect=type(config_postgres).to_target_dict,
+    ) as to_target_dict:
+        first = generate(config_postgres)
+        calls = to_target_dict.call_count
+        second = generate(config_postgres)
+    # computed once for the config
+    assert calls > 0
+    assert to_target_dict.call_count == calls
+    assert first['target'] == second['target']
+    assert first['modules'] == second['modules']
+    assert first['modules']['datetime']['date'] is second['modules']['datetime']['date']
+    # but each context can change its own dictionaries
+    first['target'].update({'schema': 'changed'})
+    first['target']['config']['changed'] = True
+    first['modules']['datetime'].pop('date')
+    assert second['target']['schema'] == 'analytics'
+    assert 'changed' not in second['target']['config']
+    assert 'date' in second['modules']['datetime']
+    assert 'date' in generate(config_postgres)['modules']['datetime']
+    # the node-specific members are not shared
+    assert first['model'] is not second['model']
+    assert first['var'] is not second['var']
+
+    other_config = config_from_parts_or_dicts(PROJECT_DATA, POSTGRES_PROFILE_DATA)
+    third = generate(other_config)
+    assert third['target'] == second['target']
+
+
+def test_var_merged_lazily(config_postgres):
+    with mock.patch.object(providers.RuntimeVar, '_generate_merged', return_value={'a': 1}) as merge:
+        var = providers.RuntimeVar({}, config_postgres, mock_model())
+        merge.assert_not_called()
+        assert var('a') == 1
+        assert var('b', 2) == 2
+    merge.assert_called_once()
@@ -1,9 +1,18 @@
 from datetime import datetime
 from decimal import Decimal
 from unittest import mock
+import json
+import os
+import tempfile
 import unittest
+from types import SimpleNamespace
 
+import agate
+
+from dbt.adapters.base import BaseRelation
+from dbt.adapters.cache import RelationsCache
 import dbt.flags
+import dbt.utils
 from dbt.task import generate
 
 
@@ -26,6 +35,12 @@ class GenerateTest(unittest.TestCase):
 
     def generate_catalog_dict(self, columns):
         nodes, sources = generate.Catalog(columns).make_unique_id_map(self.manifest)
+        # the incrementally mapped catalog must give the same tables
+        self.mock_get_unique_id_mapping.reset_mock()
+        mapped = generate.MappedCatalog(self.manifest)
+        for column in columns:
+            mapped.add_column(column)
+        self.assertEqual(mapped.make_unique_id_map(self.manifest), (nodes, sources))
         result = generate.CatalogResults(
             nodes=nodes,
             sources=sources,
@@ -352,3 +367,156 @@ class GenerateTest(unittest.TestCase):
 
         self.mock_get_unique_id_mapping.assert_called_once_with(self.manifest)
         self.assertEqual(result, expected)
+
+    def _column(self, schema, table, index, name):
+        return {
+            'column_comment': None,
+            'column_index': Decimal(index),
+            'column_name': name,
+            'column_type': 'integer',
+            'table_comment': None,
+            'table_name': table,
+            'table_schema': schema,
+            'table_type': 'BASE TABLE',
+            'table_database': 'test_database',
+            'table_owner': None,
+        }
+
+    def test_mapped_catalog(self):
+        key = generate.CatalogKey('test_database', 'test_schema', 'test_table')
+        self.mock_get_unique_id_mapping.return_value = (
+            {key: 'model.test.test_table'},
+            {key: {'source.test.src.test_table'}},
+        )
+        table = agate.Table(
+            [
+                list(self._column('test_schema', 'test_table', 1, 'id').values()),
+                list(self._column('TEST_SCHEMA', 'unused_table', 1, 'id').values()),
+                list(self._column('test_schema', 'test_table', 2, 'name').values()),
+            ],
+            list(self._column('test_schema', 'test_table', 1, 'id')),
+        )
+        catalog = generate.MappedCatalog(self.manifest)
+        catalog.add_table(table)
+
+        nodes, sources = catalog.make_unique_id_map(self.manifest)
+        self.assertEqual(list(nodes), ['model.test.test_table'])
+        self.assertEqual(list(sources), ['source.test.src.test_table'])
+        self.assertEqual(nodes['model.test.test_table'].unique_id, 'model.test.test_table')
+        # columns added after the table was mapped are in every mapped table
+        self.assertEqual(list(nodes['model.test.test_table'].columns), ['id', 'name'])
+        self.assertEqual(list(sources['source.test.src.test_table'].columns), ['id', 'name'])
+        self.assertEqual(nodes['model.test.test_table'].columns['name'].index, 2)
+        # unreferenced tables are not kept
+        self.assertEqual(list(catalog), [key])
+
+    def test_write_catalog(self):
+        self.map_uids([('test_database', 'test_schema', 'test_table', 'model.test.test_table')])
+        catalog = generate.MappedCatalog(self.manifest)
+        catalog.add_column(self._column('test_schema', 'test_table', 1, 'id'))
+        nodes, sources = catalog.make_unique_id_map(self.manifest)
+        artifact = generate.CatalogArtifact.from_results(
+            generated_at=datetime(2022, 1, 1),
+            nodes=nodes,
+            sources=sources,
+            compile_results=None,
+            errors=['an error'],
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'catalog.json')
+            artifact.write(path)
+            with open(path) as fp:
+                written = fp.read()
+        self.assertEqual(
+            written, json.dumps(artifact.to_dict(omit_none=False), cls=dbt.utils.JSONEncoder)
+        )
+
+    def _node(self, unique_id, schema, identifier):
+        return SimpleNamespace(
+            unique_id=unique_id,
+            database='test_database',
+            schema=schema,
+            identifier=identifier,
+            is_relational=True,
+            is_ephemeral_model=False,
+        )
+
+    def _table(self, unique_id, schema, table):
+        return generate.build_catalog_table(
+            self._column(schema, table, 1, 'id')
+        ).replace(unique_id=unique_id)
+
+    def test_get_changed_schemas(self):
+        manifest = SimpleNamespace(
+            nodes={
+                'model.test.built': self._node('model.test.built', 'built', 'built'),
+                'model.test.stable': self._node('model.test.stable', 'Stable', 'stable'),
+                'model.test.new': self._node('model.test.new', 'new', 'new'),
+                'model.test.dropped': self._node('model.test.dropped', 'dropped', 'dropped'),
+                'model.test.renamed': self._node('model.test.renamed', 'renamed', 'renamed'),
+            },
+            sources={
+                'source.test.src.raw': self._node('source.test.src.raw', 'raw', 'raw'),
+            },
+        )
+        previous = generate.CatalogArtifact.from_results(
+            generated_at=datetime(2022, 1, 1),
+            nodes={
+                'model.test.built': self._table('model.test.built', 'built', 'built'),
+                'model.test.stable': self._table('model.test.stable', 'STABLE', 'stable'),
+                'model.test.dropped': self._table('model.test.dropped', 'dropped', 'dropped'),
+                'model.test.renamed': self._table('model.test.renamed', 'renamed', 'old_name'),
+            },
+            sources={'source.test.src.raw': self._table('source.test.src.raw', 'raw', 'raw')},
+            compile_results=None,
+            errors=None,
+        )
+        run_results = SimpleNamespace(results=[
+            SimpleNamespace(unique_id='model.test.built', status=generate.NodeStatus.Success),
+            SimpleNamespace(unique_id='model.test.stable', status=generate.NodeStatus.Skipped),
+        ])
+        cache = RelationsCache()
+        cache.update_schemas([
+            ('test_database', 'stable'), ('test_database', 'dropped'), ('test_database', 'renamed')
+        ])
+        cache.add(BaseRelation.create('test_database', 'stable', 'stable'))
+        cache.add(BaseRelation.create('test_database', 'renamed', 'renamed'))
+
+        self.assertEqual(
+            generate.get_changed_schemas(manifest, previous, run_results, cache),
+            {
+                ('test_database', 'built'),
+                ('test_database', 'new'),
+                ('test_database', 'dropped'),
+                ('test_database', 'renamed'),
+            },
+        )
+        # without a newer run, only the tables tell that a schema changed
+        self.assertEqual(
+            generate.get_changed_schemas(manifest, previous, None, RelationsCache()),
+            {('test_database', 'new'), ('test_database', 'renamed')},
+        )
+
+    def test_reuse_previous_tables(self):
+        manifest_nodes = {
+            'model.test.refreshed': self._node('model.test.refreshed', 'built', 'refreshed'),
+            'model.test.stable': self._node('model.test.stable', 'stable', 'stable'),
+            'model.test.moved': self._node('model.test.moved', 'stable', 'moved'),
+            'model.test.dropped': self._node('model.test.dropped', 'built', 'dropped'),
+        }
+        previous = {
+            'model.test.refreshed': self._table('model.test.refreshed', 'built', 'refreshed'),
+            'model.test.stable': self._table('model.test.stable', 'stable', 'stable'),
+            'model.test.moved': self._table('model.test.moved', 'other', 'moved'),
+            'model.test.dropped': self._table('model.test.dropped', 'built', 'dropped'),
+            'model.test.deleted': self._table('model.test.deleted', 'stable', 'deleted'),
+        }
+        refreshed_table = self._table('model.test.refreshed', 'built', 'refreshed')
+        tables = {'model.test.refreshed': refreshed_table}
+
+        generate.reuse_previous_tables(
+            tables, previous, manifest_nodes, {('test_database', 'built')}
+        )
+        self.assertEqual(list(tables), ['model.test.refreshed', 'model.test.stable'])
+        self.assertIs(tables['model.test.refreshed'], refreshed_table)
+        self.assertIs(tables['model.test.stable'], previous['model.test.stable'])
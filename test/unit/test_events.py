@@ -12,8 +12,13 @@ import dbt.events.functions as event_funcs
 import dbt.flags as flags
 from dbt.helper_types import Lazy
 import inspect
+import io
 import json
-from unittest import TestCase
+import logging
+import threading
+import time
+import tracemalloc
+from unittest import TestCase, mock
 from dbt.contracts.graph.parsed import (
     ParsedModelNode, NodeConfig, DependsOn
 )
@@ -239,6 +244,12 @@ sample_values = [
     DumpAfterAddGraph(Lazy.defer(lambda: dict())),
     DumpBeforeRenameSchema(Lazy.defer(lambda: dict())),
     DumpAfterRenameSchema(Lazy.defer(lambda: dict())),
+    EvictSchema(database="", schema=""),
+    SavedRelationsCacheUsed(reused=0, listed=0),
+    SavedRelationsCacheInvalid(path="", exc=""),
+    ConnectionPoolHit(conn_name=""),
+    ConnectionPoolMiss(conn_name=""),
+    ConnectionPoolStats(hits=0, misses=0, discarded=0),
     AdapterImportError(exc=ModuleNotFoundError()),
     PluginLoadError(),
     SystemReportReturnCode(returncode=0),
@@ -318,6 +329,8 @@ sample_values = [
     CatalogWritten(path=''),
     CannotGenerateDocs(),
     BuildingCatalog(),
+    IncrementalCatalog(refreshed=0, total=0),
+    IncrementalCatalogUnavailable(reason=''),
     CompileComplete(),
     FreshnessCheckComplete(),
     ServingDocsPort(address='', port=0),
@@ -362,6 +375,7 @@ sample_values = [
     PrintHookEndPassLine(source_name='', table_name='', index=0, total=0, execution_time=0, node_info={}),
     PrintCancelLine(conn_name=''),
     DefaultSelector(name=''),
+    CriticalPathNoRunResults(),
     NodeStart(unique_id='', node_info={}),
     NodeCompiling(unique_id='', node_info={}),
     NodeExecuting(unique_id='', node_info={}),
@@ -418,6 +432,125 @@ sample_values = [
 ]
 
 
+class TestCompactEventHistory(TestCase):
+
+    def setUp(self):
+        flags.EVENT_BUFFER_SIZE = 1000
+        flags.ENABLE_LEGACY_LOGGER = False
+        reload(event_funcs)
+        # keep the log lines out of pytest's log capture, and the memory measurements
+        event_funcs.FILE_LOG = logging.getLogger('test_compact_event_history')
+        event_funcs.FILE_LOG.propagate = False
+        event_funcs.FILE_LOG.handlers = [logging.NullHandler()]
+
+    def tearDown(self):
+        flags.COMPACT_EVENT_HISTORY = False
+
+    def test_records_events(self):
+        flags.COMPACT_EVENT_HISTORY = True
+        event_funcs.fire_event(UnitTestInfo(msg="Test Event 1"))
+        event_funcs.fire_event(PartialParsingFile(file_dict={'path': 'x' * 1000}))
+        short, long = event_funcs.EVENT_HISTORY
+        self.assertEqual(short.code, 'T006')
+        self.assertEqual(short.level, 'info')
+        self.assertEqual(short.msg, 'Unit Test: Test Event 1')
+        self.assertEqual(long.level, 'debug')
+        self.assertEqual(len(long.msg), event_funcs.EVENT_RECORD_MESSAGE_LENGTH)
+        self.assertTrue(long.msg.startswith("PP file: {'path': 'xxx"))
+        self.assertTrue(long.msg.endswith('...'))
+
+    def test_buffer_FIFOs(self):
+        flags.COMPACT_EVENT_HISTORY = True
+        for n in range(1, flags.EVENT_BUFFER_SIZE + 11):
+            event_funcs.fire_event(UnitTestInfo(msg=f"Test Event {n}"))
+        self.assertEqual(len(event_funcs.EVENT_HISTORY), flags.EVENT_BUFFER_SIZE)
+        # the buffer full warning took the place of one of the events
+        self.assertEqual(event_funcs.EVENT_HISTORY[0].msg, 'Unit Test: Test Event 12')
+        self.assertEqual([r.code for r in event_funcs.EVENT_HISTORY].count('Z048'), 1)
+
+    def history_memory(self):
+        # what the history holds on to of events with a large payload, like
+        # the partial parsing of every file of a project
+        event_funcs.EVENT_HISTORY.clear()
+        tracemalloc.start()
+        try:
+            for n in range(flags.EVENT_BUFFER_SIZE):
+                file_dict = {'checksum': str(n) * 8, 'lines': [f'line {i} of {n}' for i in range(50)]}
+                event_funcs.fire_event(PartialParsingFile(file_dict=file_dict))
+            memory, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(len(event_funcs.EVENT_HISTORY), flags.EVENT_BUFFER_SIZE)
+        return memory
+
+    def test_memory(self):
+        full = self.history_memory()
+        flags.COMPACT_EVENT_HISTORY = True
+        compact = self.history_memory()
+        self.assertLess(compact * 5, full)
+
+
+class TestEventEnabled(TestCase):
+
+    def setUp(self):
+        flags.ENABLE_LEGACY_LOGGER = False
+        flags.LOG_CACHE_EVENTS = False
+        flags.DEBUG = False
+        flags.QUIET = False
+        reload(event_funcs)
+
+    def tearDown(self):
+        flags.LOG_CACHE_EVENTS = False
+        flags.QUIET = False
+        reload(event_funcs)
+
+    def configure_file_log(self, level=logging.DEBUG):
+        event_funcs.FILE_LOG = logging.getLogger('test_event_enabled')
+        event_funcs.FILE_LOG.setLevel(level)
+
+    def test_cache_events(self):
+        self.configure_file_log()
+        self.assertFalse(event_funcs.event_enabled(AddRelation))
+        flags.LOG_CACHE_EVENTS = True
+        self.assertTrue(event_funcs.event_enabled(AddRelation))
+
+    def test_file_log(self):
+        self.configure_file_log(logging.INFO)
+        self.assertFalse(event_funcs.event_enabled(PartialParsingFile))
+        self.assertTrue(event_funcs.event_enabled(MacroEventInfo))
+        self.configure_file_log()
+        self.assertTrue(event_funcs.event_enabled(PartialParsingFile))
+        # stdout only
+        self.assertFalse(event_funcs.event_enabled(MainStackTrace))
+        flags.DEBUG = True
+        event_funcs.STDOUT_LOG.setLevel(logging.DEBUG)
+        self.assertTrue(event_funcs.event_enabled(MainStackTrace))
+
+    def test_quiet(self):
+        flags.QUIET = True
+        self.assertFalse(event_funcs.event_enabled(UnitTestInfo))
+        self.assertTrue(event_funcs.event_enabled(MainEncounteredError))
+
+    def test_agrees_with_fire_event(self):
+        self.configure_file_log()
+        events = [
+            AddRelation(relation=_ReferenceKey(database='db', schema='s', identifier='i')),
+            PartialParsingFile(file_dict={}),
+            MainStackTrace(stack_trace='trace'),
+            UnitTestInfo(msg='info'),
+            MainEncounteredError(e=RuntimeError('boom')),
+        ]
+        for log_cache_events, quiet in ((False, False), (True, False), (False, True)):
+            flags.LOG_CACHE_EVENTS = log_cache_events
+            flags.QUIET = quiet
+            for event in events:
+                with mock.patch.object(event_funcs, 'send_to_logger') as send_to_logger:
+                    event_funcs.fire_event(event)
+                self.assertEqual(
+                    event_funcs.event_enabled(type(event)), send_to_logger.called, event
+                )
+
+
 class TestEventJSONSerialization(TestCase):
 
     # attempts to test that every event is serializable to json.
@@ -596,3 +729,118 @@ class TestLazyMemoizationInCacheEventsJSON(TestCase):
 
     def test_all_cache_events_are_lazy_JSON(self):
         all_cache_events_are_lazy(self)
+
+
+class TestAsyncLogWriter(TestCase):
+
+    def setUp(self):
+        flags.LOG_FORMAT = 'json'
+        flags.DEBUG = False
+        flags.QUIET = False
+        flags.ENABLE_LEGACY_LOGGER = False
+        flags.EVENT_BUFFER_SIZE = 100000
+        reload(event_funcs)
+        event_funcs.format_json = True
+        self.buffers = {}
+        for name in ('FILE_LOG', 'STDOUT_LOG'):
+            logger = logging.getLogger(f'test_async_{name}')
+            logger.setLevel(logging.DEBUG)
+            logger.propagate = False
+            buffer = io.StringIO()
+            logger.handlers = [logging.StreamHandler(buffer)]
+            setattr(event_funcs, name, logger)
+            self.buffers[name] = buffer
+
+    def tearDown(self):
+        event_funcs.stop_log_writer()
+        flags.LOG_FORMAT = 'text'
+        reload(event_funcs)
+
+    def lines(self, name):
+        return [json.loads(line) for line in self.buffers[name].getvalue().splitlines()]
+
+    def fire_events(self, count, prefix):
+        for n in range(count):
+            event_funcs.fire_event(MacroEventInfo(msg=f'{prefix} {n}'))
+            event_funcs.fire_event(MacroEventDebug(msg=f'{prefix} debug {n}'))
+
+    def test_lines_match_synchronous(self):
+        self.fire_events(50, 'event')
+        expected = {name: self.lines(name) for name in self.buffers}
+        for buffer in self.buffers.values():
+            buffer.truncate(0)
+            buffer.seek(0)
+
+        event_funcs.LOG_WRITER = event_funcs.AsyncLogWriter(batch_size=7)
+        self.fire_events(50, 'event')
+        event_funcs.flush_log_writer()
+        for name in self.buffers:
+            lines = self.lines(name)
+            self.assertEqual(len(lines), len(expected[name]))
+            for line, expected_line in zip(lines, expected[name]):
+                del line['ts'], expected_line['ts']
+                self.assertEqual(line, expected_line)
+        self.assertEqual(len(self.lines('FILE_LOG')), 100)
+        # debug events don't go to stdout without --debug
+        self.assertEqual(len(self.lines('STDOUT_LOG')), 50)
+
+    def test_keeps_firing_thread_and_order(self):
+        event_funcs.LOG_WRITER = event_funcs.AsyncLogWriter(maxsize=10)
+        threads = [
+            threading.Thread(target=self.fire_events, args=(100, f'Thread-{i}'), name=f'Thread-{i}')
+            for i in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        event_funcs.stop_log_writer()
+
+        by_thread = {}
+        for line in self.lines('FILE_LOG'):
+            by_thread.setdefault(line['thread_name'], []).append(line['msg'])
+        self.assertEqual(set(by_thread), {f'Thread-{i}' for i in range(4)})
+        for thread_name, messages in by_thread.items():
+            self.assertEqual(messages[::2], [f'{thread_name} {n}' for n in range(100)])
+
+    def test_errors_are_written_after_queued_events(self):
+        event_funcs.LOG_WRITER = event_funcs.AsyncLogWriter()
+        self.fire_events(20, 'event')
+        event_funcs.fire_event(MainEncounteredError(e=RuntimeError('boom')))
+        messages = [line['msg'] for line in self.lines('STDOUT_LOG')]
+        self.assertEqual(messages, [f'event {n}' for n in range(20)] + ['Encountered an error:\nboom'])
+
+    def test_cache_dumps_show_the_state_when_fired(self):
+        from dbt.adapters.base.relation import BaseRelation
+        from dbt.adapters.cache import RelationsCache
+
+        event_funcs.LOG_WRITER = event_funcs.AsyncLogWriter(maxsize=1)
+        # hold the writer back until the cache has changed again
+        release = threading.Event()
+        write = event_funcs.LOG_WRITER._write
+
+        def held_write(records):
+            release.wait()
+            write(records)
+
+        flags.LOG_CACHE_EVENTS = True
+        try:
+            with mock.patch.object(event_funcs.LOG_WRITER, '_write', side_effect=held_write):
+                cache = RelationsCache()
+                adding = threading.Thread(
+                    target=cache.add,
+                    args=(BaseRelation.create(database='dbt', schema='foo', identifier='bar'),),
+                )
+                adding.start()
+                # the queue fills up while the cache is being changed
+                time.sleep(0.1)
+                release.set()
+                adding.join(timeout=10)
+                self.assertFalse(adding.is_alive())
+                event_funcs.flush_log_writer()
+        finally:
+            flags.LOG_CACHE_EVENTS = False
+
+        messages = {line['code']: line['msg'] for line in self.lines('FILE_LOG')}
+        self.assertEqual(messages['E031'], 'before adding : {}')
+        self.assertEqual(messages['E032'], "after adding: {'dbt.foo.bar': []}")
@@ -218,6 +218,115 @@ class TestFlags(TestCase):
         delattr(self.args, 'indirect_selection')
         self.user_config.indirect_selection = None
 
+        # parse_workers
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.PARSE_WORKERS, 1)
+        os.environ['DBT_PARSE_WORKERS'] = '4'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.PARSE_WORKERS, 4)
+        setattr(self.args, 'parse_workers', '8')
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.PARSE_WORKERS, 8)
+        # cleanup
+        os.environ.pop('DBT_PARSE_WORKERS')
+        delattr(self.args, 'parse_workers')
+        flags.PARSE_WORKERS = 1
+
+        # relations_cache_max_schemas
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.RELATIONS_CACHE_MAX_SCHEMAS, 0)
+        os.environ['DBT_RELATIONS_CACHE_MAX_SCHEMAS'] = '50'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.RELATIONS_CACHE_MAX_SCHEMAS, 50)
+        setattr(self.args, 'relations_cache_max_schemas', '100')
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.RELATIONS_CACHE_MAX_SCHEMAS, 100)
+        # cleanup
+        os.environ.pop('DBT_RELATIONS_CACHE_MAX_SCHEMAS')
+        delattr(self.args, 'relations_cache_max_schemas')
+        flags.RELATIONS_CACHE_MAX_SCHEMAS = 0
+
+        # relations_cache_ttl
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.RELATIONS_CACHE_TTL, 0)
+        os.environ['DBT_RELATIONS_CACHE_TTL'] = '3600'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.RELATIONS_CACHE_TTL, 3600)
+        setattr(self.args, 'relations_cache_ttl', '600')
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.RELATIONS_CACHE_TTL, 600)
+        # cleanup
+        os.environ.pop('DBT_RELATIONS_CACHE_TTL')
+        delattr(self.args, 'relations_cache_ttl')
+        flags.RELATIONS_CACHE_TTL = 0
+
+        # jinja_cache
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.JINJA_CACHE, False)
+        os.environ['DBT_JINJA_CACHE'] = 'true'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.JINJA_CACHE, True)
+        setattr(self.args, 'jinja_cache', False)
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.JINJA_CACHE, False)
+        # cleanup
+        os.environ.pop('DBT_JINJA_CACHE')
+        delattr(self.args, 'jinja_cache')
+
+        # async_logging
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.ASYNC_LOGGING, False)
+        os.environ['DBT_ASYNC_LOGGING'] = 'true'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.ASYNC_LOGGING, True)
+        setattr(self.args, 'async_logging', False)
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.ASYNC_LOGGING, False)
+        # cleanup
+        os.environ.pop('DBT_ASYNC_LOGGING')
+        delattr(self.args, 'async_logging')
+
+        # compact_event_history
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.COMPACT_EVENT_HISTORY, False)
+        os.environ['DBT_COMPACT_EVENT_HISTORY'] = 'true'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.COMPACT_EVENT_HISTORY, True)
+        setattr(self.args, 'compact_event_history', False)
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.COMPACT_EVENT_HISTORY, False)
+        # cleanup
+        os.environ.pop('DBT_COMPACT_EVENT_HISTORY')
+        delattr(self.args, 'compact_event_history')
+
+        # connection_pool_size
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.CONNECTION_POOL_SIZE, 0)
+        os.environ['DBT_CONNECTION_POOL_SIZE'] = '8'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.CONNECTION_POOL_SIZE, 8)
+        setattr(self.args, 'connection_pool_size', '4')
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.CONNECTION_POOL_SIZE, 4)
+        # cleanup
+        os.environ.pop('DBT_CONNECTION_POOL_SIZE')
+        delattr(self.args, 'connection_pool_size')
+        flags.CONNECTION_POOL_SIZE = 0
+
+        # connection_pool_max_idle
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.CONNECTION_POOL_MAX_IDLE, 300)
+        os.environ['DBT_CONNECTION_POOL_MAX_IDLE'] = '60'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.CONNECTION_POOL_MAX_IDLE, 60)
+        setattr(self.args, 'connection_pool_max_idle', '30')
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.CONNECTION_POOL_MAX_IDLE, 30)
+        # cleanup
+        os.environ.pop('DBT_CONNECTION_POOL_MAX_IDLE')
+        delattr(self.args, 'connection_pool_max_idle')
+        flags.CONNECTION_POOL_MAX_IDLE = 300
+
         # quiet
         self.user_config.quiet = True
         flags.set_from_args(self.args, self.user_config)
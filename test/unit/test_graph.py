@@ -28,10 +28,11 @@ from .utils import config_from_parts_or_dicts, generate_name_macros, inject_plug
 class GraphTest(unittest.TestCase):
 
     def tearDown(self):
-        self.mock_filesystem_search.stop()
+        self.filesystem_search.stop()
         self.mock_hook_constructor.stop()
         self.load_state_check.stop()
         self.load_source_file_patcher.stop()
+        self.read_and_hash_patcher.stop()
         reset_adapters()
 
     def setUp(self):
@@ -98,7 +99,7 @@ class GraphTest(unittest.TestCase):
         # Create the source file patcher
         self.load_source_file_patcher = patch('dbt.parser.read_files.load_source_file')
         self.mock_source_file = self.load_source_file_patcher.start()
-        def mock_load_source_file(path, parse_file_type, project_name, saved_files):
+        def mock_load_source_file(path, parse_file_type, project_name, saved_files, loaded=None):
             for sf in self.mock_models:
                 if sf.path == path:
                     source_file = sf
@@ -107,6 +108,11 @@ class GraphTest(unittest.TestCase):
             return source_file
         self.mock_source_file.side_effect = mock_load_source_file
 
+        # The files are read ahead of load_source_file, so patch that too
+        self.read_and_hash_patcher = patch('dbt.parser.read_files.read_and_hash')
+        self.mock_read_and_hash = self.read_and_hash_patcher.start()
+        self.mock_read_and_hash.return_value = ('', FileHash.empty())
+
         @patch('dbt.parser.hooks.HookParser.get_path')
         def _mock_hook_path(self):
             path = FilePath(
@@ -195,3 +195,22 @@ invalid_specs = [
 def test_invalid_specs(invalid):
     with pytest.raises(dbt.exceptions.RuntimeException):
         graph_selector.SelectionCriteria.from_single_spec(invalid)
+
+
+def test_get_subset_graph():
+    graph = _get_graph()
+    # Edges: [(X.a, Y.b), (X.a, X.c), (Y.b, Y.d), (Y.b, X.e), (X.c, Y.f), (X.c, X.g)]
+    subset = graph.get_subset_graph(['m.X.a', 'm.Y.d', 'm.X.e', 'm.X.c'])
+    assert subset.nodes() == {'m.X.a', 'm.Y.d', 'm.X.e', 'm.X.c'}
+    # edges across the removed Y.b are preserved, existing edges are kept
+    assert set(subset.edges()) == {
+        ('m.X.a', 'm.Y.d'), ('m.X.a', 'm.X.e'), ('m.X.a', 'm.X.c'),
+    }
+    # the full graph is untouched
+    assert len(graph.nodes()) == 7
+
+
+def test_get_subset_graph_missing_node():
+    graph = _get_graph()
+    with pytest.raises(ValueError):
+        graph.get_subset_graph(['m.X.a', 'm.X.z'])
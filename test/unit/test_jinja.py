@@ -1,11 +1,19 @@
 from contextlib import contextmanager
+import os
+import pickle
 import pytest
+import tempfile
+import time
 import unittest
+from unittest import mock
+import jinja2
 import yaml
 
+from dbt.clients.jinja import get_environment
 from dbt.clients.jinja import get_rendered
 from dbt.clients.jinja import get_template
 from dbt.clients.jinja import extract_toplevel_blocks
+from dbt.clients.jinja import template_bytecode_cache
 from dbt.exceptions import CompilationException, JinjaRenderingException
 
 
@@ -424,6 +432,106 @@ class TestJinja(unittest.TestCase):
         value = get_rendered(s, {}, native=True)
         assert value == '1991'
 
+    def test_shared_environments(self):
+        assert get_environment() is get_environment()
+        assert get_environment(native=True) is get_environment(native=True)
+        assert get_environment(native=True) is not get_environment()
+        assert get_environment(capture_macros=True) is not get_environment()
+
+    def test_captured_undefined_node(self):
+        s = '{{ some_macro.some_attr }}'
+        node_1 = mock.MagicMock()
+        node_2 = mock.MagicMock()
+        undefined_1 = get_rendered(s, {}, node_1, capture_macros=True, native=True)
+        undefined_2 = get_rendered(s, {}, node_2, capture_macros=True, native=True)
+        assert undefined_1.node is node_1
+        assert undefined_2.node is node_2
+        with self.assertRaises(CompilationException) as exc:
+            pickle.dumps(undefined_1)
+        assert exc.exception.node is node_1
+
+
+class TestTemplateBytecodeCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        template_bytecode_cache.directory = self.tmpdir.name
+
+    def tearDown(self):
+        template_bytecode_cache.directory = None
+        self.tmpdir.cleanup()
+
+    def _cache_files(self):
+        return sorted(f for f in os.listdir(self.tmpdir.name) if f.endswith('.cache'))
+
+    def test_compiled_once(self):
+        s = '{% set x = 1991 | as_native %}{{ x }} {{ y }}'
+        assert get_rendered(s, {'y': 'a'}) == '1991 a'
+        assert len(self._cache_files()) == 1
+
+        compile = jinja2.Environment.compile
+        with mock.patch.object(
+            jinja2.Environment, 'compile', autospec=True, side_effect=compile
+        ) as patched:
+            assert get_rendered(s, {'y': 'b'}) == '1991 b'
+            patched.assert_not_called()
+
+    def test_keyed_by_environment(self):
+        s = '{{ 1991 | as_native }}'
+        assert get_rendered(s, {}, native=False) == '1991'
+        assert get_rendered(s, {}, native=True) == 1991
+        get_template(s, {}, capture_macros=True)
+        assert len(self._cache_files()) == 3
+        assert get_rendered(s, {}, native=False) == '1991'
+        assert get_rendered(s, {}, native=True) == 1991
+        assert len(self._cache_files()) == 3
+
+    def test_corrupt_entry_recompiled(self):
+        s = '{{ "some_value" }}'
+        assert get_rendered(s, {}) == 'some_value'
+        path = os.path.join(self.tmpdir.name, self._cache_files()[0])
+        with open(path, 'r+b') as fp:
+            fp.truncate(os.path.getsize(path) - 10)
+        assert get_rendered(s, {}) == 'some_value'
+        template_bytecode_cache.clear()
+        assert self._cache_files() == []
+
+    def _set_mtime(self, name, mtime):
+        os.utime(os.path.join(self.tmpdir.name, name), (mtime, mtime))
+
+    def test_prune_unused_parse_entries(self):
+        get_template('{{ "used" }}', {}, capture_macros=True)
+        get_template('{{ "unused" }}', {}, capture_macros=True)
+        assert get_rendered('{{ "runtime" }}', {}) == 'runtime'
+        stale = time.time() - 60
+        for name in self._cache_files():
+            self._set_mtime(name, stale)
+        with open(os.path.join(self.tmpdir.name, 'leftover.tmp'), 'wb'):
+            pass
+        self._set_mtime('leftover.tmp', stale)
+
+        since = time.time()
+        get_template('{{ "used" }}', {}, capture_macros=True)
+        template_bytecode_cache.prune(since)
+        # the parse didn't render the runtime template, which is kept
+        assert [name.split('-')[0] for name in self._cache_files()] == ['parse', 'render']
+        assert not os.path.exists(os.path.join(self.tmpdir.name, 'leftover.tmp'))
+        assert get_rendered('{{ "runtime" }}', {}) == 'runtime'
+
+    def test_prune_old_render_entries(self):
+        assert get_rendered('{{ "old" }}', {}) == 'old'
+        old_name = self._cache_files()[0]
+        assert get_rendered('{{ "recent" }}', {}) == 'recent'
+        self._set_mtime(old_name, time.time() - template_bytecode_cache.RENDER_ENTRY_MAX_AGE - 60)
+        template_bytecode_cache.prune(time.time())
+        cache_files = self._cache_files()
+        assert len(cache_files) == 1
+        assert old_name not in cache_files
+
+    def test_failed_write_cleaned_up(self):
+        with mock.patch('os.replace', side_effect=OSError('busy')):
+            assert get_rendered('{{ "some_value" }}', {}) == 'some_value'
+        assert os.listdir(self.tmpdir.name) == []
+
 
 class TestBlockLexer(unittest.TestCase):
     def test_basic(self):
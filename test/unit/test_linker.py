@@ -1,6 +1,7 @@
 import os
 import tempfile
 import unittest
+from collections import defaultdict
 from unittest import mock
 
 from dbt import compilation
@@ -11,6 +12,7 @@ except ImportError:
 
 from dbt.graph.selector import NodeSelector
 from dbt.graph.cli import parse_difference
+from dbt.node_types import NodeType
 
 
 def _mock_manifest(nodes):
@@ -63,11 +65,11 @@ class LinkerTest(unittest.TestCase):
         """test join() without timeout risk"""
         self.assertEqual(queue.inner.unfinished_tasks, 0)
 
-    def _get_graph_queue(self, manifest, include=None, exclude=None):
+    def _get_graph_queue(self, manifest, include=None, exclude=None, node_weights=None):
         graph = compilation.Graph(self.linker.graph)
         selector = NodeSelector(graph, manifest)
         spec = parse_difference(include, exclude)
-        return selector.get_graph_queue(spec)
+        return selector.get_graph_queue(spec, node_weights)
 
     def test_linker_add_dependency(self):
         actual_deps = [('A', 'B'), ('A', 'C'), ('B', 'C')]
@@ -134,6 +136,62 @@ class LinkerTest(unittest.TestCase):
         self.assert_would_join(queue)
         self.assertTrue(queue.empty())
 
+    def test_linker_waits_for_all_parents(self):
+        actual_deps = [('A', 'B'), ('A', 'C'), ('B', 'D'), ('C', 'D')]
+
+        for (l, r) in actual_deps:
+            self.linker.dependency(l, r)
+
+        queue = self._get_graph_queue(_mock_manifest('ABCD'))
+        got = queue.get(block=False)
+        self.assertEqual(got.unique_id, 'D')
+        queue.mark_done('D')
+
+        second = queue.get(block=False)
+        third = queue.get(block=False)
+        self.assertEqual({second.unique_id, third.unique_id}, {'B', 'C'})
+        queue.mark_done(second.unique_id)
+        with self.assertRaises(Empty):
+            queue.get(block=False)
+        queue.mark_done(third.unique_id)
+
+        got = queue.get(block=False)
+        self.assertEqual(got.unique_id, 'A')
+        self.assertTrue(queue.empty())
+        queue.mark_done('A')
+        self.assert_would_join(queue)
+
+    def test_linker_critical_path_scheduling(self):
+        # B and D are both roots, but D heads the slower chain
+        actual_deps = [('A', 'B'), ('C', 'D'), ('E', 'C')]
+
+        for (l, r) in actual_deps:
+            self.linker.dependency(l, r)
+
+        weights = {'A': 1.0, 'B': 1.0, 'C': 10.0, 'D': 1.0, 'E': 1.0}
+        queue = self._get_graph_queue(_mock_manifest('ABCDE'), node_weights=weights)
+        self.assertEqual(queue._scores, {
+            'A': -1.0, 'B': -2.0, 'C': -11.0, 'D': -12.0, 'E': -1.0,
+        })
+        first = queue.get(block=False)
+        self.assertEqual(first.unique_id, 'D')
+        second = queue.get(block=False)
+        self.assertEqual(second.unique_id, 'B')
+
+    def test_linker_critical_path_scheduling_missing_weights(self):
+        actual_deps = [('A', 'B'), ('C', 'D')]
+
+        for (l, r) in actual_deps:
+            self.linker.dependency(l, r)
+
+        # nodes without history get the mean of the known weights
+        weights = {'A': 2.0, 'B': 4.0}
+        queue = self._get_graph_queue(_mock_manifest('ABCD'), node_weights=weights)
+        self.assertEqual(queue._scores, {'A': -2.0, 'B': -6.0, 'C': -3.0, 'D': -6.0})
+
+        queue = self._get_graph_queue(_mock_manifest('ABCD'), node_weights={})
+        self.assertEqual(queue._scores, {'A': -1.0, 'B': -2.0, 'C': -1.0, 'D': -2.0})
+
     def test_linker_dependencies_limited_to_some_nodes(self):
         actual_deps = [('A', 'B'), ('B', 'C'), ('C', 'D')]
 
@@ -179,4 +237,35 @@ class LinkerTest(unittest.TestCase):
         for (l, r) in actual_deps:
             self.linker.dependency(l, r)
 
-        self.assertIsNone(self.linker.find_cycles())
\ No newline at end of file
+        self.assertIsNone(self.linker.find_cycles())
+
+    def test_add_test_edges(self):
+        # model_1 -> model_2 -> model_3, and model_1 and model_4 -> model_5.
+        # test.test_3 is a relationship test between model_1 and model_4.
+        actual_deps = [
+            ('model_2', 'model_1'), ('model_3', 'model_2'), ('model_5', 'model_1'),
+            ('model_5', 'model_4'), ('test.test_1', 'model_1'), ('test.test_2', 'model_2'),
+            ('test.test_3', 'model_1'), ('test.test_3', 'model_4'),
+        ]
+        depends_on = defaultdict(list)
+        child_map = defaultdict(list)
+        for (l, r) in actual_deps:
+            self.linker.dependency(l, r)
+            depends_on[l].append(r)
+            child_map[r].append(l)
+        manifest = mock.MagicMock(child_map=child_map, nodes={
+            n: mock.MagicMock(
+                resource_type=NodeType.Test if n.startswith('test.') else NodeType.Model,
+                depends_on_nodes=depends_on[n],
+            ) for n in self.linker.nodes()
+        })
+
+        compilation.Compiler(mock.MagicMock()).add_test_edges(self.linker, manifest)
+        test_edges = {
+            (l, r) for l, r in self.linker.graph.edges() if l.startswith('test.')
+        }
+        self.assertEqual(test_edges, {
+            ('test.test_1', 'model_2'), ('test.test_1', 'model_3'),
+            ('test.test_1', 'model_5'), ('test.test_2', 'model_3'),
+            ('test.test_3', 'model_5'),
+        })
@@ -1001,6 +1001,28 @@ def test_find_generate_macro_by_name(macros, expected):
         assert result.package_name == expected
 
 
+def test_find_macro_by_name_after_add_macro():
+    manifest = make_manifest(macros=[MockMacro('dep')])
+    assert manifest.find_macro_by_name('my_macro', 'root', None).package_name == 'dep'
+
+    source_file = mock.MagicMock(macros=[])
+    manifest.add_macro(source_file, MockMacro('root'))
+    assert manifest.find_macro_by_name('my_macro', 'root', None).package_name == 'root'
+    assert manifest.find_macro_by_name('my_macro', 'root', 'dep').package_name == 'dep'
+
+
+def test_find_macro_by_name_after_macros_replaced():
+    manifest = make_manifest(macros=[MockMacro('root')])
+    assert manifest.find_macro_by_name('my_macro', 'root', None).package_name == 'root'
+
+    manifest.macros = {m.unique_id: m for m in [MockMacro('dep')]}
+    assert manifest.find_macro_by_name('my_macro', 'root', None).package_name == 'dep'
+
+    manifest.macros.pop('macro.dep.my_macro')
+    manifest.rebuild_macro_lookup()
+    assert manifest.find_macro_by_name('my_macro', 'root', None) is None
+
+
 FindMaterializationSpec = namedtuple('FindMaterializationSpec', 'macros,adapter_type,expected')
 
 
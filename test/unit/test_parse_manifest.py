@@ -1,11 +1,19 @@
+import logging
+import os
+import tempfile
 import unittest
 from unittest import mock
 from unittest.mock import patch
 
-from .utils import config_from_parts_or_dicts, normalize
+from .utils import config_from_parts_or_dicts, normalize, generate_name_macros
 
+import dbt.events.functions as event_funcs
+import dbt.flags
+from dbt import tracking
 from dbt.contracts.files import SourceFile, FileHash, FilePath
 from dbt.contracts.graph.manifest import Manifest, ManifestStateCheck
+from dbt.exceptions import CompilationException
+from dbt.parser.models import ModelParser
 from dbt.parser.search import FileBlock
 from dbt.parser import manifest
 
@@ -101,3 +109,144 @@ class TestLoader(unittest.TestCase):
             project_root=normalize(self.root_project_config.project_root),
         )
         return SourceFile(path=path, checksum=checksum)
+
+
+class TestParallelParse(unittest.TestCase):
+    def setUp(self):
+        dbt.flags.PARSE_WORKERS = 2
+        tracking.do_not_track()
+        profile_data = {
+            'target': 'test',
+            'quoting': {},
+            'outputs': {
+                'test': {
+                    'type': 'postgres',
+                    'host': 'localhost',
+                    'schema': 'analytics',
+                    'user': 'test',
+                    'pass': 'test',
+                    'dbname': 'test',
+                    'port': 1,
+                }
+            }
+        }
+        root_project = {
+            'name': 'root',
+            'version': '0.1',
+            'profile': 'test',
+            'project-root': normalize('/usr/src/app'),
+            'config-version': 2,
+        }
+        self.root_project_config = config_from_parts_or_dicts(
+            project=root_project,
+            profile=profile_data,
+        )
+        self.patcher = mock.patch('dbt.context.providers.get_adapter')
+        self.patcher.start()
+        self.state_check_patcher = patch('dbt.parser.manifest.ManifestLoader.build_manifest_state_check')
+        self.state_check_patcher.start().return_value = ManifestStateCheck()
+        self.min_files_patcher = patch('dbt.parser.manifest.PARALLEL_PARSE_MIN_FILES', 1)
+        self.min_files_patcher.start()
+
+    def tearDown(self):
+        dbt.flags.PARSE_WORKERS = 1
+        self.min_files_patcher.stop()
+        self.state_check_patcher.stop()
+        self.patcher.stop()
+
+    def _loader_with_models(self, models):
+        loader = manifest.ManifestLoader(
+            self.root_project_config,
+            {'root': self.root_project_config},
+        )
+        loader.manifest.macros = {m.unique_id: m for m in generate_name_macros('root')}
+        file_ids = []
+        for name, raw_sql in models.items():
+            path = FilePath(
+                searched_path='models',
+                relative_path=normalize(f'{name}.sql'),
+                project_root=normalize('/usr/src/app'),
+                modification_time=0.0,
+            )
+            source_file = SourceFile(
+                path=path,
+                checksum=FileHash.from_contents(raw_sql),
+                project_name='root',
+            )
+            source_file.contents = raw_sql
+            loader.manifest.files[source_file.file_id] = source_file
+            file_ids.append(source_file.file_id)
+        return loader, file_ids
+
+    def _parse(self, models):
+        loader, file_ids = self._loader_with_models(models)
+        loader.parse_project(
+            self.root_project_config, {'ModelParser': file_ids}, [ModelParser]
+        )
+        return loader
+
+    def test_matches_serial_parse(self):
+        models = {
+            f'model_{i}': f"select * from {{{{ ref('model_{i - 1}') }}}}"
+            for i in range(1, 10)
+        }
+        models['model_0'] = "{{ config(enabled=false) }} select 1 as id"
+        models['model_10'] = "{% if true %}{{ config(materialized='table') }}{% endif %} select 1 as id"
+
+        with mock.patch('dbt.parser.manifest.multiprocessing.get_all_start_methods', return_value=[]):
+            serial = self._parse(models)
+        parallel = self._parse(models)
+
+        parser_info = parallel._perf_info._project_index['root'].parsers[0]
+        self.assertEqual(parser_info.workers, 2)
+        self.assertEqual(parser_info.parsed_path_count, 11)
+        self.assertEqual(serial._perf_info._project_index['root'].parsers[0].workers, 1)
+
+        self.assertEqual(list(parallel.manifest.nodes), list(serial.manifest.nodes))
+        for unique_id, node in serial.manifest.nodes.items():
+            parallel_node = parallel.manifest.nodes[unique_id]
+            self.assertEqual(parallel_node.config, node.config)
+            self.assertEqual(parallel_node.refs, node.refs)
+        self.assertEqual(list(parallel.manifest.disabled), ['model.root.model_0'])
+        for file_id, source_file in serial.manifest.files.items():
+            self.assertEqual(parallel.manifest.files[file_id].nodes, source_file.nodes)
+        self.assertEqual(
+            parallel.manifest._parsing_info.static_analysis_path_count,
+            serial.manifest._parsing_info.static_analysis_path_count,
+        )
+
+    def test_failed_chunk_raises_from_serial_reparse(self):
+        models = {f'model_{i}': 'select 1 as id' for i in range(5)}
+        models['model_bad'] = '{{ SYNTAX ERROR }}'
+        with self.assertRaises(CompilationException) as exc:
+            self._parse(models)
+        self.assertIn('model_bad', str(exc.exception))
+
+    def test_async_logging(self):
+        models = {f'model_{i}': 'select 1 as id' for i in range(10)}
+        with tempfile.TemporaryDirectory() as log_dir:
+            file_log = logging.getLogger('test_parallel_parse_file_log')
+            file_log.setLevel(logging.DEBUG)
+            file_log.propagate = False
+            handler = logging.FileHandler(os.path.join(log_dir, 'dbt.log'))
+            file_log.handlers = [handler]
+            # a worker that queued events for the parent's writer would block on the
+            # second one, as nothing reads its copy of the queue
+            log_writer = event_funcs.AsyncLogWriter(maxsize=1)
+            try:
+                with mock.patch.object(event_funcs, 'FILE_LOG', file_log), \
+                        mock.patch.object(event_funcs, 'LOG_WRITER', log_writer):
+                    loader = self._parse(models)
+                    event_funcs.flush_log_writer()
+            finally:
+                log_writer.stop()
+                handler.close()
+            with open(os.path.join(log_dir, 'dbt.log')) as fp:
+                log_lines = fp.read()
+
+        self.assertEqual(loader._perf_info._project_index['root'].parsers[0].workers, 2)
+        self.assertEqual(len(loader.manifest.nodes), 10)
+        # the events the workers fired are in the log, whichever parser they
+        # were from
+        for name in models:
+            self.assertIn(f'{name}.sql', log_lines)
@@ -1,17 +1,21 @@
 import agate
 import decimal
+import threading
 import unittest
 from unittest import mock
 
 import dbt.flags as flags
 from dbt.task.debug import DebugTask
 
+from dbt.adapters.base.connections import BaseConnectionManager, ConnectionPool
 from dbt.adapters.base.query_headers import MacroQueryStringSetter
 from dbt.adapters.postgres import PostgresAdapter
 from dbt.adapters.postgres import Plugin as PostgresPlugin
+from dbt.adapters.postgres.connections import PostgresConnectionManager
 from dbt.contracts.files import FileHash
 from dbt.contracts.graph.manifest import ManifestStateCheck
 from dbt.clients import agate_helper
+from dbt.events.types import ConnectionPoolStats
 from dbt.exceptions import ValidationException, DbtConfigError
 from psycopg2 import extensions as psycopg2_extensions
 from psycopg2 import DatabaseError
@@ -209,6 +213,30 @@ class TestPostgresAdapter(unittest.TestCase):
 
         cursor.execute.assert_called_once_with('set role somerole')
 
+    @mock.patch('dbt.adapters.postgres.connections.psycopg2')
+    def test_execute_stream(self, psycopg2):
+        rows = [(i, i) for i in range(5)]
+        cursor = psycopg2.connect.return_value.cursor.return_value
+        # name and type oid, the rest of the description isn't used
+        cursor.description = [('id', 23), ('id', 1043)]
+        cursor.fetchmany.side_effect = [rows[:2], rows[2:4], rows[4:], []]
+        self.adapter.ConnectionManager.FETCH_CHUNK_SIZE = 2
+        self.addCleanup(delattr, self.adapter.ConnectionManager, 'FETCH_CHUNK_SIZE')
+
+        with self.adapter.connection_named('dummy'):
+            _, result = self.adapter.execute('select 1', fetch=True, stream=True)
+
+        cursor.fetchall.assert_not_called()
+        cursor.fetchmany.assert_called_with(2)
+        self.assertIsInstance(result, agate_helper.ColumnarResult)
+        self.assertEqual(result.column_names, ('id', 'id_2'))
+        self.assertEqual(list(result), rows)
+        self.assertEqual(result.to_agate().column_names, ('id', 'id_2'))
+        self.assertEqual(
+            result.column_types, (agate_helper.NUMBER_TYPE, agate_helper.TEXT_TYPE)
+        )
+        self.assertEqual(list(result.typed_rows()[1]), [decimal.Decimal(1), '1'])
+
     @mock.patch('dbt.adapters.postgres.connections.psycopg2')
     def test_search_path(self, psycopg2):
         self.config.credentials = self.config.credentials.replace(search_path="test")
@@ -326,6 +354,251 @@ class TestPostgresAdapter(unittest.TestCase):
         )
         self.assertEqual(exceptions, [])
 
+    @mock.patch.object(PostgresAdapter, 'execute_macro')
+    @mock.patch.object(PostgresAdapter, '_get_catalog_schemas')
+    def test_get_catalog_columnar(self, mock_get_schemas, mock_execute):
+        column_names = ['table_database', 'table_schema', 'table_name', 'column_index']
+        results = []
+        for rows in ([('dbt', 'foo', 'bar', 1), ('dbt', 'skip', 'bar', 1)],
+                     [('dbt', 'quux', 'bar', 1), ('dbt', None, 'bar', 2)]):
+            result = agate_helper.ColumnarResult(column_names, [None, None, None, agate_helper.NUMBER_TYPE])
+            result.extend(rows)
+            results.append(result)
+        mock_execute.side_effect = results
+
+        mock_get_schemas.return_value.items.return_value = [
+            (mock.MagicMock(database='dbt'), {'foo'}),
+            (mock.MagicMock(database='dbt'), {'quux'}),
+        ]
+
+        mock_manifest = mock.MagicMock()
+        mock_manifest.get_used_schemas.return_value = {('dbt', 'foo'),
+                                                       ('dbt', 'quux')}
+
+        catalog, exceptions = self.adapter.get_catalog(mock_manifest)
+        self.assertIsInstance(catalog, agate_helper.ColumnarResult)
+        self.assertEqual(
+            set(catalog.typed_rows()),
+            {('dbt', 'foo', 'bar', decimal.Decimal(1)), ('dbt', 'quux', 'bar', decimal.Decimal(1))}
+        )
+        self.assertIs(catalog.column_types[1], agate_helper.TEXT_TYPE)
+        self.assertEqual(exceptions, [])
+
+    @mock.patch.object(PostgresAdapter, 'execute_macro')
+    @mock.patch.object(PostgresAdapter, '_get_catalog_schemas')
+    def test_iter_catalogs(self, mock_get_schemas, mock_execute):
+        column_names = ['table_database', 'table_schema', 'table_name']
+        result = agate_helper.ColumnarResult(column_names)
+        result.extend([('dbt', 'foo', 'bar')])
+        mock_execute.side_effect = [result, DatabaseError('no catalog')]
+        mock_get_schemas.return_value.items.return_value = [
+            (mock.MagicMock(database='dbt'), {'foo'}),
+            (mock.MagicMock(database='other'), {'foo'}),
+        ]
+        mock_manifest = mock.MagicMock()
+        mock_manifest.get_used_schemas.return_value = {('dbt', 'foo')}
+
+        exceptions = []
+        with mock.patch.object(flags, 'WARN_ERROR', False):
+            catalogs = list(self.adapter.iter_catalogs(mock_manifest, exceptions))
+        self.assertEqual(len(catalogs), 1)
+        self.assertEqual(list(catalogs[0]), [('dbt', 'foo', 'bar')])
+        self.assertEqual(len(exceptions), 1)
+        self.assertIsInstance(exceptions[0], DatabaseError)
+
+    def test_iter_catalogs_get_catalog_override(self):
+        catalog = agate.Table([], ['table_database'])
+        exception = Exception('no catalog')
+        with mock.patch.object(
+            PostgresAdapter, 'get_catalog', return_value=(catalog, [exception])
+        ):
+            exceptions = []
+            catalogs = list(self.adapter.iter_catalogs(mock.MagicMock(), exceptions))
+        self.assertEqual(catalogs, [catalog])
+        self.assertEqual(exceptions, [exception])
+
+
+class TestConnectionPool(unittest.TestCase):
+    def test_take(self):
+        pool = ConnectionPool(max_size=3, max_idle=300)
+        first, second, third = mock_connection('a'), mock_connection('b'), mock_connection('c')
+        self.assertTrue(pool.put('thread_1', first))
+        self.assertTrue(pool.put('thread_2', second))
+        self.assertTrue(pool.put('thread_2', third))
+        self.assertFalse(pool.put('thread_3', mock_connection('d')))
+        # a thread gets its own most recent connection, then the most recent one
+        self.assertIs(pool.take('thread_1'), first)
+        self.assertIs(pool.take('thread_1'), third)
+        self.assertIs(pool.take('thread_2'), second)
+        self.assertIsNone(pool.take('thread_2'))
+
+    def test_expire(self):
+        pool = ConnectionPool(max_size=3, max_idle=60)
+        with mock.patch('dbt.adapters.base.connections.time.monotonic') as monotonic:
+            monotonic.return_value = 1000
+            old = mock_connection('old')
+            pool.put('thread_1', old)
+            monotonic.return_value = 1050
+            new = mock_connection('new')
+            pool.put('thread_1', new)
+            monotonic.return_value = 1070
+            self.assertEqual(pool.expire(), [old])
+            self.assertEqual(pool.drain(), [new])
+        self.assertEqual(pool.discarded, 1)
+
+
+class TestPostgresConnectionPool(unittest.TestCase):
+    def setUp(self):
+        flags.CONNECTION_POOL_SIZE = 2
+        flags.CONNECTION_POOL_MAX_IDLE = 300
+        project_cfg = {
+            'name': 'X',
+            'version': '0.1',
+            'profile': 'test',
+            'project-root': '/tmp/dbt/does-not-exist',
+            'config-version': 2,
+        }
+        profile_cfg = {
+            'outputs': {
+                'test': {
+                    'type': 'postgres',
+                    'dbname': 'postgres',
+                    'user': 'root',
+                    'host': 'thishostshouldnotexist',
+                    'pass': 'password',
+                    'port': 5432,
+                    'schema': 'public',
+                    'role': 'transformer',
+                }
+            },
+            'target': 'test'
+        }
+        self.config = config_from_parts_or_dicts(project_cfg, profile_cfg)
+        self.adapter = PostgresAdapter(self.config)
+        inject_adapter(self.adapter, PostgresPlugin)
+
+        patcher = mock.patch('dbt.adapters.postgres.connections.psycopg2')
+        self.psycopg2 = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.psycopg2.connect.side_effect = lambda **kwargs: mock.MagicMock(closed=0)
+
+    def tearDown(self):
+        flags.CONNECTION_POOL_SIZE = 0
+        flags.CONNECTION_POOL_MAX_IDLE = 300
+
+    def use_connection(self, name):
+        with self.adapter.connection_named(name):
+            return self.adapter.connections.get_thread_connection().handle
+
+    def use_connection_in_thread(self, name):
+        handles = []
+        thread = threading.Thread(target=lambda: handles.append(self.use_connection(name)))
+        thread.start()
+        thread.join()
+        return handles[0]
+
+    def test_disabled(self):
+        flags.CONNECTION_POOL_SIZE = 0
+        self.adapter = PostgresAdapter(self.config)
+        first = self.use_connection('model_a')
+        second = self.use_connection('model_b')
+        self.assertIsNot(first, second)
+        first.close.assert_called_once()
+        self.assertEqual(self.psycopg2.connect.call_count, 2)
+
+    def test_reuse(self):
+        first = self.use_connection('model_a')
+        first.close.assert_not_called()
+        # the session was discarded outside of a transaction, and the role set again
+        first.cursor().execute.assert_has_calls([
+            mock.call('discard all'),
+            mock.call('set role transformer'),
+        ])
+        self.assertIs(first.autocommit, False)
+        second = self.use_connection('model_b')
+        self.assertIs(first, second)
+        self.assertEqual(self.psycopg2.connect.call_count, 1)
+        # and the health check ran
+        first.cursor().execute.assert_any_call('select 1')
+        # and another thread gets it as well
+        self.assertIs(self.use_connection_in_thread('model_c'), first)
+        self.assertEqual(self.psycopg2.connect.call_count, 1)
+        self.assertEqual((self.adapter.connections.pool.hits, self.adapter.connections.pool.misses), (2, 1))
+
+    def test_rolls_back_open_transaction(self):
+        with self.adapter.connection_named('model_a'):
+            connection = self.adapter.connections.get_thread_connection()
+            handle = connection.handle
+            connection.transaction_open = True
+        handle.rollback.assert_called()
+        self.assertFalse(connection.transaction_open)
+        self.assertIs(self.use_connection('model_b'), handle)
+
+    def test_unhealthy_connection_closed(self):
+        first = self.use_connection('model_a')
+        first.closed = 1
+        second = self.use_connection('model_b')
+        self.assertIsNot(first, second)
+        first.close.assert_called_once()
+        self.assertEqual(self.adapter.connections.pool.discarded, 1)
+
+    def test_failed_reset_closes(self):
+        with self.adapter.connection_named('model_a'):
+            handle = self.adapter.connections.get_thread_connection().handle
+            handle.rollback.side_effect = Exception('connection lost')
+        handle.close.assert_called_once()
+        self.assertEqual(self.adapter.connections.pool.idle, [])
+
+    def test_no_reset_closes(self):
+        # adapters that can't reset a session don't pool their connections
+        with mock.patch.object(
+            PostgresConnectionManager, '_reset_handle', BaseConnectionManager._reset_handle
+        ):
+            first = self.use_connection('model_a')
+            second = self.use_connection('model_b')
+        self.assertIsNot(first, second)
+        first.close.assert_called_once()
+        self.assertEqual(self.adapter.connections.pool.idle, [])
+
+    def test_max_idle(self):
+        with mock.patch('dbt.adapters.base.connections.time.monotonic') as monotonic:
+            monotonic.return_value = 1000
+            first = self.use_connection('model_a')
+            monotonic.return_value = 1301
+            second = self.use_connection('model_b')
+        self.assertIsNot(first, second)
+        first.close.assert_called_once()
+
+    def test_full_pool_closes(self):
+        flags.CONNECTION_POOL_SIZE = 1
+        self.adapter = PostgresAdapter(self.config)
+        held = threading.Event()
+        release = threading.Event()
+        handles = []
+
+        def hold_connection():
+            with self.adapter.connection_named('model_b'):
+                handles.append(self.adapter.connections.get_thread_connection().handle)
+                held.set()
+                release.wait()
+
+        thread = threading.Thread(target=hold_connection)
+        thread.start()
+        held.wait()
+        first = self.use_connection('model_a')
+        release.set()
+        thread.join()
+        first.close.assert_not_called()
+        handles[0].close.assert_called_once()
+
+    def test_cleanup(self):
+        handle = self.use_connection('model_a')
+        with mock.patch('dbt.adapters.base.connections.fire_event') as fire_event:
+            self.adapter.cleanup_connections()
+        handle.close.assert_called_once()
+        self.assertEqual(self.adapter.connections.pool.idle, [])
+        fire_event.assert_any_call(ConnectionPoolStats(hits=0, misses=1, discarded=0))
+
 
 class TestConnectingPostgresAdapter(unittest.TestCase):
     def setUp(self):
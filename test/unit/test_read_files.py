@@ -0,0 +1,87 @@
+import os
+import shutil
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from dbt.contracts.files import ParseFileType, FilePath, FileHash
+from dbt.contracts.graph.manifest import Manifest
+from dbt.parser import read_files
+from dbt.parser.read_files import (
+    get_source_files,
+    load_source_file,
+    load_source_file_contents,
+)
+
+
+class TestSkipUnchangedFiles(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.tmpdir, 'models'))
+        self.model_path = os.path.join(self.tmpdir, 'models', 'my_model.sql')
+        with open(self.model_path, 'w') as fp:
+            fp.write('select 1 as id\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def get_path(self):
+        stat_result = os.stat(self.model_path)
+        return FilePath(
+            project_root=self.tmpdir,
+            searched_path='models',
+            relative_path='my_model.sql',
+            modification_time=stat_result.st_mtime,
+            file_size=stat_result.st_size,
+        )
+
+    def get_saved_files(self):
+        source_file = load_source_file(self.get_path(), ParseFileType.Model, 'my_test', {})
+        # as saved in, and read back from, the partial parse file
+        manifest = Manifest(files={source_file.file_id: source_file})
+        return Manifest.from_msgpack(manifest.to_msgpack()).files
+
+    def test_unchanged_file_is_not_read(self):
+        saved_files = self.get_saved_files()
+        with mock.patch('dbt.parser.read_files.load_file_contents') as load_file_contents:
+            source_file = load_source_file(self.get_path(), ParseFileType.Model, 'my_test', saved_files)
+        load_file_contents.assert_not_called()
+        self.assertEqual(source_file.checksum, FileHash.from_contents('select 1 as id\n'))
+        self.assertIsNone(source_file.contents)
+
+        # if it needs to be parsed after all, it's read then
+        load_source_file_contents(source_file)
+        self.assertEqual(source_file.contents, 'select 1 as id')
+
+    def test_changed_file_is_read(self):
+        saved_files = self.get_saved_files()
+        with open(self.model_path, 'w') as fp:
+            fp.write('select 2 as id, 3 as other_id\n')
+        source_file = load_source_file(self.get_path(), ParseFileType.Model, 'my_test', saved_files)
+        self.assertEqual(source_file.contents, 'select 2 as id, 3 as other_id')
+        self.assertEqual(
+            source_file.checksum, FileHash.from_contents('select 2 as id, 3 as other_id\n')
+        )
+
+    def test_read_with_executor(self):
+        for name in ('b_model', 'c_model', 'a_model'):
+            with open(os.path.join(self.tmpdir, 'models', f'{name}.sql'), 'w') as fp:
+                fp.write(f'select 1 as {name}\n')
+        saved_files = self.get_saved_files()
+        project = mock.MagicMock(project_root=self.tmpdir, project_name='my_test')
+
+        serial = get_source_files(project, ['models'], '.sql', ParseFileType.Model, saved_files)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            with mock.patch(
+                'dbt.parser.read_files.read_and_hash', wraps=read_files.read_and_hash
+            ) as read_and_hash:
+                threaded = get_source_files(
+                    project, ['models'], '.sql', ParseFileType.Model, saved_files, executor
+                )
+        # the unchanged file is not read, and the files come out in the same order
+        self.assertEqual(read_and_hash.call_count, 3)
+        self.assertEqual([f.file_id for f in threaded], [f.file_id for f in serial])
+        self.assertEqual([f.checksum for f in threaded], [f.checksum for f in serial])
+        self.assertEqual([f.contents for f in threaded], [f.contents for f in serial])
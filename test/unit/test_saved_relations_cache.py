@@ -0,0 +1,108 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from dbt import flags
+from dbt.adapters.base.impl import RELATIONS_CACHE_FILE_NAME
+from dbt.adapters.base.relation import BaseRelation
+
+from .mock_adapter import adapter_factory
+
+
+def make_relation(schema, identifier=''):
+    return BaseRelation.create(database='db', schema=schema, identifier=identifier)
+
+
+class TestSavedRelationsCache(unittest.TestCase):
+
+    def setUp(self):
+        self.target_path = tempfile.mkdtemp()
+        flags.RELATIONS_CACHE_TTL = 3600
+        self.schemas = {
+            'one': [make_relation('one', 'a'), make_relation('one', 'b')],
+            'two': [make_relation('two', 'c')],
+        }
+
+    def tearDown(self):
+        flags.RELATIONS_CACHE_TTL = 0
+        shutil.rmtree(self.target_path)
+
+    def get_adapter(self, host='localhost'):
+        config = mock.MagicMock(target_path=self.target_path)
+        config.credentials.connection_info.return_value = [('host', host)]
+        adapter = adapter_factory()(config)
+        adapter.responder = mock.MagicMock()
+        adapter.responder.list_relations_without_caching.side_effect = (
+            lambda schema_relation: self.schemas[schema_relation.schema]
+        )
+        adapter._get_cache_schemas = mock.MagicMock(
+            return_value={make_relation(schema).without_identifier() for schema in self.schemas}
+        )
+        return adapter
+
+    def fill_and_save(self, adapter):
+        adapter.set_relations_cache(mock.MagicMock())
+        adapter.save_relations_cache()
+
+    def listed_schemas(self, adapter):
+        return sorted(
+            call[0][0].schema
+            for call in adapter.responder.list_relations_without_caching.call_args_list
+        )
+
+    def test_reuse_saved_schemas(self):
+        self.fill_and_save(self.get_adapter())
+
+        adapter = self.get_adapter()
+        adapter.set_relations_cache(mock.MagicMock())
+        self.assertEqual(self.listed_schemas(adapter), [])
+        self.assertEqual(
+            {r.identifier for r in adapter.cache.get_relations('db', 'one')}, {'a', 'b'}
+        )
+        self.assertIn(('db', 'two'), adapter.cache)
+        # the file is removed once read, and saved again at the end
+        self.assertFalse(os.path.exists(os.path.join(self.target_path, RELATIONS_CACHE_FILE_NAME)))
+        adapter.save_relations_cache()
+        self.assertTrue(os.path.exists(os.path.join(self.target_path, RELATIONS_CACHE_FILE_NAME)))
+
+    def test_changed_schema_listed_again(self):
+        adapter = self.get_adapter()
+        adapter.set_relations_cache(mock.MagicMock())
+        adapter.cache_added(make_relation('two', 'd'))
+        adapter.save_relations_cache()
+
+        adapter = self.get_adapter()
+        adapter.set_relations_cache(mock.MagicMock())
+        self.assertEqual(self.listed_schemas(adapter), ['two'])
+
+    def test_expired_schema_listed_again(self):
+        adapter = self.get_adapter()
+        with mock.patch('time.time', return_value=time.time() - 7200):
+            adapter.set_relations_cache(mock.MagicMock())
+        adapter.save_relations_cache()
+
+        adapter = self.get_adapter()
+        adapter.set_relations_cache(mock.MagicMock())
+        self.assertEqual(self.listed_schemas(adapter), ['one', 'two'])
+
+    def test_other_target_not_reused(self):
+        self.fill_and_save(self.get_adapter())
+
+        adapter = self.get_adapter(host='elsewhere')
+        adapter.set_relations_cache(mock.MagicMock())
+        self.assertEqual(self.listed_schemas(adapter), ['one', 'two'])
+
+    def test_invalid_file_ignored(self):
+        with open(os.path.join(self.target_path, RELATIONS_CACHE_FILE_NAME), 'w') as fp:
+            fp.write('{not json')
+        adapter = self.get_adapter()
+        adapter.set_relations_cache(mock.MagicMock())
+        self.assertEqual(self.listed_schemas(adapter), ['one', 'two'])
+
+    def test_disabled(self):
+        flags.RELATIONS_CACHE_TTL = 0
+        self.fill_and_save(self.get_adapter())
+        self.assertFalse(os.path.exists(os.path.join(self.target_path, RELATIONS_CACHE_FILE_NAME)))
@@ -158,6 +158,7 @@ class TestFindMatching(unittest.TestCase):
                 'absolute_path': named_file.name,
                 'relative_path': os.path.basename(named_file.name),
                 'modification_time': out[0]['modification_time'],
+                'file_size': 0,
             }]
             self.assertEqual(out, expected_output)
 
@@ -173,6 +174,7 @@ class TestFindMatching(unittest.TestCase):
                 'absolute_path': named_file.name,
                 'relative_path': os.path.basename(named_file.name),
                 'modification_time': out[0]['modification_time'],
+                'file_size': 0,
             }]
             self.assertEqual(out, expected_output)
 